@@ -1045,6 +1045,49 @@ function registerStoryCommands(resource: Command, getContext: ContextFactory): v
     );
 }
 
+const WORK_ITEM_KEY_PATTERN = /^[A-Za-z][A-Za-z0-9]*-\d+$/;
+
+function registerWorkItemCommands(program: Command, getContext: ContextFactory): void {
+  const resource = program
+    .command("work-item")
+    .description("work-item operations")
+    .showHelpAfterError();
+
+  resource
+    .command("show")
+    .description("Show work items with parent, labels, assignments and child counts")
+    .argument("<refs...>", "work item keys (e.g. MC-12) or UUIDs; several refs use one batch call")
+    .addHelpText(
+      "after",
+      "\nExamples:\n" +
+        "  mc work-item show MC-12\n" +
+        "  mc work-item show <uuid>\n" +
+        "  mc work-item show MC-12 MC-40 MC-41",
+    )
+    .action(async (refs: string[], _opts: unknown, command: Command) => {
+      const ctx = getContext(command);
+      const basePath = PLANNING_RESOURCES["work-item"].listPath({});
+      const keyRefs = refs.filter((ref) => WORK_ITEM_KEY_PATTERN.test(ref));
+
+      if (refs.length === 1) {
+        const [ref] = refs;
+        const path =
+          keyRefs.length === 1
+            ? `${basePath}/by-key/${encodeURIComponent(ref)}`
+            : `${basePath}/${encodeURIComponent(ref)}`;
+        printPayload(await ctx.client.get(path), ctx.config.output);
+        return;
+      }
+
+      if (keyRefs.length !== 0 && keyRefs.length !== refs.length) {
+        throw new CliUsageError("Pass either work item keys or UUIDs, not a mix of both.");
+      }
+      const body = keyRefs.length ? { keys: refs } : { ids: refs };
+      const payload = await ctx.client.post(`${basePath}/batch`, { body });
+      printPayload(payload, ctx.config.output);
+    });
+}
+
 export function registerPlanningCommands(program: Command, getContext: ContextFactory): void {
   const order: PlanningResourceName[] = [
     "project",
@@ -1089,4 +1132,6 @@ export function registerPlanningCommands(program: Command, getContext: ContextFa
       registerLabelCommands(resource, getContext);
     }
   }
+
+  registerWorkItemCommands(program, getContext);
 }
@@ -0,0 +1,124 @@
+import assert from "node:assert/strict";
+import test from "node:test";
+
+import { Command } from "commander";
+
+import type { RuntimeConfig } from "../../core/config";
+import { CliUsageError } from "../../core/errors";
+import type { ApiClient, RequestOptions } from "../../core/http";
+import { registerPlanningCommands } from "./commands";
+
+type HttpMethod = "GET" | "POST" | "PATCH" | "DELETE";
+
+interface ClientCall {
+  method: HttpMethod;
+  path: string;
+  options: RequestOptions | undefined;
+}
+
+class FakeApiClient {
+  readonly calls: ClientCall[] = [];
+
+  async get(path: string, options?: RequestOptions): Promise<unknown> {
+    this.calls.push({ method: "GET", path, options });
+    return { data: { id: "wi-1", key: "MC-12" }, meta: {} };
+  }
+
+  async post(path: string, options?: RequestOptions): Promise<unknown> {
+    this.calls.push({ method: "POST", path, options });
+    return { data: { id: "stub" }, meta: {} };
+  }
+
+  async patch(path: string, options?: RequestOptions): Promise<unknown> {
+    this.calls.push({ method: "PATCH", path, options });
+    return { data: { id: "stub" }, meta: {} };
+  }
+
+  async delete(path: string, options?: RequestOptions): Promise<unknown> {
+    this.calls.push({ method: "DELETE", path, options });
+    return { data: null, meta: {} };
+  }
+}
+
+const TEST_CONFIG: RuntimeConfig = {
+  apiBaseUrl: "http://127.0.0.1:5000",
+  output: "json",
+  timeoutMs: 30_000,
+};
+
+function createProgram(client: FakeApiClient): Command {
+  const program = new Command();
+  program.name("mc").exitOverride();
+  registerPlanningCommands(program, () => ({
+    config: TEST_CONFIG,
+    client: client as unknown as ApiClient,
+  }));
+  return program;
+}
+
+async function run(program: Command, args: string[]): Promise<string> {
+  const lines: string[] = [];
+  const originalLog = console.log;
+  console.log = (...items: unknown[]) => {
+    lines.push(items.map((item) => String(item)).join(" "));
+  };
+  try {
+    await program.parseAsync(["node", "mc", ...args], { from: "node" });
+    return lines.join("\n");
+  } finally {
+    console.log = originalLog;
+  }
+}
+
+test("work-item show resolves a key through the by-key endpoint", async () => {
+  const client = new FakeApiClient();
+  const program = createProgram(client);
+
+  await run(program, ["work-item", "show", "MC-12"]);
+
+  assert.deepEqual(client.calls, [
+    { method: "GET", path: "/v1/planning/work-items/by-key/MC-12", options: undefined },
+  ]);
+});
+
+test("work-item show fetches a UUID by id", async () => {
+  const client = new FakeApiClient();
+  const program = createProgram(client);
+  const id = "0f6e4c2a-9d1b-4a8e-b3f7-2c5d8e1a6b90";
+
+  const output = await run(program, ["work-item", "show", id]);
+
+  assert.deepEqual(client.calls, [
+    { method: "GET", path: `/v1/planning/work-items/${id}`, options: undefined },
+  ]);
+  assert.match(output, /MC-12/);
+});
+
+test("work-item show resolves several refs with one batch call", async () => {
+  const client = new FakeApiClient();
+  const program = createProgram(client);
+
+  await run(program, ["work-item", "show", "MC-12", "MC-40", "mc-41"]);
+
+  assert.deepEqual(client.calls, [
+    {
+      method: "POST",
+      path: "/v1/planning/work-items/batch",
+      options: { body: { keys: ["MC-12", "MC-40", "mc-41"] } },
+    },
+  ]);
+});
+
+test("work-item show rejects mixing keys and UUIDs", async () => {
+  const client = new FakeApiClient();
+  const program = createProgram(client);
+
+  await assert.rejects(
+    run(program, ["work-item", "show", "MC-12", "0f6e4c2a-9d1b-4a8e-b3f7-2c5d8e1a6b90"]),
+    (error: unknown) => {
+      assert.ok(error instanceof CliUsageError);
+      return true;
+    },
+  );
+  assert.deepEqual(client.calls, []);
+});
@@ -51,16 +51,39 @@ export async function fetchImportStatus(): Promise<ImportStatusInfo | null> {
   return (await response.json()) as ImportStatusInfo;
 }
 
-/** Trigger a Langfuse import. Throws on failure. */
+const IMPORT_POLL_INTERVAL_MS = 2000;
+const IMPORT_POLL_TIMEOUT_MS = 30 * 60 * 1000;
+
+/**
+ * Trigger a Langfuse import and wait for the background job to finish.
+ * The API returns the new import id immediately; progress is polled via
+ * the import status endpoint. Throws on failure.
+ */
 export async function triggerImport(): Promise<void> {
   const response = await fetch(apiUrl("/v1/observability/imports"), {
     method: "POST",
   });
   if (!response.ok) {
     const body = await response.json().catch(() => ({}));
-    const envelope = body as { error?: string };
-    throw new Error(envelope.error ?? `HTTP ${response.status}`);
+    const envelope = body as { error?: { message?: string } };
+    throw new Error(envelope.error?.message ?? `HTTP ${response.status}`);
+  }
+  const { data } = (await response.json()) as { data: { id: number } };
+
+  const deadline = Date.now() + IMPORT_POLL_TIMEOUT_MS;
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, IMPORT_POLL_INTERVAL_MS));
+    const status = await fetchImportStatus();
+    const lastImport = status?.lastImport;
+    if (!lastImport || lastImport.id !== data.id || lastImport.status === "running") {
+      continue;
+    }
+    if (lastImport.status === "failed") {
+      throw new Error(lastImport.error_message ?? "Import failed");
+    }
+    return;
   }
+  throw new Error("Import is still running — check the import status later");
 }
 
 /** Fetch available model names for the request filter dropdown. */
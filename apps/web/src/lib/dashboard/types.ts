@@ -66,6 +66,9 @@ export interface ImportStatusInfo {
     to_timestamp: string;
     status: "running" | "success" | "failed";
     error_message: string | null;
+    checkpoint_start_time?: string | null;
+    pages_imported?: number;
+    requests_imported?: number;
   } | null;
   lastStatus: "running" | "success" | "failed" | null;
   counts: { metrics: number; requests: number };
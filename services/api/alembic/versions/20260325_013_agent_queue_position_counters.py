@@ -0,0 +1,72 @@
+"""Allocate agent queue positions from a per-agent counter row.
+
+Enqueue previously computed queue_position as MAX(queue_position)+1 over
+the agent's QUEUED rows. Concurrent enqueues could read the same MAX and
+produce duplicate positions, and the scan grew with the queue. Positions
+now come from control_plane_agent_queue_counters (same pattern as
+project_counters), seeded from the highest position already used per agent.
+
+Also adds a partial FIFO index on (agent_id, queue_position, id) for
+QUEUED rows so oldest-queued selection is a single index probe.
+"""
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+revision = "20260325_013"
+down_revision = "20260324_012"
+branch_labels = None
+depends_on = None
+
+QUEUE_TABLE = "control_plane_agent_queue"
+COUNTERS_TABLE = "control_plane_agent_queue_counters"
+FIFO_INDEX = "idx_cp_agent_queue_agent_queued_fifo"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = inspector.get_table_names()
+
+    if COUNTERS_TABLE not in existing_tables:
+        conn.execute(
+            text(f"""
+            CREATE TABLE {COUNTERS_TABLE} (
+                agent_id TEXT PRIMARY KEY,
+                last_position INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL
+            )
+            """)
+        )
+
+    if QUEUE_TABLE not in existing_tables:
+        return
+
+    conn.execute(
+        text(f"""
+        INSERT INTO {COUNTERS_TABLE} (agent_id, last_position, updated_at)
+        SELECT agent_id, MAX(queue_position), MAX(updated_at)
+          FROM {QUEUE_TABLE}
+         GROUP BY agent_id
+        ON CONFLICT (agent_id) DO UPDATE
+           SET last_position = GREATEST(
+               {COUNTERS_TABLE}.last_position, EXCLUDED.last_position
+           )
+        """)
+    )
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes(QUEUE_TABLE)}
+    if FIFO_INDEX not in existing_indexes:
+        conn.execute(
+            text(f"""
+            CREATE INDEX {FIFO_INDEX}
+                ON {QUEUE_TABLE} (agent_id, queue_position, id)
+                WHERE status = 'QUEUED'
+            """)
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text(f"DROP INDEX IF EXISTS {FIFO_INDEX}"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {COUNTERS_TABLE}"))
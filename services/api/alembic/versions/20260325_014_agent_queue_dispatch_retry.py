@@ -0,0 +1,51 @@
+"""Track dispatch attempts and backoff on control_plane_agent_queue.
+
+Adds dispatch_attempts (failed send count) and next_attempt_at (earliest
+time the dispatch retry scheduler may re-drive a QUEUED entry), plus a
+partial index over due retries.
+"""
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+revision = "20260325_014"
+down_revision = "20260325_013"
+branch_labels = None
+depends_on = None
+
+TABLE = "control_plane_agent_queue"
+RETRY_INDEX = "idx_cp_agent_queue_retry_due"
+NEW_COLUMNS = [
+    ("dispatch_attempts", "INTEGER NOT NULL DEFAULT 0"),
+    ("next_attempt_at", "TEXT"),
+]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    if TABLE not in inspector.get_table_names():
+        return
+
+    existing_cols = {col["name"] for col in inspector.get_columns(TABLE)}
+    for col_name, col_type in NEW_COLUMNS:
+        if col_name not in existing_cols:
+            conn.execute(text(f"ALTER TABLE {TABLE} ADD COLUMN {col_name} {col_type}"))
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes(TABLE)}
+    if RETRY_INDEX not in existing_indexes:
+        conn.execute(
+            text(f"""
+            CREATE INDEX {RETRY_INDEX}
+                ON {TABLE} (next_attempt_at, agent_id)
+                WHERE status = 'QUEUED' AND next_attempt_at IS NOT NULL
+            """)
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text(f"DROP INDEX IF EXISTS {RETRY_INDEX}"))
+    for col_name, _ in NEW_COLUMNS:
+        conn.execute(text(f"ALTER TABLE {TABLE} DROP COLUMN IF EXISTS {col_name}"))
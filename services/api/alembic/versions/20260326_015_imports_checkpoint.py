@@ -0,0 +1,42 @@
+"""Checkpoint Langfuse import progress on the imports row.
+
+checkpoint_cursor is the Langfuse pagination cursor of the next page to
+fetch and checkpoint_start_time the highest observation startTime
+persisted so far; both are written after every page so a failed or
+interrupted run can be resumed.
+"""
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+revision = "20260326_015"
+down_revision = "20260325_014"
+branch_labels = None
+depends_on = None
+
+TABLE = "imports"
+NEW_COLUMNS = [
+    ("checkpoint_cursor", "TEXT"),
+    ("checkpoint_start_time", "TEXT"),
+    ("pages_imported", "INTEGER NOT NULL DEFAULT 0"),
+    ("requests_imported", "INTEGER NOT NULL DEFAULT 0"),
+]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+
+    if TABLE not in inspector.get_table_names():
+        return
+
+    existing_cols = {col["name"] for col in inspector.get_columns(TABLE)}
+    for col_name, col_type in NEW_COLUMNS:
+        if col_name not in existing_cols:
+            conn.execute(text(f"ALTER TABLE {TABLE} ADD COLUMN {col_name} {col_type}"))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for col_name, _ in NEW_COLUMNS:
+        conn.execute(text(f"ALTER TABLE {TABLE} DROP COLUMN IF EXISTS {col_name}"))
@@ -0,0 +1,63 @@
+"""Hourly cost rollups over langfuse_requests.
+
+langfuse_hourly_costs holds per-hour (``YYYY-MM-DDTHH`` prefix of
+started_at, UTC), per-model token and cost totals. The importer refreshes
+the buckets a page touches in the same transaction as the page itself, so
+cost queries read a few hundred rollup rows instead of grouping raw
+requests. Existing requests are backfilled here.
+"""
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+revision = "20260326_016"
+down_revision = "20260326_015"
+branch_labels = None
+depends_on = None
+
+TABLE = "langfuse_hourly_costs"
+REQUESTS_TABLE = "langfuse_requests"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    existing_tables = inspect(conn).get_table_names()
+
+    if TABLE in existing_tables:
+        return
+
+    conn.execute(
+        text(f"""
+        CREATE TABLE {TABLE} (
+            hour TEXT NOT NULL,
+            model TEXT NOT NULL,
+            input_tokens INTEGER NOT NULL DEFAULT 0,
+            output_tokens INTEGER NOT NULL DEFAULT 0,
+            total_tokens INTEGER NOT NULL DEFAULT 0,
+            request_count INTEGER NOT NULL DEFAULT 0,
+            total_cost REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (hour, model)
+        )
+        """)
+    )
+
+    if REQUESTS_TABLE not in existing_tables:
+        return
+
+    conn.execute(
+        text(f"""
+        INSERT INTO {TABLE}
+            (hour, model, input_tokens, output_tokens, total_tokens, request_count, total_cost)
+        SELECT substr(started_at, 1, 13), model,
+               SUM(input_tokens), SUM(output_tokens), SUM(total_tokens),
+               COUNT(*), COALESCE(SUM(cost), 0)
+          FROM {REQUESTS_TABLE}
+         WHERE model IS NOT NULL AND started_at IS NOT NULL
+         GROUP BY substr(started_at, 1, 13), model
+        """)
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
@@ -0,0 +1,55 @@
+"""Index langfuse_requests scan paths and add the langfuse_models dimension.
+
+The requests list filters by model and started_at and orders by
+started_at DESC; both shapes now have a matching index. The models
+dropdown reads langfuse_models (one row per distinct model, maintained by
+the importer) instead of SELECT DISTINCT over the fact table. Existing
+models are backfilled here.
+"""
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+revision = "20260326_017"
+down_revision = "20260326_016"
+branch_labels = None
+depends_on = None
+
+REQUESTS_TABLE = "langfuse_requests"
+MODELS_TABLE = "langfuse_models"
+INDEXES = [
+    ("idx_langfuse_requests_started_at", "(started_at DESC)"),
+    ("idx_langfuse_requests_model_started_at", "(model, started_at DESC)"),
+]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = inspector.get_table_names()
+
+    if MODELS_TABLE not in existing_tables:
+        conn.execute(text(f"CREATE TABLE {MODELS_TABLE} (model TEXT PRIMARY KEY)"))
+
+    if REQUESTS_TABLE not in existing_tables:
+        return
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes(REQUESTS_TABLE)}
+    for index_name, columns in INDEXES:
+        if index_name not in existing_indexes:
+            conn.execute(text(f"CREATE INDEX {index_name} ON {REQUESTS_TABLE} {columns}"))
+
+    conn.execute(
+        text(f"""
+        INSERT INTO {MODELS_TABLE} (model)
+        SELECT DISTINCT model FROM {REQUESTS_TABLE} WHERE model IS NOT NULL
+        ON CONFLICT (model) DO NOTHING
+        """)
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for index_name, _ in INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {MODELS_TABLE}"))
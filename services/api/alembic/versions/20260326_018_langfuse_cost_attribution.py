@@ -0,0 +1,76 @@
+"""Link Langfuse traces to control-plane runs and attribute their cost.
+
+langfuse_trace_links maps a trace to the run / correlation id it belongs
+to, resolved to the dispatching agent and work item. Links come from
+observation metadata during import or from the explicit link endpoint.
+langfuse_cost_attribution keeps per-run, per-agent and per-work-item
+totals over linked requests, updated by delta whenever requests or links
+change. Both start empty: existing requests carry no link metadata.
+"""
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+revision = "20260326_018"
+down_revision = "20260326_017"
+branch_labels = None
+depends_on = None
+
+REQUESTS_TABLE = "langfuse_requests"
+LINKS_TABLE = "langfuse_trace_links"
+ATTRIBUTION_TABLE = "langfuse_cost_attribution"
+TRACE_INDEX = "idx_langfuse_requests_trace_id"
+LABEL_INDEX = "idx_langfuse_cost_attribution_scope_label"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    existing_tables = inspector.get_table_names()
+
+    if LINKS_TABLE not in existing_tables:
+        conn.execute(
+            text(f"""
+            CREATE TABLE {LINKS_TABLE} (
+                trace_id TEXT PRIMARY KEY,
+                run_id TEXT,
+                correlation_id TEXT,
+                agent_id TEXT,
+                work_item_id TEXT,
+                work_item_key TEXT,
+                linked_at TEXT NOT NULL
+            )
+            """)
+        )
+
+    if ATTRIBUTION_TABLE not in existing_tables:
+        conn.execute(
+            text(f"""
+            CREATE TABLE {ATTRIBUTION_TABLE} (
+                scope TEXT NOT NULL,
+                scope_id TEXT NOT NULL,
+                label TEXT,
+                input_tokens INTEGER NOT NULL DEFAULT 0,
+                output_tokens INTEGER NOT NULL DEFAULT 0,
+                total_tokens INTEGER NOT NULL DEFAULT 0,
+                request_count INTEGER NOT NULL DEFAULT 0,
+                total_cost DOUBLE PRECISION NOT NULL DEFAULT 0,
+                PRIMARY KEY (scope, scope_id)
+            )
+            """)
+        )
+        conn.execute(text(f"CREATE INDEX {LABEL_INDEX} ON {ATTRIBUTION_TABLE} (scope, label)"))
+
+    if REQUESTS_TABLE not in existing_tables:
+        return
+
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes(REQUESTS_TABLE)}
+    if TRACE_INDEX not in existing_indexes:
+        conn.execute(text(f"CREATE INDEX {TRACE_INDEX} ON {REQUESTS_TABLE} (trace_id)"))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text(f"DROP INDEX IF EXISTS {TRACE_INDEX}"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {ATTRIBUTION_TABLE}"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {LINKS_TABLE}"))
@@ -0,0 +1,182 @@
+"""Per-project change counters for conditional planning reads.
+
+planning_change_counters holds one monotonically increasing version per
+scope: a project id, or '' for project-less rows and agents. AFTER statement
+triggers on every table that feeds the planning read endpoints collect the
+affected scopes from the statement's transition tables and bump each one
+once, in the writing transaction, so a version only becomes visible together
+with the data that changed it. Read endpoints derive their ETag from these
+versions before running any heavy query.
+
+Scopes are bumped in sorted order so concurrent writers touching the same
+projects take the counter row locks in the same order. Agent updates only
+bump when a field shown on planning reads changes, so background writes such
+as the OpenClaw sync's last_synced_at do not invalidate every ETag.
+"""
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+revision = "20260327_019"
+down_revision = "20260326_018"
+branch_labels = None
+depends_on = None
+
+TABLE = "planning_change_counters"
+BUMP_FUNCTION = "planning_bump_change_counters"
+
+# Transition tables, visible to the trigger functions under these names.
+OLD_ROWS = "old_rows"
+NEW_ROWS = "new_rows"
+
+# Agent columns rendered by planning reads (assignee name / avatar, active flag).
+AGENT_DISPLAY_COLUMNS = ("name", "last_name", "initials", "avatar", "is_active")
+
+
+def _per_event(statement: str, column: str) -> str:
+    """PL/pgSQL running ``statement`` with ``{rows}`` bound to ``SELECT column``
+    over the statement's new (INSERT), old (DELETE) or old and new (UPDATE) rows.
+
+    Branches on TG_OP because a transition table that the firing trigger does
+    not declare cannot even be planned against.
+    """
+    new_rows = f"SELECT {column} FROM {NEW_ROWS}"
+    old_rows = f"SELECT {column} FROM {OLD_ROWS}"
+    return f"""
+        IF TG_OP = 'INSERT' THEN
+            {statement.format(rows=new_rows)}
+        ELSIF TG_OP = 'DELETE' THEN
+            {statement.format(rows=old_rows)}
+        ELSE
+            {statement.format(rows=f"{old_rows} UNION {new_rows}")}
+        END IF;
+    """
+
+
+_agent_display_changed = " OR ".join(
+    f"o.{col} IS DISTINCT FROM n.{col}" for col in AGENT_DISPLAY_COLUMNS
+)
+
+# trigger function name -> body bumping the scopes touched by one statement.
+TRIGGER_FUNCTIONS = {
+    "planning_touch_by_project_id": _per_event(
+        f"PERFORM {BUMP_FUNCTION}(ARRAY({{rows}}));", "coalesce(project_id, '')"
+    ),
+    "planning_touch_by_backlog_id": _per_event(
+        f"""PERFORM {BUMP_FUNCTION}(ARRAY(
+                SELECT coalesce(b.project_id, '') FROM backlogs b
+                 WHERE b.id IN ({{rows}})
+            ));""",
+        "backlog_id",
+    ),
+    "planning_touch_by_work_item_id": _per_event(
+        f"""PERFORM {BUMP_FUNCTION}(ARRAY(
+                SELECT coalesce(w.project_id, '') FROM work_items w
+                 WHERE w.id IN ({{rows}})
+            ));""",
+        "work_item_id",
+    ),
+    "planning_touch_agents": f"""
+        IF TG_OP = 'INSERT' THEN
+            PERFORM {BUMP_FUNCTION}(ARRAY(SELECT ''::text FROM {NEW_ROWS} LIMIT 1));
+        ELSIF TG_OP = 'DELETE' THEN
+            PERFORM {BUMP_FUNCTION}(ARRAY(SELECT ''::text FROM {OLD_ROWS} LIMIT 1));
+        ELSE
+            PERFORM {BUMP_FUNCTION}(ARRAY(
+                SELECT ''::text FROM {OLD_ROWS} o JOIN {NEW_ROWS} n ON n.id = o.id
+                 WHERE {_agent_display_changed}
+                 LIMIT 1
+            ));
+        END IF;
+    """,
+}
+
+# table -> trigger function
+TRIGGERS = {
+    "work_items": "planning_touch_by_project_id",
+    "backlogs": "planning_touch_by_project_id",
+    "labels": "planning_touch_by_project_id",
+    "backlog_items": "planning_touch_by_backlog_id",
+    "work_item_labels": "planning_touch_by_work_item_id",
+    "agents": "planning_touch_agents",
+}
+
+# Transition tables can only be declared per event, so each table gets one
+# statement trigger per event: event -> REFERENCING clause.
+EVENTS = {
+    "INSERT": f"REFERENCING NEW TABLE AS {NEW_ROWS}",
+    "UPDATE": f"REFERENCING OLD TABLE AS {OLD_ROWS} NEW TABLE AS {NEW_ROWS}",
+    "DELETE": f"REFERENCING OLD TABLE AS {OLD_ROWS}",
+}
+
+
+def _trigger_name(table: str, event: str) -> str:
+    return f"trg_{table}_change_counter_{event.lower()}"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    existing_tables = inspect(conn).get_table_names()
+
+    if TABLE not in existing_tables:
+        conn.execute(
+            text(f"""
+            CREATE TABLE {TABLE} (
+                scope TEXT PRIMARY KEY,
+                version BIGINT NOT NULL DEFAULT 0
+            )
+            """)
+        )
+
+    conn.execute(
+        text(f"""
+        CREATE OR REPLACE FUNCTION {BUMP_FUNCTION}(target_scopes TEXT[]) RETURNS void AS $$
+        BEGIN
+            INSERT INTO {TABLE} AS c (scope, version)
+            SELECT DISTINCT s, 1 FROM unnest(target_scopes) AS s
+            ORDER BY s
+            ON CONFLICT (scope) DO UPDATE SET version = c.version + 1;
+        END;
+        $$ LANGUAGE plpgsql
+        """)
+    )
+    for name, body in TRIGGER_FUNCTIONS.items():
+        conn.execute(
+            text(f"""
+            CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+            BEGIN
+                {body}
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+            """)
+        )
+
+    for table, function in TRIGGERS.items():
+        if table not in existing_tables:
+            continue
+        for event, referencing in EVENTS.items():
+            trigger = _trigger_name(table, event)
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger} ON {table}"))
+            conn.execute(
+                text(f"""
+                CREATE TRIGGER {trigger}
+                    AFTER {event} ON {table}
+                    {referencing}
+                    FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+                """)
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    existing_tables = inspect(conn).get_table_names()
+    for table in TRIGGERS:
+        if table not in existing_tables:
+            continue
+        for event in EVENTS:
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {_trigger_name(table, event)} ON {table}"))
+    for name in TRIGGER_FUNCTIONS:
+        conn.execute(text(f"DROP FUNCTION IF EXISTS {name}()"))
+    conn.execute(text(f"DROP FUNCTION IF EXISTS {BUMP_FUNCTION}(TEXT[])"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
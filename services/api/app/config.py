@@ -26,9 +26,19 @@ class Settings(BaseSettings):
     db_pool_size: int = 10
     db_max_overflow: int = 20
     openclaw_config_path: str = str(Path.home() / ".openclaw" / "openclaw.json")
+    openclaw_sync_watch_enabled: bool = False
+    openclaw_sync_watch_interval_seconds: int = 10
     langfuse_host: str = ""
     langfuse_public_key: str = ""
     langfuse_secret_key: str = ""
+    langfuse_import_upsert_chunk_size: int = 1000
+    langfuse_import_concurrency: int = 4
+    langfuse_import_slice_days: int = 7
+    langfuse_rate_limit_per_second: float = 5.0
+    langfuse_rate_limit_burst: int = 10
+    langfuse_http_timeout_seconds: float = 30.0
+    langfuse_http_max_connections: int = 10
+    langfuse_http2_enabled: bool = False
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:3100"]
     control_plane_stream_prefix: str = "mc:control-plane"
     control_plane_stream_version: int = 1
@@ -43,7 +53,16 @@ class Settings(BaseSettings):
     control_plane_watchdog_default_timeout_seconds: int = 900
     control_plane_commands_enabled: bool = True
     control_plane_dapr_ingest_enabled: bool = True
+    control_plane_dapr_bulk_subscribe_enabled: bool = False
+    control_plane_dapr_bulk_max_messages_count: int = 100
+    control_plane_dapr_bulk_max_await_duration_ms: int = 1000
     control_plane_watchdog_enabled: bool = True
+    control_plane_dispatch_retry_enabled: bool = True
+    control_plane_dispatch_retry_interval_seconds: int = 5
+    lookup_cache_ttl_seconds: int = 60
+    lookup_cache_max_entries: int = 1024
+    observability_cache_ttl_seconds: int = 300
+    observability_cache_max_entries: int = 256
     base_url: str = "http://127.0.0.1:5100"
     openclaw_gateway_url: str = "ws://127.0.0.1:18789"
     openclaw_device_auth_dir: str = "/run/secrets/openclaw-auth"
@@ -81,5 +100,56 @@ class Settings(BaseSettings):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_langfuse_import(self) -> "Settings":
+        if not 1 <= self.langfuse_import_upsert_chunk_size <= 5000:
+            msg = "MC_API_LANGFUSE_IMPORT_UPSERT_CHUNK_SIZE must be between 1 and 5000"
+            raise ValueError(msg)
+
+        if self.langfuse_import_concurrency < 1:
+            msg = "MC_API_LANGFUSE_IMPORT_CONCURRENCY must be >= 1"
+            raise ValueError(msg)
+
+        if self.langfuse_import_slice_days < 1:
+            msg = "MC_API_LANGFUSE_IMPORT_SLICE_DAYS must be >= 1"
+            raise ValueError(msg)
+
+        if self.langfuse_rate_limit_per_second <= 0 or self.langfuse_rate_limit_burst < 1:
+            msg = (
+                "MC_API_LANGFUSE_RATE_LIMIT_PER_SECOND must be > 0 and "
+                "MC_API_LANGFUSE_RATE_LIMIT_BURST must be >= 1"
+            )
+            raise ValueError(msg)
+
+        if self.langfuse_http_timeout_seconds <= 0:
+            msg = "MC_API_LANGFUSE_HTTP_TIMEOUT_SECONDS must be > 0"
+            raise ValueError(msg)
+
+        if self.langfuse_http_max_connections < 1:
+            msg = "MC_API_LANGFUSE_HTTP_MAX_CONNECTIONS must be >= 1"
+            raise ValueError(msg)
+
+        return self
+
+    @model_validator(mode="after")
+    def validate_background_jobs(self) -> "Settings":
+        if self.openclaw_sync_watch_interval_seconds < 1:
+            msg = "MC_API_OPENCLAW_SYNC_WATCH_INTERVAL_SECONDS must be >= 1"
+            raise ValueError(msg)
+
+        if self.control_plane_dispatch_retry_interval_seconds < 1:
+            msg = "MC_API_CONTROL_PLANE_DISPATCH_RETRY_INTERVAL_SECONDS must be >= 1"
+            raise ValueError(msg)
+
+        if self.control_plane_dapr_bulk_max_messages_count < 1:
+            msg = "MC_API_CONTROL_PLANE_DAPR_BULK_MAX_MESSAGES_COUNT must be >= 1"
+            raise ValueError(msg)
+
+        if self.control_plane_dapr_bulk_max_await_duration_ms < 0:
+            msg = "MC_API_CONTROL_PLANE_DAPR_BULK_MAX_AWAIT_DURATION_MS must be >= 0"
+            raise ValueError(msg)
+
+        return self
+
 
 settings = Settings()
@@ -8,6 +8,7 @@ from app.control_plane.api.schemas import (
     DispatchResponse,
     QueueIngressRequest,
     QueueIngressResponse,
+    RetrySweepResponse,
 )
 from app.control_plane.application.dispatch_selection_service import DispatchSelectionService
 from app.control_plane.application.queue_dispatch_service import QueueDispatchService
@@ -98,6 +99,25 @@ async def dispatch_next(
     )
 
 
+@router.post("/retry-sweep", status_code=200)
+async def retry_sweep(
+    svc: QueueDispatchService = Depends(get_queue_dispatch_service),
+) -> Envelope[RetrySweepResponse]:
+    """Re-drive entries whose dispatch backoff elapsed (same as the scheduler tick)."""
+    agent_ids = await svc.dispatch_due_retries()
+    return Envelope(data=RetrySweepResponse(agent_ids=agent_ids))
+
+
+@router.post("/{entry_id}/requeue", status_code=200)
+async def requeue_parked_entry(
+    entry_id: str,
+    svc: QueueDispatchService = Depends(get_queue_dispatch_service),
+) -> Envelope[AgentQueueEntryResponse]:
+    """Re-queue a PARKED entry with its dispatch attempts reset."""
+    entry = await svc.requeue_parked(entry_id=entry_id)
+    return Envelope(data=_to_response(entry))
+
+
 @router.get("/status")
 async def agent_queue_status(
     agent_id: str = Query(..., min_length=1),
@@ -131,6 +151,8 @@ def _to_response(entry: AgentQueueEntry) -> AgentQueueEntryResponse:
         enqueued_at=entry.enqueued_at,
         updated_at=entry.updated_at,
         cancelled_at=entry.cancelled_at,
+        dispatch_attempts=entry.dispatch_attempts,
+        next_attempt_at=entry.next_attempt_at,
     )
 
 
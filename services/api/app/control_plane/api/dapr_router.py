@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
@@ -7,8 +9,15 @@ from fastapi import APIRouter, Depends, HTTPException
 from starlette import status as http_status
 
 from app.config import settings
-from app.control_plane.application.worker_state_machine_service import WorkerStateMachineService
-from app.control_plane.dependencies import get_worker_state_machine_service
+from app.control_plane.application.worker_state_machine_service import (
+    WorkerMessage,
+    WorkerStateMachineService,
+)
+from app.control_plane.dependencies import (
+    get_batch_worker_state_machine_service,
+    get_worker_state_machine_service,
+)
+from app.shared.http_clients import get_dapr_http_client
 from app.shared.logging import log_event
 
 router = APIRouter(tags=["control-plane"])
@@ -38,6 +47,19 @@ def _extract_causation_id(cloud_event: dict[str, Any], data: dict[str, Any]) ->
 async def dapr_subscribe() -> list[dict[str, Any]]:
     if not settings.control_plane_dapr_ingest_enabled:
         return []
+    if settings.control_plane_dapr_bulk_subscribe_enabled:
+        return [
+            {
+                "pubsubname": _PUBSUB_NAME,
+                "topic": _TOPIC_NAME,
+                "routes": {"default": "v1/control-plane/dapr/events/bulk"},
+                "bulkSubscribe": {
+                    "enabled": True,
+                    "maxMessagesCount": settings.control_plane_dapr_bulk_max_messages_count,
+                    "maxAwaitDurationMs": settings.control_plane_dapr_bulk_max_await_duration_ms,
+                },
+            }
+        ]
     return [
         {
             "pubsubname": _PUBSUB_NAME,
@@ -47,40 +69,19 @@ async def dapr_subscribe() -> list[dict[str, Any]]:
     ]
 
 
-@router.get("/healthz/dapr")
-async def dapr_healthz() -> dict[str, str]:
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        try:
-            response = await client.get(f"{_DAPR_HTTP_BASE}/v1.0/metadata")
-            response.raise_for_status()
-        except httpx.HTTPError as error:
-            raise HTTPException(
-                status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Dapr sidecar metadata unavailable: {error}",
-            ) from error
-    return {"status": "ok"}
+@dataclass
+class _ParsedEvent:
+    data: dict[str, Any]
+    run_id: str
+    event_type: str
+    message_id: str
+    correlation_id: str
+    causation_id: str | None
+    occurred_at: str
+    payload: dict[str, Any]
 
 
-@router.post("/v1/control-plane/dapr/events")
-async def handle_dapr_control_plane_event(
-    cloud_event: dict[str, Any],
-    worker_state_service: WorkerStateMachineService = Depends(get_worker_state_machine_service),
-) -> dict[str, str]:
-    if not settings.control_plane_dapr_ingest_enabled:
-        log_event(
-            logger,
-            level=logging.WARNING,
-            event="control-plane.dapr.event_ignored",
-            reason="CONTROL_PLANE_DAPR_INGEST_DISABLED",
-        )
-        return {
-            "status": "IGNORED",
-            "reason": "CONTROL_PLANE_DAPR_INGEST_DISABLED",
-            "run_id": str(cloud_event.get("run_id") or "unknown-run"),
-            "occurred_at": datetime.now(tz=UTC).isoformat(),
-            "transition_decision": "IGNORED",
-        }
-
+def _parse_cloud_event(cloud_event: dict[str, Any]) -> _ParsedEvent:
     data = cloud_event.get("data")
     if not isinstance(data, dict):
         data = cloud_event
@@ -106,74 +107,264 @@ async def handle_dapr_control_plane_event(
     if isinstance(tracestate, str) and tracestate.strip():
         event_payload.setdefault("tracestate", tracestate.strip())
 
-    worker_result = await worker_state_service.process_message(
-        stream_key="dapr:control-plane.events",
-        consumer_group=settings.control_plane_worker_consumer_group,
-        consumer_name="dapr-bridge",
-        message_id=message_id,
+    return _ParsedEvent(
+        data=data,
         run_id=run_id,
         event_type=event_type,
+        message_id=message_id,
         correlation_id=correlation_id,
         causation_id=causation_id,
         occurred_at=occurred_at,
         payload=event_payload,
     )
+
+
+def _worker_message(event: _ParsedEvent) -> WorkerMessage:
+    return WorkerMessage(
+        stream_key="dapr:control-plane.events",
+        consumer_group=settings.control_plane_worker_consumer_group,
+        consumer_name="dapr-bridge",
+        message_id=event.message_id,
+        run_id=event.run_id,
+        event_type=event.event_type,
+        correlation_id=event.correlation_id,
+        causation_id=event.causation_id,
+        occurred_at=event.occurred_at,
+        payload=event.payload,
+    )
+
+
+def _state_item(event: _ParsedEvent) -> dict[str, Any]:
+    return {
+        "key": f"control-plane:last-event:{event.run_id}",
+        "value": {
+            "run_id": event.run_id,
+            "received_at": datetime.now(tz=UTC).isoformat(),
+            "correlation_id": event.correlation_id,
+            "causation_id": event.causation_id,
+            "event": event.data,
+        },
+    }
+
+
+def _ack_payload(event: _ParsedEvent) -> dict[str, Any]:
+    return {
+        "run_id": event.run_id,
+        "acknowledged_at": datetime.now(tz=UTC).isoformat(),
+        "correlation_id": event.correlation_id,
+        "causation_id": event.causation_id,
+        "status": "ACCEPTED",
+    }
+
+
+async def _save_event_states(client: httpx.AsyncClient, items: list[dict[str, Any]]) -> None:
+    """Persist one or more last-event snapshots in a single Dapr state call.
+
+    The Dapr state API accepts an array, so a batch of events costs one
+    round trip regardless of its size.
+    """
+    response = await client.post(f"{_DAPR_HTTP_BASE}/v1.0/state/{_STATESTORE_NAME}", json=items)
+    response.raise_for_status()
+
+
+async def _invoke_worker_ack(client: httpx.AsyncClient, payload: Any) -> None:
+    response = await client.post(
+        (f"{_DAPR_HTTP_BASE}/v1.0/invoke/{_WORKER_APP_ID}" "/method/control-plane/ack"),
+        json=payload,
+    )
+    response.raise_for_status()
+
+
+async def _fan_out_to_sidecar(
+    *,
+    state_items: list[dict[str, Any]],
+    ack_payloads: list[Any],
+) -> tuple[httpx.HTTPError | None, list[httpx.HTTPError | None]]:
+    """Issue the state save and every worker ack concurrently on the shared client.
+
+    Returns the state-save error and one ack error slot per payload so
+    callers can decide per event; non-HTTP errors propagate.
+    """
+    client = get_dapr_http_client()
+    results = await asyncio.gather(
+        _save_event_states(client, state_items),
+        *(_invoke_worker_ack(client, payload) for payload in ack_payloads),
+        return_exceptions=True,
+    )
+    errors: list[httpx.HTTPError | None] = []
+    for result in results:
+        if isinstance(result, httpx.HTTPError):
+            errors.append(result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            errors.append(None)
+    return errors[0], errors[1:]
+
+
+@router.get("/healthz/dapr")
+async def dapr_healthz() -> dict[str, str]:
+    client = get_dapr_http_client()
+    try:
+        response = await client.get(f"{_DAPR_HTTP_BASE}/v1.0/metadata", timeout=5.0)
+        response.raise_for_status()
+    except httpx.HTTPError as error:
+        raise HTTPException(
+            status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Dapr sidecar metadata unavailable: {error}",
+        ) from error
+    return {"status": "ok"}
+
+
+@router.post("/v1/control-plane/dapr/events")
+async def handle_dapr_control_plane_event(
+    cloud_event: dict[str, Any],
+    worker_state_service: WorkerStateMachineService = Depends(get_worker_state_machine_service),
+) -> dict[str, str]:
+    if not settings.control_plane_dapr_ingest_enabled:
+        log_event(
+            logger,
+            level=logging.WARNING,
+            event="control-plane.dapr.event_ignored",
+            reason="CONTROL_PLANE_DAPR_INGEST_DISABLED",
+        )
+        return {
+            "status": "IGNORED",
+            "reason": "CONTROL_PLANE_DAPR_INGEST_DISABLED",
+            "run_id": str(cloud_event.get("run_id") or "unknown-run"),
+            "occurred_at": datetime.now(tz=UTC).isoformat(),
+            "transition_decision": "IGNORED",
+        }
+
+    event = _parse_cloud_event(cloud_event)
+    worker_result = await worker_state_service.process_message(
+        stream_key="dapr:control-plane.events",
+        consumer_group=settings.control_plane_worker_consumer_group,
+        consumer_name="dapr-bridge",
+        message_id=event.message_id,
+        run_id=event.run_id,
+        event_type=event.event_type,
+        correlation_id=event.correlation_id,
+        causation_id=event.causation_id,
+        occurred_at=event.occurred_at,
+        payload=event.payload,
+    )
     log_event(
         logger,
         level=logging.INFO,
         event="control-plane.dapr.event_ingested",
-        run_id=run_id,
-        event_type=event_type,
-        correlation_id=correlation_id,
-        causation_id=causation_id,
-        message_id=message_id,
+        run_id=event.run_id,
+        event_type=event.event_type,
+        correlation_id=event.correlation_id,
+        causation_id=event.causation_id,
+        message_id=event.message_id,
         decision=str(worker_result.get("decision", "")),
     )
 
-    state_key = f"control-plane:last-event:{run_id}"
-    state_payload = {
-        "run_id": run_id,
-        "received_at": datetime.now(tz=UTC).isoformat(),
-        "correlation_id": correlation_id,
-        "causation_id": causation_id,
-        "event": data,
-    }
-    ack_payload = {
-        "run_id": run_id,
-        "acknowledged_at": datetime.now(tz=UTC).isoformat(),
-        "correlation_id": correlation_id,
-        "causation_id": causation_id,
-        "status": "ACCEPTED",
+    state_error, ack_errors = await _fan_out_to_sidecar(
+        state_items=[_state_item(event)],
+        ack_payloads=[_ack_payload(event)],
+    )
+    if state_error is not None:
+        raise HTTPException(
+            status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to persist control-plane event in Dapr state store: {state_error}",
+        ) from state_error
+    if ack_errors[0] is not None:
+        raise HTTPException(
+            status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to invoke worker acknowledgement endpoint via Dapr: {ack_errors[0]}",
+        ) from ack_errors[0]
+
+    return {
+        "status": "SUCCESS",
+        "run_id": event.run_id,
+        "occurred_at": event.occurred_at,
+        "transition_decision": str(worker_result.get("decision", "")),
     }
 
-    async with httpx.AsyncClient(timeout=8.0) as client:
-        try:
-            save_state_response = await client.post(
-                f"{_DAPR_HTTP_BASE}/v1.0/state/{_STATESTORE_NAME}",
-                json=[{"key": state_key, "value": state_payload}],
+
+@router.post("/v1/control-plane/dapr/events/bulk")
+async def handle_dapr_control_plane_bulk_event(
+    bulk_message: dict[str, Any],
+    worker_state_service: WorkerStateMachineService = Depends(
+        get_batch_worker_state_machine_service
+    ),
+) -> dict[str, list[dict[str, str]]]:
+    """Ingest a Dapr bulk delivery and report a status per entry.
+
+    Well-formed entries go through the worker state machine in one
+    transaction. Malformed entries are dropped; entries whose transition
+    or sidecar fan-out failed are returned as RETRY so Dapr redelivers
+    only those (already-applied messages dedupe on redelivery).
+    """
+    raw_entries = bulk_message.get("entries")
+    entries = [
+        entry
+        for entry in (raw_entries if isinstance(raw_entries, list) else [])
+        if isinstance(entry, dict) and entry.get("entryId")
+    ]
+    if not settings.control_plane_dapr_ingest_enabled:
+        log_event(
+            logger,
+            level=logging.WARNING,
+            event="control-plane.dapr.event_ignored",
+            reason="CONTROL_PLANE_DAPR_INGEST_DISABLED",
+            entry_count=len(entries),
+        )
+        return {
+            "statuses": [
+                {"entryId": str(entry["entryId"]), "status": "SUCCESS"} for entry in entries
+            ]
+        }
+
+    statuses: dict[str, str] = {}
+    parsed: list[tuple[str, _ParsedEvent]] = []
+    for entry in entries:
+        entry_id = str(entry["entryId"])
+        cloud_event = entry.get("event")
+        if isinstance(cloud_event, dict):
+            statuses[entry_id] = "RETRY"
+            parsed.append((entry_id, _parse_cloud_event(cloud_event)))
+        else:
+            statuses[entry_id] = "DROP"
+
+    applied: list[tuple[str, _ParsedEvent]] = []
+    if parsed:
+        results = await worker_state_service.process_batch(
+            [_worker_message(event) for _, event in parsed]
+        )
+        applied = [item for item, result in zip(parsed, results, strict=True) if result is not None]
+
+    if applied:
+        state_error, ack_errors = await _fan_out_to_sidecar(
+            state_items=[_state_item(event) for _, event in applied],
+            ack_payloads=[_ack_payload(event) for _, event in applied],
+        )
+        for (entry_id, _), ack_error in zip(applied, ack_errors, strict=True):
+            statuses[entry_id] = (
+                "RETRY" if state_error is not None or ack_error is not None else "SUCCESS"
             )
-            save_state_response.raise_for_status()
-        except httpx.HTTPError as error:
-            raise HTTPException(
-                status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Failed to persist control-plane event in Dapr state store: {error}",
-            ) from error
-
-        try:
-            invoke_response = await client.post(
-                (f"{_DAPR_HTTP_BASE}/v1.0/invoke/{_WORKER_APP_ID}" "/method/control-plane/ack"),
-                json=ack_payload,
+        if state_error is not None or any(ack_errors):
+            log_event(
+                logger,
+                level=logging.WARNING,
+                event="control-plane.dapr.bulk_sidecar_failed",
+                state_error=str(state_error) if state_error is not None else None,
+                failed_acks=sum(1 for error in ack_errors if error is not None),
             )
-            invoke_response.raise_for_status()
-        except httpx.HTTPError as error:
-            raise HTTPException(
-                status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Failed to invoke worker acknowledgement endpoint via Dapr: {error}",
-            ) from error
 
+    log_event(
+        logger,
+        level=logging.INFO,
+        event="control-plane.dapr.bulk_ingested",
+        entry_count=len(statuses),
+        success_count=sum(1 for value in statuses.values() if value == "SUCCESS"),
+        retry_count=sum(1 for value in statuses.values() if value == "RETRY"),
+        drop_count=sum(1 for value in statuses.values() if value == "DROP"),
+    )
     return {
-        "status": "SUCCESS",
-        "run_id": run_id,
-        "occurred_at": occurred_at,
-        "transition_decision": str(worker_result.get("decision", "")),
+        "statuses": [
+            {"entryId": entry_id, "status": status} for entry_id, status in statuses.items()
+        ]
     }
@@ -147,6 +147,8 @@ class AgentQueueEntryResponse(BaseModel):
     enqueued_at: str
     updated_at: str
     cancelled_at: str | None
+    dispatch_attempts: int = 0
+    next_attempt_at: str | None = None
 
 
 # --- Agent queue dispatch ---
@@ -175,6 +177,10 @@ class DispatchResponse(BaseModel):
     reason: str | None = None
 
 
+class RetrySweepResponse(BaseModel):
+    agent_ids: list[str]
+
+
 class AgentQueueSummaryResponse(BaseModel):
     agent_id: str
     has_active_item: bool
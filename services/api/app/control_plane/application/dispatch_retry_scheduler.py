@@ -0,0 +1,45 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from app.shared.logging import log_event
+from app.shared.periodic_task import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+
+class DispatchRetryScheduler(PeriodicTask):
+    """Background loop that re-drives queue entries whose backoff elapsed.
+
+    The sweep callable owns its own DB session and returns the agent ids
+    it re-drove. Errors are logged and the loop keeps running so a bad
+    sweep never stops future retries.
+    """
+
+    def __init__(
+        self,
+        *,
+        sweep: Callable[[], Awaitable[list[str]]],
+        interval_seconds: float,
+    ) -> None:
+        super().__init__(name="control-plane-dispatch-retry", interval_seconds=interval_seconds)
+        self._sweep = sweep
+
+    async def run_once(self) -> list[str]:
+        try:
+            agent_ids = await self._sweep()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log_event(
+                logger,
+                level=logging.WARNING,
+                event="control_plane.dispatch_retry.sweep_failed",
+                error=str(exc),
+            )
+            return []
+        if agent_ids:
+            log_event(
+                logger,
+                level=logging.INFO,
+                event="control_plane.dispatch_retry.swept",
+                agent_ids=agent_ids,
+            )
+        return agent_ids
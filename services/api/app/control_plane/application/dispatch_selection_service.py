@@ -33,9 +33,11 @@ class DispatchSelectionService:
         """Select and begin dispatching the oldest queued item for an agent.
 
         Enforces capacity=1: if the agent already has an active item,
-        no new dispatch occurs. Uses CAS transitions for correctness
-        under concurrent calls. Idempotent: repeated calls on an
-        already-dispatching item are safe.
+        no new dispatch occurs. The queue is strict FIFO: while the head
+        entry is still backing off after a failed send (``next_attempt_at``
+        in the future) nothing is dispatched for the agent. Uses CAS
+        transitions for correctness under concurrent calls. Idempotent:
+        repeated calls on an already-dispatching item are safe.
 
         Race-safety: the CAS QUEUED→DISPATCHING is the atomic claim
         on a single entry. Concurrent callers targeting the same entry
@@ -47,12 +49,11 @@ class DispatchSelectionService:
         if await self._repo.has_active_item(agent_id=agent_id):
             return DispatchResult(action="skipped", reason="agent_busy")
 
-        candidate = await self._repo.get_oldest_queued_for_agent(agent_id=agent_id)
+        now = utc_now()
+        candidate = await self._repo.get_oldest_queued_for_agent(agent_id=agent_id, due_at=now)
         if candidate is None:
             return DispatchResult(action="skipped", reason="queue_empty")
 
-        now = utc_now()
-
         # CAS: QUEUED → DISPATCHING (atomic claim — fails if already transitioned)
         claimed = await self._repo.transition_status(
             entry_id=candidate.id,
@@ -101,6 +102,19 @@ class DispatchSelectionService:
 
         return DispatchResult(action="dispatched", entry=dispatched_entry)
 
+    async def list_agents_with_due_retries(
+        self,
+        *,
+        due_at: str,
+        limit: int = 50,
+    ) -> list[str]:
+        """Agents holding QUEUED entries whose dispatch backoff has elapsed."""
+        return await self._repo.list_agents_with_due_retries(due_at=due_at, limit=limit)
+
+    async def requeue_parked(self, *, entry_id: str) -> AgentQueueEntry | None:
+        """Move a PARKED entry back to QUEUED with a fresh retry budget."""
+        return await self._repo.requeue_parked(entry_id=entry_id, updated_at=utc_now())
+
     async def get_agent_queue_summary(
         self,
         *,
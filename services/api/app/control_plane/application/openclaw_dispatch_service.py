@@ -1,6 +1,8 @@
 import logging
 from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
 
+from app.config import settings
 from app.control_plane.application.ports import (
     AgentQueueRepository,
     DispatchRecordRepository,
@@ -25,6 +27,15 @@ class ExternalDispatchResult:
     action: str  # "sent" | "failed" | "missing_session_key"
     dispatch_record: DispatchRecord | None = None
     error: str | None = None
+    next_attempt_at: str | None = None
+    parked: bool = False
+
+
+@dataclass
+class _RetryDecision:
+    status: AgentQueueStatus
+    dispatch_attempts: int
+    next_attempt_at: str | None
 
 
 class OpenClawDispatchService:
@@ -33,6 +44,10 @@ class OpenClawDispatchService:
     Agent-agnostic: dispatch target is resolved by the caller via
     assigned_agent_id → agent.main_session_key. This service handles
     the external send, metadata persistence, and failure recording.
+
+    Failed sends revert the entry to QUEUED with an exponential backoff
+    (``next_attempt_at``); once ``control_plane_retry_max_attempts`` is
+    reached the entry is PARKED and no longer picked up automatically.
     """
 
     def __init__(
@@ -47,6 +62,9 @@ class OpenClawDispatchService:
         self._dispatch_repo = dispatch_repo
         self._adapter = openclaw_adapter
         self._mc_api_base_url = mc_api_base_url
+        self._max_attempts = settings.control_plane_retry_max_attempts
+        self._base_backoff_seconds = settings.control_plane_retry_base_backoff_seconds
+        self._max_backoff_seconds = settings.control_plane_retry_max_backoff_seconds
 
     async def dispatch_to_openclaw(
         self,
@@ -58,7 +76,8 @@ class OpenClawDispatchService:
         """Send a claimed queue entry to the agent's main session.
 
         Precondition: entry.status must already be ACK_PENDING.
-        On failure, reverts to QUEUED for retry.
+        On failure, reverts to QUEUED with backoff, or PARKED after the
+        last allowed attempt.
         """
         if not main_session_key:
             return await self._handle_missing_session_key(entry=entry)
@@ -170,7 +189,7 @@ class OpenClawDispatchService:
         entry: AgentQueueEntry,
         reason_code: str,
     ) -> ExternalDispatchResult:
-        """Record a dispatch failure and revert queue entry to QUEUED.
+        """Record a dispatch failure and schedule the queue entry for retry.
 
         Use for pre-send failures (agent not found, missing session key, etc.)
         where the adapter was never called.
@@ -192,12 +211,7 @@ class OpenClawDispatchService:
         )
         await self._dispatch_repo.create(record=record)
 
-        await self._queue_repo.transition_status(
-            entry_id=entry.id,
-            expected_status=AgentQueueStatus.ACK_PENDING,
-            new_status=AgentQueueStatus.QUEUED,
-            updated_at=now,
-        )
+        retry = await self._schedule_retry(entry=entry, now=now)
         await self._dispatch_repo.commit()
         await self._queue_repo.commit()
 
@@ -209,12 +223,16 @@ class OpenClawDispatchService:
             reason_code=reason_code,
             work_item_key=entry.work_item_key,
             correlation_id=entry.correlation_id,
+            dispatch_attempts=retry.dispatch_attempts,
+            next_attempt_at=retry.next_attempt_at,
         )
 
         return ExternalDispatchResult(
             action=reason_code.lower(),
             dispatch_record=record,
             error=error,
+            next_attempt_at=retry.next_attempt_at,
+            parked=retry.status == AgentQueueStatus.PARKED,
         )
 
     async def _handle_missing_session_key(
@@ -240,12 +258,7 @@ class OpenClawDispatchService:
 
         await self._dispatch_repo.create(record=record)
 
-        await self._queue_repo.transition_status(
-            entry_id=entry.id,
-            expected_status=AgentQueueStatus.ACK_PENDING,
-            new_status=AgentQueueStatus.QUEUED,
-            updated_at=now,
-        )
+        retry = await self._schedule_retry(entry=entry, now=now)
         await self._dispatch_repo.commit()
         await self._queue_repo.commit()
 
@@ -258,10 +271,64 @@ class OpenClawDispatchService:
             work_item_key=entry.work_item_key,
             error=error,
             correlation_id=entry.correlation_id,
+            dispatch_attempts=retry.dispatch_attempts,
+            next_attempt_at=retry.next_attempt_at,
         )
 
         return ExternalDispatchResult(
             action="failed",
             dispatch_record=record,
             error=error,
+            next_attempt_at=retry.next_attempt_at,
+            parked=retry.status == AgentQueueStatus.PARKED,
         )
+
+    async def _schedule_retry(self, *, entry: AgentQueueEntry, now: str) -> _RetryDecision:
+        """Revert an ACK_PENDING entry after a failed attempt.
+
+        Attempt N (1-based) waits ``base * 2**(N-1)`` seconds, capped at
+        the max backoff. The attempt that reaches the max parks the entry.
+        """
+        attempts = entry.dispatch_attempts + 1
+        if attempts >= self._max_attempts:
+            decision = _RetryDecision(
+                status=AgentQueueStatus.PARKED,
+                dispatch_attempts=attempts,
+                next_attempt_at=None,
+            )
+        else:
+            backoff_seconds = min(
+                self._base_backoff_seconds * (2 ** (attempts - 1)),
+                self._max_backoff_seconds,
+            )
+            next_attempt_dt = datetime.fromisoformat(now) + timedelta(seconds=backoff_seconds)
+            decision = _RetryDecision(
+                status=AgentQueueStatus.QUEUED,
+                dispatch_attempts=attempts,
+                next_attempt_at=next_attempt_dt.isoformat(),
+            )
+
+        await self._queue_repo.reschedule_dispatch(
+            entry_id=entry.id,
+            expected_status=AgentQueueStatus.ACK_PENDING,
+            new_status=decision.status,
+            dispatch_attempts=decision.dispatch_attempts,
+            next_attempt_at=decision.next_attempt_at,
+            updated_at=now,
+        )
+        entry.status = decision.status
+        entry.dispatch_attempts = decision.dispatch_attempts
+        entry.next_attempt_at = decision.next_attempt_at
+
+        if decision.status == AgentQueueStatus.PARKED:
+            log_event(
+                logger,
+                level=logging.ERROR,
+                event="control_plane.dispatch.parked",
+                agent_id=entry.agent_id,
+                queue_entry_id=entry.id,
+                work_item_key=entry.work_item_key,
+                dispatch_attempts=attempts,
+                correlation_id=entry.correlation_id,
+            )
+        return decision
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 
 from app.control_plane.domain.models import (
     AgentQueueEntry,
@@ -126,6 +127,13 @@ class RunRepository(ABC):
         clear_lease: bool,
     ) -> bool: ...
 
+    @abstractmethod
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        """Scope whose writes roll back on error without aborting the outer transaction."""
+
+    @abstractmethod
+    async def commit(self) -> None: ...
+
 
 class ConsumerRepository(ABC):
     @abstractmethod
@@ -254,8 +262,17 @@ class AgentQueueRepository(ABC):
         self,
         *,
         agent_id: str,
+        due_at: str | None = None,
     ) -> AgentQueueEntry | None: ...
 
+    @abstractmethod
+    async def list_agents_with_due_retries(
+        self,
+        *,
+        due_at: str,
+        limit: int = 50,
+    ) -> list[str]: ...
+
     @abstractmethod
     async def has_active_item(self, *, agent_id: str) -> bool: ...
 
@@ -276,6 +293,26 @@ class AgentQueueRepository(ABC):
         updated_at: str,
     ) -> bool: ...
 
+    @abstractmethod
+    async def reschedule_dispatch(
+        self,
+        *,
+        entry_id: str,
+        expected_status: AgentQueueStatus,
+        new_status: AgentQueueStatus,
+        dispatch_attempts: int,
+        next_attempt_at: str | None,
+        updated_at: str,
+    ) -> bool: ...
+
+    @abstractmethod
+    async def requeue_parked(
+        self,
+        *,
+        entry_id: str,
+        updated_at: str,
+    ) -> AgentQueueEntry | None: ...
+
     @abstractmethod
     async def commit(self) -> None: ...
 
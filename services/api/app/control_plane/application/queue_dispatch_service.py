@@ -12,8 +12,10 @@ from app.control_plane.application.queue_ingress_service import (
     QueueIngressService,
 )
 from app.control_plane.domain.models import AgentQueueEntry, DispatchRecord
+from app.shared.api.errors import NotFoundError
 from app.shared.logging import log_event
 from app.shared.ports import AgentLookupPort
+from app.shared.utils import utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +120,28 @@ class QueueDispatchService:
             reason=send_result.error,
         )
 
+    async def dispatch_due_retries(self, *, limit: int = 50) -> list[str]:
+        """Re-drive agents whose backed-off queue entries are due again.
+
+        Called periodically by the dispatch retry scheduler. Returns the
+        agent ids that were re-driven.
+        """
+        agent_ids = await self._selection.list_agents_with_due_retries(
+            due_at=utc_now(),
+            limit=limit,
+        )
+        for agent_id in agent_ids:
+            await self._try_push_dispatch(agent_id=agent_id)
+        return agent_ids
+
+    async def requeue_parked(self, *, entry_id: str) -> AgentQueueEntry:
+        """Give a PARKED entry a fresh retry budget and push-dispatch it."""
+        entry = await self._selection.requeue_parked(entry_id=entry_id)
+        if entry is None:
+            raise NotFoundError(f"Parked agent queue entry not found: {entry_id}")
+        await self._try_push_dispatch(agent_id=entry.agent_id)
+        return entry
+
     async def _try_push_dispatch(self, *, agent_id: str) -> None:
         """Best-effort push dispatch — does not propagate errors."""
         try:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -54,6 +56,20 @@ _STEP_ALLOWED_TRANSITIONS: dict[StepStatus, set[StepStatus]] = {
 }
 
 
+@dataclass
+class WorkerMessage:
+    stream_key: str
+    consumer_group: str
+    consumer_name: str
+    message_id: str
+    run_id: str
+    event_type: str
+    correlation_id: str
+    causation_id: str | None
+    occurred_at: str
+    payload: dict[str, Any]
+
+
 class WorkerStateMachineService:
     def __init__(self, run_repo: RunRepository, consumer_repo: ConsumerRepository) -> None:
         self._run_repo = run_repo
@@ -160,6 +176,46 @@ class WorkerStateMachineService:
             "reason_message": reason_message or "",
         }
 
+    async def process_batch(self, messages: Sequence[WorkerMessage]) -> list[dict[str, str] | None]:
+        """Apply a batch of messages in order and commit them as one transaction.
+
+        Each message runs in its own savepoint, so a message that raises is
+        rolled back alone and reported as ``None`` while the rest of the
+        batch still commits. Repositories must be built with autocommit off.
+        """
+        results: list[dict[str, str] | None] = []
+        for message in messages:
+            try:
+                async with self._run_repo.savepoint():
+                    result = await self.process_message(
+                        stream_key=message.stream_key,
+                        consumer_group=message.consumer_group,
+                        consumer_name=message.consumer_name,
+                        message_id=message.message_id,
+                        run_id=message.run_id,
+                        event_type=message.event_type,
+                        correlation_id=message.correlation_id,
+                        causation_id=message.causation_id,
+                        occurred_at=message.occurred_at,
+                        payload=message.payload,
+                    )
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                log_event(
+                    self._logger,
+                    level=logging.WARNING,
+                    event="control-plane.worker.batch_message_failed",
+                    run_id=message.run_id,
+                    message_id=message.message_id,
+                    event_type=message.event_type,
+                    correlation_id=message.correlation_id,
+                    error=str(exc),
+                )
+                results.append(None)
+                continue
+            results.append(result)
+        await self._run_repo.commit()
+        return results
+
     async def reconcile_startup(self, *, worker_instance: str, occurred_at: str) -> list[str]:
         in_flight_runs = await self._run_repo.list_in_flight_runs()
         reconciled: list[str] = []
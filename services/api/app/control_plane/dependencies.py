@@ -16,17 +16,26 @@ from app.control_plane.infrastructure.repositories.consumer import DbConsumerRep
 from app.control_plane.infrastructure.repositories.dispatch_record import DbDispatchRecordRepository
 from app.control_plane.infrastructure.repositories.read_model import DbReadModelRepository
 from app.control_plane.infrastructure.repositories.run import DbRunRepository
+from app.control_plane.infrastructure.repositories.run_attribution import DbRunAttributionAdapter
 from app.control_plane.infrastructure.sources.openclaw_adapter import (
     GatewayWsDispatchAdapter,
 )
 from app.shared.agent_lookup_adapter import DbAgentLookupAdapter
 from app.shared.api.deps import get_db
+from app.shared.db.session import get_session_factory
+from app.shared.ports import RunAttributionPort
 
 
-def build_queue_dispatch_service(db: AsyncSession) -> QueueDispatchService:
-    """Build QueueDispatchService — plain factory for cross-module reuse."""
-    queue_repo = DbAgentQueueRepository(db)
-    dispatch_repo = DbDispatchRecordRepository(db)
+def build_queue_dispatch_service(
+    db: AsyncSession, *, autocommit: bool = True
+) -> QueueDispatchService:
+    """Build QueueDispatchService — plain factory for cross-module reuse.
+
+    With ``autocommit=False`` the repositories only flush, so the caller's
+    unit of work commits the queue and dispatch rows with its own writes.
+    """
+    queue_repo = DbAgentQueueRepository(db, autocommit=autocommit)
+    dispatch_repo = DbDispatchRecordRepository(db, autocommit=autocommit)
     return QueueDispatchService(
         ingress=QueueIngressService(repo=queue_repo),
         selection=DispatchSelectionService(repo=queue_repo),
@@ -43,14 +52,25 @@ def build_queue_dispatch_service(db: AsyncSession) -> QueueDispatchService:
     )
 
 
+def build_run_attribution(db: AsyncSession) -> RunAttributionPort:
+    """Run attribution lookups — plain factory for cross-module reuse (observability)."""
+    return DbRunAttributionAdapter(db)
+
+
+async def run_dispatch_retry_sweep() -> list[str]:
+    """One dispatch-retry tick in its own session (used by the background scheduler)."""
+    async with get_session_factory()() as db:
+        return await build_queue_dispatch_service(db).dispatch_due_retries()
+
+
 async def get_command_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> CommandService:
     return CommandService(repo=DbCommandRepository(db))
 
 
 async def get_worker_state_machine_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> WorkerStateMachineService:
     return WorkerStateMachineService(
         run_repo=DbRunRepository(db),
@@ -58,31 +78,41 @@ async def get_worker_state_machine_service(
     )
 
 
+async def get_batch_worker_state_machine_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> WorkerStateMachineService:
+    """State machine whose repositories defer commits to ``process_batch``."""
+    return WorkerStateMachineService(
+        run_repo=DbRunRepository(db, autocommit=False),
+        consumer_repo=DbConsumerRepository(db, autocommit=False),
+    )
+
+
 async def get_watchdog_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> WatchdogService:
     return WatchdogService(repo=DbRunRepository(db))
 
 
 async def get_run_read_model_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> RunReadModelService:
     return RunReadModelService(repo=DbReadModelRepository(db))
 
 
 async def get_queue_ingress_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> QueueIngressService:
     return QueueIngressService(repo=DbAgentQueueRepository(db))
 
 
 async def get_dispatch_selection_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> DispatchSelectionService:
     return DispatchSelectionService(repo=DbAgentQueueRepository(db))
 
 
 async def get_queue_dispatch_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> QueueDispatchService:
     return build_queue_dispatch_service(db)
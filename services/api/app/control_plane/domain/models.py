@@ -61,6 +61,7 @@ class AgentQueueStatus(StrEnum):
     DONE = "DONE"
     FAILED = "FAILED"
     CANCELLED = "CANCELLED"
+    PARKED = "PARKED"
 
 
 QUEUE_ELIGIBLE_WORK_ITEM_TYPES = frozenset({"STORY", "BUG"})
@@ -85,6 +86,8 @@ class AgentQueueEntry:
     enqueued_at: str
     updated_at: str
     cancelled_at: str | None = None
+    dispatch_attempts: int = 0
+    next_attempt_at: str | None = None
 
 
 @dataclass
@@ -1,19 +1,25 @@
 from typing import Any
 
-from sqlalchemy import Result, func, literal, select, update
+from sqlalchemy import Result, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.control_plane.application.ports import AgentQueueRepository
 from app.control_plane.domain.models import AgentQueueEntry, AgentQueueStatus
 from app.control_plane.infrastructure.shared.mappers import queue_entry_from_row
-from app.control_plane.infrastructure.tables import control_plane_agent_queue
+from app.control_plane.infrastructure.tables import (
+    control_plane_agent_queue,
+    control_plane_agent_queue_counters,
+)
 
 _t = control_plane_agent_queue
+_counters = control_plane_agent_queue_counters
 
 _CANCELLABLE_STATUSES = (
     AgentQueueStatus.QUEUED.value,
     AgentQueueStatus.DISPATCHING.value,
     AgentQueueStatus.ACK_PENDING.value,
+    AgentQueueStatus.PARKED.value,
 )
 
 # Statuses that mean the agent is actively working (capacity occupied)
@@ -32,50 +38,45 @@ def _affected_rows(result: Result[Any]) -> int:
 
 
 class DbAgentQueueRepository(AgentQueueRepository):
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, *, autocommit: bool = True) -> None:
         self._db = db
+        self._autocommit = autocommit
+
+    async def _allocate_queue_position(self, *, agent_id: str, now: str) -> int:
+        # Atomic per-agent counter: INSERT … ON CONFLICT DO UPDATE takes a
+        # row lock on the counter, so concurrent enqueues for the same agent
+        # serialise here and always receive distinct, increasing positions.
+        # Constant cost regardless of queue length (no MAX() scan).
+        stmt = pg_insert(_counters).values(agent_id=agent_id, last_position=1, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[_counters.c.agent_id],
+            set_={
+                "last_position": _counters.c.last_position + 1,
+                "updated_at": now,
+            },
+        ).returning(_counters.c.last_position)
+        return (await self._db.execute(stmt)).scalar_one()
 
     async def enqueue(self, *, entry: AgentQueueEntry) -> None:
-        next_pos = (
-            select(func.coalesce(func.max(_t.c.queue_position), 0) + 1)
-            .where(
-                _t.c.agent_id == entry.agent_id,
-                _t.c.status == AgentQueueStatus.QUEUED.value,
-            )
-            .scalar_subquery()
+        entry.queue_position = await self._allocate_queue_position(
+            agent_id=entry.agent_id,
+            now=entry.enqueued_at,
         )
         await self._db.execute(
-            _t.insert().from_select(
-                [
-                    "id",
-                    "work_item_id",
-                    "work_item_key",
-                    "work_item_type",
-                    "work_item_title",
-                    "project_repo_root",
-                    "agent_id",
-                    "status",
-                    "queue_position",
-                    "correlation_id",
-                    "causation_id",
-                    "enqueued_at",
-                    "updated_at",
-                ],
-                select(
-                    literal(entry.id),
-                    literal(entry.work_item_id),
-                    literal(entry.work_item_key),
-                    literal(entry.work_item_type),
-                    literal(entry.work_item_title),
-                    literal(entry.project_repo_root),
-                    literal(entry.agent_id),
-                    literal(entry.status.value),
-                    next_pos,
-                    literal(entry.correlation_id),
-                    literal(entry.causation_id),
-                    literal(entry.enqueued_at),
-                    literal(entry.updated_at),
-                ),
+            _t.insert().values(
+                id=entry.id,
+                work_item_id=entry.work_item_id,
+                work_item_key=entry.work_item_key,
+                work_item_type=entry.work_item_type,
+                work_item_title=entry.work_item_title,
+                project_repo_root=entry.project_repo_root,
+                agent_id=entry.agent_id,
+                status=entry.status.value,
+                queue_position=entry.queue_position,
+                correlation_id=entry.correlation_id,
+                causation_id=entry.causation_id,
+                enqueued_at=entry.enqueued_at,
+                updated_at=entry.updated_at,
             )
         )
         await self._db.flush()
@@ -113,13 +114,10 @@ class DbAgentQueueRepository(AgentQueueRepository):
 
     async def next_queue_position(self, *, agent_id: str) -> int:
         result = await self._db.execute(
-            select(func.coalesce(func.max(_t.c.queue_position), 0)).where(
-                _t.c.agent_id == agent_id,
-                _t.c.status == AgentQueueStatus.QUEUED.value,
-            )
+            select(_counters.c.last_position).where(_counters.c.agent_id == agent_id)
         )
-        current_max = result.scalar_one()
-        return current_max + 1
+        last_position = result.scalar_one_or_none()
+        return (last_position or 0) + 1
 
     async def list_queued_by_agent(
         self,
@@ -139,7 +137,7 @@ class DbAgentQueueRepository(AgentQueueRepository):
         total = total_result.scalar_one()
 
         rows_result = await self._db.execute(
-            base.order_by(_t.c.queue_position.asc()).limit(limit).offset(offset)
+            base.order_by(_t.c.queue_position.asc(), _t.c.id.asc()).limit(limit).offset(offset)
         )
         entries = [queue_entry_from_row(row) for row in rows_result]
         return entries, total
@@ -148,6 +146,7 @@ class DbAgentQueueRepository(AgentQueueRepository):
         self,
         *,
         agent_id: str,
+        due_at: str | None = None,
     ) -> AgentQueueEntry | None:
         result = await self._db.execute(
             select(_t)
@@ -155,11 +154,36 @@ class DbAgentQueueRepository(AgentQueueRepository):
                 _t.c.agent_id == agent_id,
                 _t.c.status == AgentQueueStatus.QUEUED.value,
             )
-            .order_by(_t.c.queue_position.asc())
+            .order_by(_t.c.queue_position.asc(), _t.c.id.asc())
             .limit(1)
         )
         row = result.first()
-        return queue_entry_from_row(row) if row else None
+        if row is None:
+            return None
+        # Strict FIFO: a head entry still backing off after a failed send
+        # holds the queue until it is due; later entries do not overtake it.
+        if due_at is not None and row.next_attempt_at is not None and row.next_attempt_at > due_at:
+            return None
+        return queue_entry_from_row(row)
+
+    async def list_agents_with_due_retries(
+        self,
+        *,
+        due_at: str,
+        limit: int = 50,
+    ) -> list[str]:
+        result = await self._db.execute(
+            select(_t.c.agent_id)
+            .where(
+                _t.c.status == AgentQueueStatus.QUEUED.value,
+                _t.c.next_attempt_at.is_not(None),
+                _t.c.next_attempt_at <= due_at,
+            )
+            .group_by(_t.c.agent_id)
+            .order_by(func.min(_t.c.next_attempt_at).asc())
+            .limit(limit)
+        )
+        return [str(agent_id) for agent_id in result.scalars()]
 
     async def has_active_item(self, *, agent_id: str) -> bool:
         result = await self._db.execute(
@@ -210,5 +234,59 @@ class DbAgentQueueRepository(AgentQueueRepository):
         await self._db.flush()
         return _affected_rows(result) > 0
 
+    async def reschedule_dispatch(
+        self,
+        *,
+        entry_id: str,
+        expected_status: AgentQueueStatus,
+        new_status: AgentQueueStatus,
+        dispatch_attempts: int,
+        next_attempt_at: str | None,
+        updated_at: str,
+    ) -> bool:
+        result = await self._db.execute(
+            update(_t)
+            .where(
+                _t.c.id == entry_id,
+                _t.c.status == expected_status.value,
+            )
+            .values(
+                status=new_status.value,
+                dispatch_attempts=dispatch_attempts,
+                next_attempt_at=next_attempt_at,
+                updated_at=updated_at,
+            )
+        )
+        await self._db.flush()
+        return _affected_rows(result) > 0
+
+    async def requeue_parked(
+        self,
+        *,
+        entry_id: str,
+        updated_at: str,
+    ) -> AgentQueueEntry | None:
+        result = await self._db.execute(
+            update(_t)
+            .where(
+                _t.c.id == entry_id,
+                _t.c.status == AgentQueueStatus.PARKED.value,
+            )
+            .values(
+                status=AgentQueueStatus.QUEUED.value,
+                dispatch_attempts=0,
+                next_attempt_at=None,
+                updated_at=updated_at,
+            )
+            .returning(*_t.c)
+        )
+        row = result.first()
+        await self._db.flush()
+        return queue_entry_from_row(row) if row else None
+
     async def commit(self) -> None:
-        await self._db.commit()
+        """Commit, or only flush when the caller's unit of work owns the transaction."""
+        if self._autocommit:
+            await self._db.commit()
+        else:
+            await self._db.flush()
@@ -13,8 +13,13 @@ _pm = control_plane_processed_messages.c
 
 
 class DbConsumerRepository(ConsumerRepository):
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, *, autocommit: bool = True) -> None:
         self._db = db
+        self._autocommit = autocommit
+
+    async def _maybe_commit(self) -> None:
+        if self._autocommit:
+            await self._db.commit()
 
     async def get_consumer_offset(
         self,
@@ -61,7 +66,7 @@ class DbConsumerRepository(ConsumerRepository):
             },
         )
         await self._db.execute(stmt)
-        await self._db.commit()
+        await self._maybe_commit()
 
     async def is_message_processed(
         self,
@@ -101,7 +106,7 @@ class DbConsumerRepository(ConsumerRepository):
         )
         stmt = stmt.on_conflict_do_nothing()
         await self._db.execute(stmt)
-        await self._db.commit()
+        await self._maybe_commit()
 
     async def mark_message_processed_and_checkpoint(
         self,
@@ -138,4 +143,4 @@ class DbConsumerRepository(ConsumerRepository):
             },
         )
         await self._db.execute(offset_stmt)
-        await self._db.commit()
+        await self._maybe_commit()
@@ -12,8 +12,9 @@ _t = control_plane_dispatch_records
 
 
 class DbDispatchRecordRepository(DispatchRecordRepository):
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, *, autocommit: bool = True) -> None:
         self._db = db
+        self._autocommit = autocommit
 
     async def create(self, *, record: DispatchRecord) -> None:
         await self._db.execute(
@@ -54,4 +55,8 @@ class DbDispatchRecordRepository(DispatchRecordRepository):
         return dispatch_record_from_row(row, envelope)
 
     async def commit(self) -> None:
-        await self._db.commit()
+        """Commit, or only flush when the caller's unit of work owns the transaction."""
+        if self._autocommit:
+            await self._db.commit()
+        else:
+            await self._db.flush()
@@ -1,4 +1,6 @@
 import json
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import Any, cast
 
 from sqlalchemy import and_, select, update
@@ -29,9 +31,26 @@ def _json_compact(data: object) -> str:
     return json.dumps(data, separators=(",", ":"), sort_keys=True)
 
 
+@asynccontextmanager
+async def _nested_transaction(db: AsyncSession) -> AsyncIterator[None]:
+    async with db.begin_nested():
+        yield
+
+
 class DbRunRepository(RunRepository):
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, *, autocommit: bool = True) -> None:
         self._db = db
+        self._autocommit = autocommit
+
+    async def _maybe_commit(self) -> None:
+        if self._autocommit:
+            await self._db.commit()
+
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        return _nested_transaction(self._db)
+
+    async def commit(self) -> None:
+        await self._db.commit()
 
     async def get_run(self, *, run_id: str) -> ControlPlaneRun | None:
         result = await self._db.execute(
@@ -60,7 +79,7 @@ class DbRunRepository(RunRepository):
                 terminal_at=run.terminal_at,
             )
         )
-        await self._db.commit()
+        await self._maybe_commit()
 
     async def update_run_status(
         self,
@@ -83,7 +102,7 @@ class DbRunRepository(RunRepository):
                 terminal_at=terminal_at,
             )
         )
-        await self._db.commit()
+        await self._maybe_commit()
 
     async def list_in_flight_runs(self) -> list[ControlPlaneRun]:
         result = await self._db.execute(
@@ -114,7 +133,7 @@ class DbRunRepository(RunRepository):
                 terminal_at=step.terminal_at,
             )
         )
-        await self._db.commit()
+        await self._maybe_commit()
 
     async def update_step_status(
         self,
@@ -136,7 +155,7 @@ class DbRunRepository(RunRepository):
                 terminal_at=terminal_at,
             )
         )
-        await self._db.commit()
+        await self._maybe_commit()
 
     async def append_timeline_entry(self, *, entry: RunTimelineEntry) -> None:
         await self._db.execute(
@@ -156,7 +175,7 @@ class DbRunRepository(RunRepository):
                 created_at=entry.created_at,
             )
         )
-        await self._db.commit()
+        await self._maybe_commit()
 
     async def compare_and_set_run_lease(
         self,
@@ -188,7 +207,7 @@ class DbRunRepository(RunRepository):
                 )
             ),
         )
-        await self._db.commit()
+        await self._maybe_commit()
         return int(result.rowcount or 0) > 0
 
     async def apply_watchdog_action_if_lease_matches(
@@ -232,5 +251,5 @@ class DbRunRepository(RunRepository):
                 )
             ),
         )
-        await self._db.commit()
+        await self._maybe_commit()
         return int(result.rowcount or 0) > 0
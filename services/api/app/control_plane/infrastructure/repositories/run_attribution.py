@@ -0,0 +1,89 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.control_plane.infrastructure.tables import (
+    control_plane_agent_queue,
+    control_plane_dispatch_records,
+    control_plane_runs,
+)
+from app.shared.ports import RunAttribution, RunAttributionPort
+
+_d = control_plane_dispatch_records.c
+_q = control_plane_agent_queue.c
+_r = control_plane_runs.c
+
+# Latest dispatch per key is picked with DISTINCT ON by the callers.
+_dispatches = select(
+    _d.run_id, _q.correlation_id, _d.agent_id, _d.work_item_id, _d.work_item_key
+).select_from(
+    control_plane_dispatch_records.outerjoin(control_plane_agent_queue, _q.id == _d.queue_entry_id)
+)
+
+
+class DbRunAttributionAdapter(RunAttributionPort):
+    """Resolves runs / correlation ids to the dispatch that started them.
+
+    Wired into observability through ``build_run_attribution`` so trace links
+    can be attributed without observability reading control-plane tables.
+    Each lookup covers a whole batch with ``DISTINCT ON`` queries that keep
+    the most recent match per key.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def by_run_ids(self, run_ids: list[str]) -> dict[str, RunAttribution]:
+        if not run_ids:
+            return {}
+        result = await self._db.execute(
+            _dispatches.where(_d.run_id.in_(run_ids))
+            .distinct(_d.run_id)
+            .order_by(_d.run_id, _d.created_at.desc())
+        )
+        return {row.run_id: RunAttribution(**row._asdict()) for row in result}
+
+    async def by_correlation_ids(self, correlation_ids: list[str]) -> dict[str, RunAttribution]:
+        if not correlation_ids:
+            return {}
+        result = await self._db.execute(
+            _dispatches.where(_q.correlation_id.in_(correlation_ids))
+            .distinct(_q.correlation_id)
+            .order_by(_q.correlation_id, _d.created_at.desc())
+        )
+        found = {row.correlation_id: RunAttribution(**row._asdict()) for row in result}
+        pending = [cid for cid in correlation_ids if cid not in found]
+        if not pending:
+            return found
+
+        # Not dispatched (yet): the queue entry still names agent and work item,
+        # and a worker run may carry the correlation id.
+        queued = {
+            row.correlation_id: row
+            for row in await self._db.execute(
+                select(_q.correlation_id, _q.agent_id, _q.work_item_id, _q.work_item_key)
+                .where(_q.correlation_id.in_(pending))
+                .distinct(_q.correlation_id)
+                .order_by(_q.correlation_id, _q.enqueued_at.desc())
+            )
+        }
+        runs = {
+            row.correlation_id: row.run_id
+            for row in await self._db.execute(
+                select(_r.correlation_id, _r.run_id)
+                .where(_r.correlation_id.in_(pending))
+                .distinct(_r.correlation_id)
+                .order_by(_r.correlation_id, _r.created_at.desc())
+            )
+        }
+        for cid in pending:
+            entry = queued.get(cid)
+            if entry is None and cid not in runs:
+                continue
+            found[cid] = RunAttribution(
+                run_id=runs.get(cid),
+                correlation_id=cid,
+                agent_id=entry.agent_id if entry else None,
+                work_item_id=entry.work_item_id if entry else None,
+                work_item_key=entry.work_item_key if entry else None,
+            )
+        return found
@@ -151,6 +151,8 @@ def queue_entry_from_row(row: Row[Any]) -> AgentQueueEntry:
         enqueued_at=str(row.enqueued_at),
         updated_at=str(row.updated_at),
         cancelled_at=(str(row.cancelled_at) if row.cancelled_at else None),
+        dispatch_attempts=int(row.dispatch_attempts or 0),
+        next_attempt_at=(str(row.next_attempt_at) if row.next_attempt_at else None),
     )
 
 
@@ -1,4 +1,13 @@
-from sqlalchemy import Column, ForeignKey, Index, Integer, PrimaryKeyConstraint, Table, Text
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    Table,
+    Text,
+    text,
+)
 
 from app.shared.db.metadata import metadata
 
@@ -140,6 +149,16 @@ control_plane_agent_queue = Table(
     Column("enqueued_at", Text, nullable=False),
     Column("updated_at", Text, nullable=False),
     Column("cancelled_at", Text),
+    Column("dispatch_attempts", Integer, nullable=False, server_default=text("0")),
+    Column("next_attempt_at", Text),
+)
+
+control_plane_agent_queue_counters = Table(
+    "control_plane_agent_queue_counters",
+    metadata,
+    Column("agent_id", Text, primary_key=True),
+    Column("last_position", Integer, nullable=False, server_default=text("0")),
+    Column("updated_at", Text, nullable=False),
 )
 
 control_plane_dispatch_records = Table(
@@ -206,6 +225,20 @@ Index(
         ("QUEUED", "DISPATCHING", "ACK_PENDING")
     ),
 )
+Index(
+    "idx_cp_agent_queue_agent_queued_fifo",
+    control_plane_agent_queue.c.agent_id,
+    control_plane_agent_queue.c.queue_position,
+    control_plane_agent_queue.c.id,
+    postgresql_where=control_plane_agent_queue.c.status == "QUEUED",
+)
+Index(
+    "idx_cp_agent_queue_retry_due",
+    control_plane_agent_queue.c.next_attempt_at,
+    control_plane_agent_queue.c.agent_id,
+    postgresql_where=(control_plane_agent_queue.c.status == "QUEUED")
+    & control_plane_agent_queue.c.next_attempt_at.is_not(None),
+)
 Index(
     "idx_cp_dispatch_records_queue_entry",
     control_plane_dispatch_records.c.queue_entry_id,
@@ -12,12 +12,17 @@ from app.config import settings
 from app.control_plane.api.agent_queue import router as control_plane_agent_queue_router
 from app.control_plane.api.dapr_router import router as control_plane_dapr_router
 from app.control_plane.api.router import router as control_plane_router
+from app.control_plane.application.dispatch_retry_scheduler import DispatchRetryScheduler
+from app.control_plane.dependencies import run_dispatch_retry_sweep
 from app.observability.api.router import router as observability_router
 from app.planning.api.router import router as planning_router
+from app.planning.application.openclaw_sync_watcher import OpenClawSyncWatcher
+from app.planning.dependencies import openclaw_config_fingerprint, run_openclaw_agent_sync
 from app.shared.api.errors import AppError, app_error_handler, generic_error_handler
 from app.shared.api.health import router as health_router
 from app.shared.db.revision_check import assert_database_revision_is_current
 from app.shared.db.session import close_db_engine, get_async_engine, init_db_engine
+from app.shared.http_clients import close_http_clients, init_http_clients
 from app.shared.logging import configure_logging, log_event
 
 configure_logging(level=settings.log_level)
@@ -32,9 +37,26 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         get_async_engine(),
         database_url=settings.postgres_dsn,
     )
+    await init_http_clients()
+    retry_scheduler = DispatchRetryScheduler(
+        sweep=run_dispatch_retry_sweep,
+        interval_seconds=settings.control_plane_dispatch_retry_interval_seconds,
+    )
+    if settings.control_plane_dispatch_retry_enabled:
+        retry_scheduler.start()
+    openclaw_watcher = OpenClawSyncWatcher(
+        fingerprint=openclaw_config_fingerprint,
+        sync=run_openclaw_agent_sync,
+        interval_seconds=settings.openclaw_sync_watch_interval_seconds,
+    )
+    if settings.openclaw_sync_watch_enabled:
+        openclaw_watcher.start()
     try:
         yield
     finally:
+        await openclaw_watcher.stop()
+        await retry_scheduler.stop()
+        await close_http_clients()
         await close_db_engine()
 
 
@@ -1,32 +1,45 @@
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response
 
 from app.observability.api.schemas import (
+    AttributedCost,
+    AttributedCostsResponse,
     CostsResponse,
     ImportRecordResponse,
     ImportStatusResponse,
     ModelsResponse,
     RequestsResponse,
+    TraceLinkRequest,
+    TraceLinkResponse,
 )
-from app.observability.application.import_service import ImportService
+from app.observability.application.cost_attribution_service import CostAttributionService
+from app.observability.application.import_service import ImportService, import_record_to_dict
 from app.observability.application.metrics_service import MetricsService
+from app.observability.application.ports import ImportLockPort
 from app.observability.dependencies import (
+    get_cost_attribution_service,
+    get_import_lock,
     get_import_service,
     get_metrics_service,
+    run_import_job,
 )
+from app.observability.domain.models import CostScope
+from app.shared.api.conditional import conditional_json_response
 from app.shared.api.envelope import Envelope
+from app.shared.api.errors import ConflictError
 
 router = APIRouter(tags=["observability"])
 
 
-@router.get("/costs")
+@router.get("/costs", response_model=Envelope[CostsResponse])
 async def get_costs(
+    request: Request,
     service: MetricsService = Depends(get_metrics_service),
     from_param: str | None = Query(None, alias="from"),
     to_param: str | None = Query(None, alias="to"),
     days: int | None = Query(None),
-) -> Envelope[CostsResponse]:
+) -> Response:
     if from_param and to_param:
         from_str = from_param
         to_str = to_param
@@ -38,7 +51,53 @@ async def get_costs(
         to_str = now.strftime("%Y-%m-%d")
 
     raw = await service.get_costs(from_str, to_str)
-    return Envelope(data=CostsResponse(**raw))
+    return conditional_json_response(request, Envelope(data=CostsResponse(**raw)))
+
+
+@router.get("/costs/runs/{run_id}")
+async def get_run_costs(
+    run_id: str,
+    service: CostAttributionService = Depends(get_cost_attribution_service),
+) -> Envelope[AttributedCost]:
+    raw = await service.get_costs(CostScope.RUN, run_id)
+    return Envelope(data=AttributedCost(**raw))
+
+
+@router.get("/costs/agents")
+async def list_agent_costs(
+    service: CostAttributionService = Depends(get_cost_attribution_service),
+) -> Envelope[AttributedCostsResponse]:
+    items = await service.list_costs(CostScope.AGENT)
+    return Envelope(data=AttributedCostsResponse(items=[AttributedCost(**i) for i in items]))
+
+
+@router.get("/costs/agents/{agent_id}")
+async def get_agent_costs(
+    agent_id: str,
+    service: CostAttributionService = Depends(get_cost_attribution_service),
+) -> Envelope[AttributedCost]:
+    raw = await service.get_costs(CostScope.AGENT, agent_id)
+    return Envelope(data=AttributedCost(**raw))
+
+
+@router.get("/costs/work-items/{work_item}")
+async def get_work_item_costs(
+    work_item: str,
+    service: CostAttributionService = Depends(get_cost_attribution_service),
+) -> Envelope[AttributedCost]:
+    """Cost of one work item, addressed by id or key (e.g. ``MC-123``)."""
+    raw = await service.get_costs(CostScope.WORK_ITEM, work_item)
+    return Envelope(data=AttributedCost(**raw))
+
+
+@router.put("/traces/{trace_id}/link")
+async def link_trace(
+    trace_id: str,
+    body: TraceLinkRequest,
+    service: CostAttributionService = Depends(get_cost_attribution_service),
+) -> Envelope[TraceLinkResponse]:
+    raw = await service.link_trace(trace_id, run_id=body.run_id, correlation_id=body.correlation_id)
+    return Envelope(data=TraceLinkResponse(**raw))
 
 
 @router.get("/requests")
@@ -54,30 +113,44 @@ async def get_requests(
     return Envelope(data=RequestsResponse(**raw))
 
 
-@router.get("/requests/models")
+@router.get("/requests/models", response_model=Envelope[ModelsResponse])
 async def get_request_models(
+    request: Request,
     service: MetricsService = Depends(get_metrics_service),
-) -> Envelope[ModelsResponse]:
+) -> Response:
     models = await service.get_distinct_models()
-    return Envelope(data=ModelsResponse(models=models))
+    return conditional_json_response(request, Envelope(data=ModelsResponse(models=models)))
 
 
-@router.post("/imports")
+@router.post("/imports", status_code=202)
 async def trigger_import(
+    background_tasks: BackgroundTasks,
     service: ImportService = Depends(get_import_service),
+    lock: ImportLockPort = Depends(get_import_lock),
+    resume: bool = Query(False),
 ) -> Envelope[ImportRecordResponse]:
-    raw = await service.run_import()
-    return Envelope(data=ImportRecordResponse(**raw))
+    if not await lock.try_acquire():
+        raise ConflictError("A Langfuse import is already running")
+    try:
+        prepared = await service.start_import(resume=resume)
+    except Exception:
+        await lock.release()
+        raise
+    # The lock travels with the job and is released when it finishes.
+    background_tasks.add_task(run_import_job, prepared, lock)
+    return Envelope(data=ImportRecordResponse(**import_record_to_dict(prepared.record)))
 
 
-@router.get("/imports/status")
+@router.get("/imports/status", response_model=ImportStatusResponse)
 async def get_import_status(
+    request: Request,
     service: MetricsService = Depends(get_metrics_service),
-) -> ImportStatusResponse:
+) -> Response:
     raw = await service.get_import_status()
     last_import_data = raw.get("lastImport")
-    return ImportStatusResponse(
+    status = ImportStatusResponse(
         lastImport=(ImportRecordResponse(**last_import_data) if last_import_data else None),
         lastStatus=raw.get("lastStatus"),
         counts=raw.get("counts", {}),
     )
+    return conditional_json_response(request, status)
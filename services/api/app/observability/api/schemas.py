@@ -23,6 +23,38 @@ class CostsResponse(BaseModel):
     daily: list[DailyCostEntry]
 
 
+# --- Cost attribution ---
+
+
+class AttributedCost(BaseModel):
+    scope: str
+    id: str
+    label: str | None
+    countObservations: int
+    inputUsage: int
+    outputUsage: int
+    totalUsage: int
+    totalCost: float
+
+
+class AttributedCostsResponse(BaseModel):
+    items: list[AttributedCost]
+
+
+class TraceLinkRequest(BaseModel):
+    run_id: str | None = None
+    correlation_id: str | None = None
+
+
+class TraceLinkResponse(BaseModel):
+    trace_id: str
+    run_id: str | None
+    correlation_id: str | None
+    agent_id: str | None
+    work_item_id: str | None
+    work_item_key: str | None
+
+
 # --- Requests ---
 
 
@@ -69,6 +101,9 @@ class ImportRecordResponse(BaseModel):
     to_timestamp: str
     status: str
     error_message: str | None = None
+    checkpoint_start_time: str | None = None
+    pages_imported: int = 0
+    requests_imported: int = 0
 
 
 class ImportStatusResponse(BaseModel):
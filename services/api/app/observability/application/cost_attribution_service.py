@@ -0,0 +1,53 @@
+from dataclasses import asdict
+
+from app.observability.application.ports import LangfuseRepositoryPort
+from app.observability.domain.models import CostAggregate, CostScope, TraceLink
+from app.shared.api.errors import NotFoundError, ValidationError
+
+_SCOPE_LABELS = {
+    CostScope.RUN: "run",
+    CostScope.AGENT: "agent",
+    CostScope.WORK_ITEM: "work item",
+}
+
+
+def _aggregate_to_dict(aggregate: CostAggregate) -> dict:
+    return {
+        "scope": aggregate.scope,
+        "id": aggregate.scope_id,
+        "label": aggregate.label,
+        "countObservations": aggregate.request_count,
+        "inputUsage": aggregate.input_tokens,
+        "outputUsage": aggregate.output_tokens,
+        "totalUsage": aggregate.total_tokens,
+        "totalCost": aggregate.total_cost,
+    }
+
+
+class CostAttributionService:
+    """Cost per run, agent and work item, read from precomputed attribution rows."""
+
+    def __init__(self, repo: LangfuseRepositoryPort) -> None:
+        self._repo = repo
+
+    async def link_trace(
+        self, trace_id: str, *, run_id: str | None, correlation_id: str | None
+    ) -> dict:
+        if not run_id and not correlation_id:
+            raise ValidationError("Either run_id or correlation_id is required")
+        await self._repo.upsert_trace_links(
+            [TraceLink(trace_id=trace_id, run_id=run_id, correlation_id=correlation_id)]
+        )
+        link = await self._repo.get_trace_link(trace_id)
+        if link is None:
+            raise NotFoundError(f"Trace link {trace_id} not found")
+        return asdict(link)
+
+    async def get_costs(self, scope: CostScope, key: str) -> dict:
+        aggregate = await self._repo.get_cost_attribution(scope, key)
+        if aggregate is None:
+            raise NotFoundError(f"No attributed cost for {_SCOPE_LABELS[scope]} {key}")
+        return _aggregate_to_dict(aggregate)
+
+    async def list_costs(self, scope: CostScope) -> list[dict]:
+        return [_aggregate_to_dict(a) for a in await self._repo.list_cost_attribution(scope)]
@@ -1,84 +1,264 @@
+import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from app.observability.application.ports import LangfuseClientPort, LangfuseRepositoryPort
-from app.observability.domain.models import DailyMetric, ImportRecord, LangfuseRequest
+from app.observability.domain.models import (
+    ImportRecord,
+    LangfuseRequest,
+    ObservationPage,
+    TraceLink,
+)
+from app.shared.lookup_cache import TtlCache
 
 logger = logging.getLogger(__name__)
 
 FULL_IMPORT_LOOKBACK_DAYS = 90
+DEFAULT_FETCH_CONCURRENCY = 4
+DEFAULT_SLICE_DAYS = 7
+_RESUMABLE_STATUSES = {"failed", "running"}
+# Observation metadata keys an instrumented agent sets to tie its trace to a run.
+_RUN_ID_METADATA_KEYS = ("mc_run_id", "run_id")
+_CORRELATION_ID_METADATA_KEYS = ("mc_correlation_id", "correlation_id")
+
+
+@dataclass
+class PreparedImport:
+    record: ImportRecord
+    from_timestamp: str | None
+
+
+@dataclass
+class _Slice:
+    start: str | None
+    end: str
+    cursor: str | None = None
+    done: bool = False
+    pages: int = 0
+    requests: int = 0
 
 
 class ImportService:
-    def __init__(self, repo: LangfuseRepositoryPort, client: LangfuseClientPort) -> None:
+    def __init__(
+        self,
+        repo: LangfuseRepositoryPort,
+        client: LangfuseClientPort,
+        *,
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        slice_days: int = DEFAULT_SLICE_DAYS,
+        cache: TtlCache[Any] | None = None,
+    ) -> None:
         self._repo = repo
         self._client = client
+        self._concurrency = concurrency
+        self._slice_days = slice_days
+        self._cache = cache
 
-    async def run_import(self) -> dict:
-        last_import = await self._repo.get_last_successful_import()
-        from_timestamp, from_date, to_date, to_timestamp, mode = self._resolve_import_range(
-            last_import
-        )
+    async def run_import(self, *, resume: bool = False) -> dict:
+        """Start and execute an import in one call (see ``start_import``)."""
+        prepared = await self.start_import(resume=resume)
+        return await self.execute_import(prepared)
 
+    async def start_import(self, *, resume: bool = False) -> PreparedImport:
+        """Create the ``running`` import record and resolve its fetch range.
+
+        With ``resume`` the latest import is reopened when it failed or was
+        interrupted, so ``execute_import`` continues from its checkpoint;
+        otherwise a new run is created.
+        """
+        prepared = await self._prepare_import(resume)
+        self._invalidate_cached_reads()
+        return prepared
+
+    async def _prepare_import(self, resume: bool) -> PreparedImport:
+        import_run = await self._find_resumable_import() if resume else None
+        if import_run is not None:
+            await self._repo.reopen_import_run(import_run.id)
+            import_run.status = "running"
+            import_run.finished_at = None
+            import_run.error_message = None
+            logger.info(
+                "Resuming Langfuse import %d from page %d",
+                import_run.id,
+                import_run.pages_imported + 1,
+            )
+            return PreparedImport(record=import_run, from_timestamp=import_run.from_timestamp)
+
+        last_import = await self._repo.get_last_successful_import()
+        from_timestamp, to_timestamp, mode = self._resolve_import_range(last_import)
         import_run = await self._repo.create_import_run(mode, from_timestamp, to_timestamp)
+        return PreparedImport(record=import_run, from_timestamp=from_timestamp)
 
-        try:
-            raw_metrics = await self._client.fetch_daily_metrics(from_date, to_date)
-            daily_metrics = self._transform_daily_metrics(raw_metrics)
-            await self._repo.upsert_daily_metrics(daily_metrics)
+    async def execute_import(self, prepared: PreparedImport) -> dict:
+        """Fetch and persist everything for a started import, then close the record.
 
-            raw_observations = await self._client.fetch_all_observations(from_timestamp)
-            requests = self._transform_observations(raw_observations)
-            await self._repo.upsert_requests(requests)
+        Cached dashboard reads are invalidated once the run has finished,
+        not per persisted page.
+        """
+        import_run = prepared.record
+        try:
+            await self._import_observations(import_run, prepared.from_timestamp)
 
             await self._repo.complete_import_run(import_run.id, "success")
 
             return {
-                **_import_record_to_dict(import_run),
+                **import_record_to_dict(import_run),
                 "finished_at": datetime.now(timezone.utc).isoformat(),
                 "status": "success",
+                "error_message": None,
             }
         except Exception as err:
             logger.exception("Langfuse import failed")
             error_message = str(err)
             await self._repo.complete_import_run(import_run.id, "failed", error_message)
             raise
+        finally:
+            self._invalidate_cached_reads()
+
+    async def fail_if_running(self, import_id: int, error_message: str) -> None:
+        """Close an import left ``running`` by a failure outside ``execute_import``."""
+        if await self._repo.fail_running_import_run(import_id, error_message):
+            logger.warning("Marked Langfuse import %d as failed", import_id)
+            self._invalidate_cached_reads()
+
+    def _invalidate_cached_reads(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+
+    async def _find_resumable_import(self) -> ImportRecord | None:
+        latest = await self._repo.get_latest_import()
+        if latest is None or latest.status not in _RESUMABLE_STATUSES:
+            return None
+        return latest
+
+    async def _import_observations(
+        self, import_run: ImportRecord, from_timestamp: str | None
+    ) -> None:
+        """Fetch time slices concurrently and persist their pages serially.
+
+        Fetchers hand pages to this coroutine through a bounded queue, so the
+        DB session is only used here and memory stays bounded to a few pages
+        however long the window is. The checkpoint written after each page
+        is the start of the oldest unfinished slice plus that slice's
+        cursor: everything before it is persisted, and a resumed run picks
+        up there. The checkpointed counters only cover that prefix too, so
+        later slices a resumed run fetches again are not counted twice.
+        """
+        slices = self._plan_slices(
+            import_run.checkpoint_start_time or from_timestamp, import_run.to_timestamp
+        )
+        if not slices:
+            return
+        slices[0].cursor = import_run.checkpoint_cursor
+        counted = (import_run.pages_imported, import_run.requests_imported)
+
+        queue: asyncio.Queue[tuple[_Slice, ObservationPage | Exception | None]] = asyncio.Queue(
+            maxsize=self._concurrency
+        )
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def fetch_slice(time_slice: _Slice) -> None:
+            try:
+                async with semaphore:
+                    async for page in self._client.iter_observation_pages(
+                        time_slice.start, cursor=time_slice.cursor, to_timestamp=time_slice.end
+                    ):
+                        await queue.put((time_slice, page))
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                await queue.put((time_slice, err))
+                return
+            await queue.put((time_slice, None))
+
+        fetchers = [asyncio.create_task(fetch_slice(time_slice)) for time_slice in slices]
+        try:
+            remaining = len(slices)
+            while remaining:
+                time_slice, item = await queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                if item is None:
+                    time_slice.done = True
+                    remaining -= 1
+                else:
+                    requests = self._transform_observations(item.data)
+                    await self._repo.upsert_trace_links(self._extract_trace_links(item.data))
+                    await self._repo.upsert_requests(requests)
+                    time_slice.cursor = item.next_cursor
+                    time_slice.pages += 1
+                    time_slice.requests += len(requests)
+                await self._checkpoint(import_run, slices, counted)
+        finally:
+            for fetcher in fetchers:
+                fetcher.cancel()
+            await asyncio.gather(*fetchers, return_exceptions=True)
+
+    async def _checkpoint(
+        self, import_run: ImportRecord, slices: list[_Slice], counted: tuple[int, int]
+    ) -> None:
+        """Persist the resume point and the counts of the pages before it.
+
+        ``counted`` holds the pages and requests the run had already
+        checkpointed before this attempt started.
+        """
+        head = next((i for i, time_slice in enumerate(slices) if not time_slice.done), None)
+        if head is None:
+            import_run.checkpoint_start_time = slices[-1].end
+            import_run.checkpoint_cursor = None
+            covered = slices
+        else:
+            import_run.checkpoint_start_time = slices[head].start
+            import_run.checkpoint_cursor = slices[head].cursor
+            covered = slices[: head + 1]
+        import_run.pages_imported = counted[0] + sum(time_slice.pages for time_slice in covered)
+        import_run.requests_imported = counted[1] + sum(
+            time_slice.requests for time_slice in covered
+        )
+        await self._repo.checkpoint_import_run(
+            import_run.id,
+            cursor=import_run.checkpoint_cursor,
+            high_water_start_time=import_run.checkpoint_start_time,
+            pages_imported=import_run.pages_imported,
+            requests_imported=import_run.requests_imported,
+        )
+
+    def _plan_slices(self, start: str | None, end: str) -> list[_Slice]:
+        """Split ``[start, end)`` into ``slice_days`` windows, oldest first.
+
+        A full import (no ``start``) gets one open-ended slice for everything
+        before the lookback window. Boundaries derive from ``end`` and
+        ``start`` only, so a resumed run re-plans the same slices.
+        """
+        end_dt = _parse_timestamp(end)
+        slices: list[_Slice] = []
+        if start is None:
+            slice_start = end_dt - timedelta(days=FULL_IMPORT_LOOKBACK_DAYS)
+            slices.append(_Slice(start=None, end=slice_start.isoformat()))
+        else:
+            slice_start = _parse_timestamp(start)
+        step = timedelta(days=self._slice_days)
+        while slice_start < end_dt:
+            slice_end = min(slice_start + step, end_dt)
+            slices.append(_Slice(start=slice_start.isoformat(), end=slice_end.isoformat()))
+            slice_start = slice_end
+        return slices
 
     @staticmethod
     def _resolve_import_range(
         last_import: ImportRecord | None,
-    ) -> tuple[str | None, str, str, str, str]:
-        """Return (from_timestamp, from_date, to_date, to_timestamp, mode)."""
-        now = datetime.now(timezone.utc)
-        to_timestamp = now.isoformat()
-        to_date = now.isoformat().split("T")[0]
+    ) -> tuple[str | None, str, str]:
+        """Return (from_timestamp, to_timestamp, mode)."""
+        to_timestamp = datetime.now(timezone.utc).isoformat()
 
         if last_import is not None:
             from_timestamp: str | None = last_import.to_timestamp
-            from_date = last_import.to_timestamp.split("T")[0]
             mode = "incremental"
         else:
             from_timestamp = None
-            lookback = now - timedelta(days=FULL_IMPORT_LOOKBACK_DAYS)
-            from_date = lookback.isoformat().split("T")[0]
             mode = "full"
 
-        return from_timestamp, from_date, to_date, to_timestamp, mode
-
-    @staticmethod
-    def _transform_daily_metrics(raw: list[dict]) -> list[DailyMetric]:
-        return [
-            DailyMetric(
-                date=row.get("time_dimension", "").split("T")[0],
-                model=row.get("providedModelName") or "unknown",
-                input_tokens=int(row.get("sum_inputTokens") or 0),
-                output_tokens=int(row.get("sum_outputTokens") or 0),
-                total_tokens=int(row.get("sum_totalTokens") or 0),
-                request_count=int(row.get("count_count") or 0),
-                total_cost=row.get("sum_totalCost") or 0,
-            )
-            for row in raw
-        ]
+        return from_timestamp, to_timestamp, mode
 
     @staticmethod
     def _transform_observations(raw: list[dict]) -> list[LangfuseRequest]:
@@ -109,8 +289,39 @@ class ImportService:
             )
         return results
 
+    @staticmethod
+    def _extract_trace_links(raw: list[dict]) -> list[TraceLink]:
+        links: list[TraceLink] = []
+        for obs in raw:
+            metadata = obs.get("metadata")
+            if not obs.get("traceId") or not isinstance(metadata, dict):
+                continue
+            run_id = _first_metadata_value(metadata, _RUN_ID_METADATA_KEYS)
+            correlation_id = _first_metadata_value(metadata, _CORRELATION_ID_METADATA_KEYS)
+            if run_id or correlation_id:
+                links.append(
+                    TraceLink(
+                        trace_id=obs["traceId"],
+                        run_id=run_id,
+                        correlation_id=correlation_id,
+                    )
+                )
+        return links
+
+
+def _first_metadata_value(metadata: dict, keys: tuple[str, ...]) -> str | None:
+    for key in keys:
+        value = metadata.get(key)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+
 
-def _import_record_to_dict(record: ImportRecord) -> dict:
+def import_record_to_dict(record: ImportRecord) -> dict:
     return {
         "id": record.id,
         "started_at": record.started_at,
@@ -120,4 +331,7 @@ def _import_record_to_dict(record: ImportRecord) -> dict:
         "to_timestamp": record.to_timestamp,
         "status": record.status,
         "error_message": record.error_message,
+        "checkpoint_start_time": record.checkpoint_start_time,
+        "pages_imported": record.pages_imported,
+        "requests_imported": record.requests_imported,
     }
@@ -1,61 +1,77 @@
-from datetime import datetime, timezone
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
+from app.observability.application.import_service import import_record_to_dict
 from app.observability.application.ports import LangfuseRepositoryPort
+from app.shared.api.errors import ValidationError
+from app.shared.lookup_cache import TtlCache
+
+_HOUR_FORMAT = "%Y-%m-%dT%H"
+
+
+def _parse_bound(value: str) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise ValidationError(f"Invalid date or timestamp: {value}") from exc
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _hour_range(from_str: str, to_str: str) -> tuple[str, str]:
+    """Map request bounds onto the half-open rollup hour range ``[from, to)``.
+
+    Timestamp bounds widen to whole hours (rollups are hourly). A date-only
+    ``to`` is inclusive, so the range runs to the start of the next day.
+    """
+    start = _parse_bound(from_str).replace(minute=0, second=0, microsecond=0)
+    end = _parse_bound(to_str)
+    if "T" not in to_str:
+        end += timedelta(days=1)
+    elif end != end.replace(minute=0, second=0, microsecond=0):
+        end = end.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    return start.strftime(_HOUR_FORMAT), end.strftime(_HOUR_FORMAT)
 
 
 class MetricsService:
-    def __init__(self, repo: LangfuseRepositoryPort) -> None:
+    """Dashboard reads. Costs, models and import status only change when an
+    import writes, so with a ``cache`` they are served from it until the
+    import service clears it."""
+
+    def __init__(self, repo: LangfuseRepositoryPort, cache: TtlCache[Any] | None = None) -> None:
         self._repo = repo
+        self._cache = cache
+
+    async def _cached(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        if self._cache is None:
+            return await compute()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        value = await compute()
+        self._cache.set(key, value)
+        return value
 
     async def get_costs(self, from_str: str, to_str: str) -> dict:
-        use_timestamps = "T" in from_str and "T" in to_str
-        if use_timestamps:
-            metrics = await self._repo.get_metrics_by_time_range(from_str, to_str)
-        else:
-            metrics = await self._repo.get_daily_metrics(from_str, to_str)
-
-        date_map: dict[str, dict] = {}
-        for m in metrics:
-            if m.date not in date_map:
-                date_map[m.date] = {
-                    "date": m.date,
-                    "totalCost": 0,
-                    "countObservations": 0,
-                    "usage": [],
-                }
-            entry = date_map[m.date]
-            entry["totalCost"] += m.total_cost
-            entry["countObservations"] += m.request_count
-            entry["usage"].append(
-                {
-                    "model": m.model,
-                    "inputUsage": m.input_tokens,
-                    "outputUsage": m.output_tokens,
-                    "totalUsage": m.total_tokens,
-                    "totalCost": m.total_cost,
-                    "countObservations": m.request_count,
-                }
-            )
+        from_hour, to_hour = _hour_range(from_str, to_str)
+        # Keyed by the resolved hour range, so "to=now" polls within an hour share an entry.
+        return await self._cached(
+            f"costs:{from_hour}:{to_hour}", lambda: self._load_costs(from_hour, to_hour)
+        )
 
-        daily = sorted(date_map.values(), key=lambda x: x["date"])
-        return {"daily": daily}
+    async def _load_costs(self, from_hour: str, to_hour: str) -> dict:
+        return {"daily": await self._repo.get_daily_costs(from_hour, to_hour)}
 
     async def get_import_status(self) -> dict:
+        return await self._cached("imports:status", self._load_import_status)
+
+    async def _load_import_status(self) -> dict:
         last_import = await self._repo.get_latest_import()
         counts = await self._repo.get_counts()
 
-        import_data = None
-        if last_import:
-            import_data = {
-                "id": last_import.id,
-                "started_at": last_import.started_at,
-                "finished_at": last_import.finished_at,
-                "mode": last_import.mode,
-                "from_timestamp": last_import.from_timestamp,
-                "to_timestamp": last_import.to_timestamp,
-                "status": last_import.status,
-                "error_message": last_import.error_message,
-            }
+        import_data = import_record_to_dict(last_import) if last_import else None
 
         return {
             "lastImport": import_data,
@@ -105,4 +121,4 @@ class MetricsService:
         }
 
     async def get_distinct_models(self) -> list[str]:
-        return await self._repo.get_distinct_models()
+        return await self._cached("requests:models", self._repo.get_distinct_models)
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
 
 from app.observability.domain.models import (
-    DailyMetric,
+    CostAggregate,
+    CostScope,
     ImportRecord,
     LangfuseRequest,
+    ObservationPage,
     PaginatedRequests,
+    TraceLink,
 )
 
 
@@ -23,19 +28,36 @@ class LangfuseRepositoryPort(ABC):
     ) -> None: ...
 
     @abstractmethod
-    async def get_latest_import(self) -> ImportRecord | None: ...
+    async def checkpoint_import_run(
+        self,
+        import_id: int,
+        *,
+        cursor: str | None,
+        high_water_start_time: str | None,
+        pages_imported: int,
+        requests_imported: int,
+    ) -> None: ...
 
     @abstractmethod
-    async def get_counts(self) -> dict[str, int]: ...
+    async def reopen_import_run(self, import_id: int) -> None: ...
 
     @abstractmethod
-    async def upsert_daily_metrics(self, metrics: list[DailyMetric]) -> None: ...
+    async def fail_running_import_run(self, import_id: int, error_message: str) -> bool:
+        """Mark the import failed if it is still ``running``; True when it was."""
 
     @abstractmethod
-    async def get_daily_metrics(self, from_date: str, to_date: str) -> list[DailyMetric]: ...
+    async def get_latest_import(self) -> ImportRecord | None: ...
 
     @abstractmethod
-    async def get_metrics_by_time_range(self, from_ts: str, to_ts: str) -> list[DailyMetric]: ...
+    async def get_counts(self) -> dict[str, int]: ...
+
+    @abstractmethod
+    async def get_daily_costs(self, from_hour: str, to_hour: str) -> list[dict[str, Any]]:
+        """Per-day, per-model cost breakdown over hourly rollups in ``[from_hour, to_hour)``.
+
+        Hours are ``YYYY-MM-DDTHH`` (UTC). Days come back in date order, each
+        with its models ordered by cost, already in the ``/costs`` response shape.
+        """
 
     @abstractmethod
     async def get_distinct_models(self) -> list[str]: ...
@@ -43,6 +65,24 @@ class LangfuseRepositoryPort(ABC):
     @abstractmethod
     async def upsert_requests(self, requests: list[LangfuseRequest]) -> None: ...
 
+    @abstractmethod
+    async def upsert_trace_links(self, links: list[TraceLink]) -> int:
+        """Store links (resolved to agent and work item) and re-attribute their requests.
+
+        Links that add nothing to what is stored are skipped; returns how
+        many changed.
+        """
+
+    @abstractmethod
+    async def get_trace_link(self, trace_id: str) -> TraceLink | None: ...
+
+    @abstractmethod
+    async def get_cost_attribution(self, scope: CostScope, key: str) -> CostAggregate | None:
+        """Totals for one run / agent / work item; ``key`` is its id or label."""
+
+    @abstractmethod
+    async def list_cost_attribution(self, scope: CostScope) -> list[CostAggregate]: ...
+
     @abstractmethod
     async def get_requests(
         self,
@@ -54,9 +94,27 @@ class LangfuseRepositoryPort(ABC):
     ) -> PaginatedRequests: ...
 
 
-class LangfuseClientPort(ABC):
+class ImportLockPort(ABC):
+    """Single-flight guard shared by every API process running imports."""
+
+    @abstractmethod
+    async def try_acquire(self) -> bool: ...
+
     @abstractmethod
-    async def fetch_daily_metrics(self, from_date: str, to_date: str) -> list[dict]: ...
+    async def release(self) -> None: ...
 
+
+class LangfuseClientPort(ABC):
     @abstractmethod
-    async def fetch_all_observations(self, from_timestamp: str | None = None) -> list[dict]: ...
+    def iter_observation_pages(
+        self,
+        from_timestamp: str | None = None,
+        cursor: str | None = None,
+        to_timestamp: str | None = None,
+    ) -> AsyncIterator[ObservationPage]:
+        """Yield GENERATION observations with ``from <= startTime < to``, one page at a time.
+
+        Each page carries the cursor of the page after it, so a caller can
+        checkpoint it and later restart the walk from there via ``cursor``
+        (with the same time bounds).
+        """
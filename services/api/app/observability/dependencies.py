@@ -1,27 +1,86 @@
+import logging
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.observability.application.import_service import ImportService
+from app.control_plane.dependencies import build_run_attribution
+from app.observability.application.cost_attribution_service import CostAttributionService
+from app.observability.application.import_service import ImportService, PreparedImport
 from app.observability.application.metrics_service import MetricsService
+from app.observability.application.ports import ImportLockPort, LangfuseClientPort
+from app.observability.infrastructure.repositories.import_lock import PgAdvisoryImportLock
 from app.observability.infrastructure.repositories.langfuse import DbLangfuseRepository
 from app.observability.infrastructure.sources.langfuse import HttpLangfuseClient
+from app.observability.infrastructure.sources.rate_limiter import TokenBucketRateLimiter
 from app.shared.api.deps import get_db
+from app.shared.db.session import get_async_engine, get_session_factory
+from app.shared.lookup_cache import observability_response_cache
+
+logger = logging.getLogger(__name__)
 
 
 async def get_metrics_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> MetricsService:
-    return MetricsService(DbLangfuseRepository(db))
+    return MetricsService(DbLangfuseRepository(db), cache=observability_response_cache)
 
 
-async def get_import_service(
-    db: AsyncSession = Depends(get_db),
-) -> ImportService:
-    repo = DbLangfuseRepository(db)
-    client = HttpLangfuseClient(
+async def get_cost_attribution_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> CostAttributionService:
+    return CostAttributionService(
+        DbLangfuseRepository(db, run_attribution=build_run_attribution(db))
+    )
+
+
+def build_langfuse_client() -> LangfuseClientPort:
+    return HttpLangfuseClient(
         host=settings.langfuse_host,
         public_key=settings.langfuse_public_key,
         secret_key=settings.langfuse_secret_key,
+        rate_limiter=TokenBucketRateLimiter(
+            rate=settings.langfuse_rate_limit_per_second,
+            burst=settings.langfuse_rate_limit_burst,
+        ),
+    )
+
+
+def build_import_service(db: AsyncSession) -> ImportService:
+    """Build ImportService — plain factory shared by the route and background jobs."""
+    repo = DbLangfuseRepository(
+        db,
+        upsert_chunk_size=settings.langfuse_import_upsert_chunk_size,
+        run_attribution=build_run_attribution(db),
     )
-    return ImportService(repo, client)
+    return ImportService(
+        repo,
+        build_langfuse_client(),
+        concurrency=settings.langfuse_import_concurrency,
+        slice_days=settings.langfuse_import_slice_days,
+        cache=observability_response_cache,
+    )
+
+
+async def get_import_service(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> ImportService:
+    return build_import_service(db)
+
+
+async def get_import_lock() -> ImportLockPort:
+    return PgAdvisoryImportLock(get_async_engine())
+
+
+async def run_import_job(prepared: PreparedImport, lock: ImportLockPort) -> None:
+    """Execute a started import in its own session, then release the import lock."""
+    try:
+        async with get_session_factory()() as db:
+            await build_import_service(db).execute_import(prepared)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.exception("Langfuse import job %d failed", prepared.record.id)
+        # Usually already marked failed by ImportService; covers failures outside it.
+        async with get_session_factory()() as db:
+            await build_import_service(db).fail_if_running(prepared.record.id, str(err))
+    finally:
+        await lock.release()
@@ -1,15 +1,5 @@
 from dataclasses import dataclass
-
-
-@dataclass
-class DailyMetric:
-    date: str
-    model: str
-    input_tokens: int
-    output_tokens: int
-    total_tokens: int
-    request_count: int
-    total_cost: float
+from enum import StrEnum
 
 
 @dataclass
@@ -22,6 +12,10 @@ class ImportRecord:
     to_timestamp: str
     status: str
     error_message: str | None = None
+    checkpoint_cursor: str | None = None
+    checkpoint_start_time: str | None = None
+    pages_imported: int = 0
+    requests_imported: int = 0
 
 
 @dataclass
@@ -39,7 +33,45 @@ class LangfuseRequest:
     latency_ms: int | None
 
 
+@dataclass
+class ObservationPage:
+    data: list[dict]
+    next_cursor: str | None
+
+
 @dataclass
 class PaginatedRequests:
     data: list[LangfuseRequest]
     total: int
+
+
+@dataclass
+class TraceLink:
+    """Ties a Langfuse trace to a control-plane run, agent and work item."""
+
+    trace_id: str
+    run_id: str | None = None
+    correlation_id: str | None = None
+    agent_id: str | None = None
+    work_item_id: str | None = None
+    work_item_key: str | None = None
+
+
+class CostScope(StrEnum):
+    RUN = "run"
+    AGENT = "agent"
+    WORK_ITEM = "work_item"
+
+
+@dataclass
+class CostAggregate:
+    """Precomputed cost totals for one run, agent or work item."""
+
+    scope: str
+    scope_id: str
+    label: str | None
+    request_count: int
+    input_tokens: int
+    output_tokens: int
+    total_tokens: int
+    total_cost: float
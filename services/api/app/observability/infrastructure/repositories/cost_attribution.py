@@ -0,0 +1,139 @@
+"""Helpers behind trace links and per-run / agent / work-item cost totals.
+
+Run, agent and work item come from control-plane dispatches through the shared
+``RunAttributionPort``, so observability never reads control-plane tables.
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import ColumnElement, Text, literal, null, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.functions import coalesce, count
+from sqlalchemy.sql.functions import max as sa_max
+from sqlalchemy.sql.functions import sum as sa_sum
+
+from app.observability.domain.models import CostScope, TraceLink
+from app.observability.infrastructure.tables import (
+    langfuse_cost_attribution,
+    langfuse_requests,
+    langfuse_trace_links,
+)
+from app.shared.ports import RunAttributionPort
+
+_r = langfuse_requests.c
+_l = langfuse_trace_links.c
+_a = langfuse_cost_attribution.c
+
+
+async def resolve_trace_links(
+    links: Sequence[TraceLink], attribution: RunAttributionPort
+) -> list[TraceLink]:
+    """Fill in run, agent and work item from the dispatch that started each trace's run.
+
+    Links naming a run are resolved by run id, the rest by correlation id;
+    each kind is looked up in one batch.
+    """
+    by_run = await attribution.by_run_ids(sorted({link.run_id for link in links if link.run_id}))
+    by_correlation = await attribution.by_correlation_ids(
+        sorted({link.correlation_id for link in links if not link.run_id and link.correlation_id})
+    )
+    resolved: list[TraceLink] = []
+    for link in links:
+        if link.run_id:
+            found = by_run.get(link.run_id)
+        elif link.correlation_id:
+            found = by_correlation.get(link.correlation_id)
+            if found is None:
+                resolved.append(
+                    TraceLink(trace_id=link.trace_id, correlation_id=link.correlation_id)
+                )
+                continue
+        else:
+            found = None
+        if found is None:
+            resolved.append(link)
+            continue
+        resolved.append(
+            TraceLink(
+                trace_id=link.trace_id,
+                run_id=found.run_id,
+                correlation_id=link.correlation_id or found.correlation_id,
+                agent_id=found.agent_id,
+                work_item_id=found.work_item_id,
+                work_item_key=found.work_item_key,
+            )
+        )
+    return resolved
+
+
+async def apply_cost_deltas(db: AsyncSession, where: ColumnElement[bool], sign: int) -> None:
+    """Add (``sign=1``) or subtract (``sign=-1``) the linked requests matching ``where``.
+
+    Callers subtract a set of requests before changing them or their links
+    and add them back afterwards, so totals move by exactly the change.
+    """
+    contributions = (
+        select(
+            _l.run_id,
+            _l.agent_id,
+            _l.work_item_id,
+            _l.work_item_key,
+            _r.input_tokens,
+            _r.output_tokens,
+            _r.total_tokens,
+            _r.cost,
+        )
+        .select_from(langfuse_requests.join(langfuse_trace_links, _l.trace_id == _r.trace_id))
+        .where(where)
+        .cte("contributions")
+    )
+    c = contributions.c
+
+    def per_scope(scope: CostScope, scope_id: ColumnElement, label: ColumnElement):
+        return (
+            select(
+                literal(scope.value, Text).label("scope"),
+                scope_id.label("scope_id"),
+                label.label("label"),
+                (sa_sum(c.input_tokens) * sign).label("input_tokens"),
+                (sa_sum(c.output_tokens) * sign).label("output_tokens"),
+                (sa_sum(c.total_tokens) * sign).label("total_tokens"),
+                (count() * sign).label("request_count"),
+                (coalesce(sa_sum(c.cost), 0) * sign).label("total_cost"),
+            )
+            .where(scope_id.isnot(None))
+            .group_by(scope_id)
+        )
+
+    deltas = union_all(
+        per_scope(CostScope.RUN, c.run_id, null()),
+        per_scope(CostScope.AGENT, c.agent_id, null()),
+        per_scope(CostScope.WORK_ITEM, c.work_item_id, sa_max(c.work_item_key)),
+    )
+    stmt = pg_insert(langfuse_cost_attribution).from_select(
+        [
+            "scope",
+            "scope_id",
+            "label",
+            "input_tokens",
+            "output_tokens",
+            "total_tokens",
+            "request_count",
+            "total_cost",
+        ],
+        deltas,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[_a.scope, _a.scope_id],
+        set_={
+            "label": coalesce(stmt.excluded.label, _a.label),
+            "input_tokens": _a.input_tokens + stmt.excluded.input_tokens,
+            "output_tokens": _a.output_tokens + stmt.excluded.output_tokens,
+            "total_tokens": _a.total_tokens + stmt.excluded.total_tokens,
+            "request_count": _a.request_count + stmt.excluded.request_count,
+            "total_cost": _a.total_cost + stmt.excluded.total_cost,
+        },
+    )
+    await db.execute(stmt)
+    await db.execute(langfuse_cost_attribution.delete().where(_a.request_count <= 0))
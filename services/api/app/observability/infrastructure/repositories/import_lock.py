@@ -0,0 +1,52 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.observability.application.ports import ImportLockPort
+
+# Arbitrary application-wide key for pg_try_advisory_lock ("MCLF").
+LANGFUSE_IMPORT_LOCK_KEY = 0x4D434C46
+
+
+class PgAdvisoryImportLock(ImportLockPort):
+    """Session-level Postgres advisory lock held on a dedicated connection.
+
+    The connection stays checked out from acquire to release, so the lock
+    outlives the request that took it and is handed over to the background
+    import. If the process dies, Postgres drops the lock with the connection.
+    """
+
+    def __init__(self, engine: AsyncEngine, *, key: int = LANGFUSE_IMPORT_LOCK_KEY) -> None:
+        self._engine = engine
+        self._key = key
+        self._conn: AsyncConnection | None = None
+
+    async def try_acquire(self) -> bool:
+        if self._conn is not None:
+            return True
+        conn = await self._engine.connect()
+        try:
+            result = await conn.execute(select(func.pg_try_advisory_lock(self._key)))
+            acquired = bool(result.scalar())
+            await conn.commit()
+        except Exception:
+            await conn.close()
+            raise
+        if not acquired:
+            await conn.close()
+            return False
+        self._conn = conn
+        return True
+
+    async def release(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            await conn.execute(select(func.pg_advisory_unlock(self._key)))
+            await conn.commit()
+        except Exception:
+            # Dropping the physical connection is what frees the lock now.
+            await conn.invalidate()
+            raise
+        finally:
+            await conn.close()
@@ -1,7 +1,20 @@
-from datetime import datetime, timezone
-from typing import Any
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any, TypeVar
 
-from sqlalchemy import Row, and_, func, literal_column, select, update
+from sqlalchemy import (
+    Row,
+    and_,
+    delete,
+    exists,
+    func,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.functions import coalesce, count
@@ -9,20 +22,50 @@ from sqlalchemy.sql.functions import sum as sa_sum
 
 from app.observability.application.ports import LangfuseRepositoryPort
 from app.observability.domain.models import (
-    DailyMetric,
+    CostAggregate,
+    CostScope,
     ImportRecord,
     LangfuseRequest,
     PaginatedRequests,
+    TraceLink,
+)
+from app.observability.infrastructure.repositories.cost_attribution import (
+    apply_cost_deltas,
+    resolve_trace_links,
 )
 from app.observability.infrastructure.tables import (
     imports,
-    langfuse_daily_metrics,
+    langfuse_cost_attribution,
+    langfuse_hourly_costs,
+    langfuse_models,
     langfuse_requests,
+    langfuse_trace_links,
 )
+from app.shared.ports import RunAttributionPort
 
 _i = imports.c
-_m = langfuse_daily_metrics.c
 _r = langfuse_requests.c
+_h = langfuse_hourly_costs.c
+_lm = langfuse_models.c
+_l = langfuse_trace_links.c
+_a = langfuse_cost_attribution.c
+
+# started_at is an ISO-8601 UTC string, so its first 13 chars are the hour bucket.
+_HOUR_PREFIX_LEN = 13
+_HOUR_FORMAT = "%Y-%m-%dT%H"
+
+DEFAULT_UPSERT_CHUNK_SIZE = 1000
+
+T = TypeVar("T")
+
+
+def _chunked(rows: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _next_hour(hour: str) -> str:
+    return (datetime.strptime(hour, _HOUR_FORMAT) + timedelta(hours=1)).strftime(_HOUR_FORMAT)
 
 
 def _row_to_import(row: Row[Any]) -> ImportRecord:
@@ -35,21 +78,47 @@ def _row_to_import(row: Row[Any]) -> ImportRecord:
         to_timestamp=row.to_timestamp,
         status=row.status,
         error_message=row.error_message,
+        checkpoint_cursor=row.checkpoint_cursor,
+        checkpoint_start_time=row.checkpoint_start_time,
+        pages_imported=row.pages_imported,
+        requests_imported=row.requests_imported,
     )
 
 
-def _row_to_daily_metric(row: Row[Any]) -> DailyMetric:
-    return DailyMetric(
-        date=row.date,
-        model=row.model,
+def _row_to_trace_link(row: Row[Any]) -> TraceLink:
+    return TraceLink(
+        trace_id=row.trace_id,
+        run_id=row.run_id,
+        correlation_id=row.correlation_id,
+        agent_id=row.agent_id,
+        work_item_id=row.work_item_id,
+        work_item_key=row.work_item_key,
+    )
+
+
+def _row_to_cost_aggregate(row: Row[Any]) -> CostAggregate:
+    return CostAggregate(
+        scope=row.scope,
+        scope_id=row.scope_id,
+        label=row.label,
+        request_count=row.request_count,
         input_tokens=row.input_tokens,
         output_tokens=row.output_tokens,
         total_tokens=row.total_tokens,
-        request_count=row.request_count,
         total_cost=row.total_cost,
     )
 
 
+def _link_is_current(current: TraceLink | None, link: TraceLink) -> bool:
+    """Whether a resolved stored link already covers what ``link`` asserts."""
+    if current is None or current.agent_id is None:
+        return False
+    return link.run_id in (None, current.run_id) and link.correlation_id in (
+        None,
+        current.correlation_id,
+    )
+
+
 def _row_to_langfuse_request(row: Row[Any]) -> LangfuseRequest:
     return LangfuseRequest(
         id=row.id,
@@ -67,8 +136,16 @@ def _row_to_langfuse_request(row: Row[Any]) -> LangfuseRequest:
 
 
 class DbLangfuseRepository(LangfuseRepositoryPort):
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        upsert_chunk_size: int = DEFAULT_UPSERT_CHUNK_SIZE,
+        run_attribution: RunAttributionPort | None = None,
+    ) -> None:
         self._db = db
+        self._upsert_chunk_size = upsert_chunk_size
+        self._run_attribution = run_attribution
 
     async def get_last_successful_import(self) -> ImportRecord | None:
         result = await self._db.execute(
@@ -119,100 +196,159 @@ class DbLangfuseRepository(LangfuseRepositoryPort):
         )
         await self._db.commit()
 
+    async def checkpoint_import_run(
+        self,
+        import_id: int,
+        *,
+        cursor: str | None,
+        high_water_start_time: str | None,
+        pages_imported: int,
+        requests_imported: int,
+    ) -> None:
+        await self._db.execute(
+            update(imports)
+            .where(_i.id == import_id)
+            .values(
+                checkpoint_cursor=cursor,
+                checkpoint_start_time=high_water_start_time,
+                pages_imported=pages_imported,
+                requests_imported=requests_imported,
+            )
+        )
+        await self._db.commit()
+
+    async def reopen_import_run(self, import_id: int) -> None:
+        await self._db.execute(
+            update(imports)
+            .where(_i.id == import_id)
+            .values(finished_at=None, status="running", error_message=None)
+        )
+        await self._db.commit()
+
+    async def fail_running_import_run(self, import_id: int, error_message: str) -> bool:
+        result = await self._db.execute(
+            update(imports)
+            .where(_i.id == import_id, _i.status == "running")
+            .values(
+                finished_at=datetime.now(timezone.utc).isoformat(),
+                status="failed",
+                error_message=error_message,
+            )
+            .returning(_i.id)
+        )
+        failed = result.first() is not None
+        await self._db.commit()
+        return failed
+
     async def get_latest_import(self) -> ImportRecord | None:
         result = await self._db.execute(select(imports).order_by(_i.started_at.desc()).limit(1))
         row = result.first()
         return _row_to_import(row) if row else None
 
     async def get_counts(self) -> dict[str, int]:
-        metrics_result = await self._db.execute(select(count()).select_from(langfuse_daily_metrics))
+        metrics_result = await self._db.execute(select(count()).select_from(langfuse_hourly_costs))
         requests_result = await self._db.execute(select(count()).select_from(langfuse_requests))
         return {
             "metrics": metrics_result.scalar() or 0,
             "requests": requests_result.scalar() or 0,
         }
 
-    async def upsert_daily_metrics(self, metrics: list[DailyMetric]) -> None:
-        if not metrics:
-            return
-        for m in metrics:
-            stmt = pg_insert(langfuse_daily_metrics).values(
-                date=m.date,
-                model=m.model,
-                input_tokens=m.input_tokens,
-                output_tokens=m.output_tokens,
-                total_tokens=m.total_tokens,
-                request_count=m.request_count,
-                total_cost=m.total_cost,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=[_m.date, _m.model],
-                set_={
-                    "input_tokens": stmt.excluded.input_tokens,
-                    "output_tokens": stmt.excluded.output_tokens,
-                    "total_tokens": stmt.excluded.total_tokens,
-                    "request_count": stmt.excluded.request_count,
-                    "total_cost": stmt.excluded.total_cost,
-                },
-            )
-            await self._db.execute(stmt)
-        await self._db.commit()
-
-    async def get_daily_metrics(self, from_date: str, to_date: str) -> list[DailyMetric]:
-        result = await self._db.execute(
-            select(langfuse_daily_metrics)
-            .where(and_(_m.date >= from_date, _m.date <= to_date))
-            .order_by(_m.date.asc(), _m.model.asc())
-        )
-        return [_row_to_daily_metric(row) for row in result.all()]
-
-    async def get_metrics_by_time_range(self, from_ts: str, to_ts: str) -> list[DailyMetric]:
-        date_expr = func.substr(_r.started_at, 1, 10).label("date")
-        result = await self._db.execute(
+    async def get_daily_costs(self, from_hour: str, to_hour: str) -> list[dict[str, Any]]:
+        date_expr = func.substr(_h.hour, 1, 10).label("date")
+        per_model = (
             select(
                 date_expr,
-                _r.model,
-                sa_sum(_r.input_tokens).label("input_tokens"),
-                sa_sum(_r.output_tokens).label("output_tokens"),
-                sa_sum(_r.total_tokens).label("total_tokens"),
-                count().label("request_count"),
-                coalesce(sa_sum(_r.cost), 0).label("total_cost"),
+                _h.model,
+                sa_sum(_h.input_tokens).label("input_tokens"),
+                sa_sum(_h.output_tokens).label("output_tokens"),
+                sa_sum(_h.total_tokens).label("total_tokens"),
+                sa_sum(_h.request_count).label("request_count"),
+                sa_sum(_h.total_cost).label("total_cost"),
             )
-            .where(
-                and_(
-                    _r.started_at >= from_ts,
-                    _r.started_at < to_ts,
-                    _r.model.isnot(None),
-                )
+            .where(and_(_h.hour >= from_hour, _h.hour < to_hour))
+            .group_by(literal_column("date"), _h.model)
+            .subquery("per_model")
+        )
+        p = per_model.c
+        usage = func.json_build_object(
+            "model",
+            p.model,
+            "inputUsage",
+            p.input_tokens,
+            "outputUsage",
+            p.output_tokens,
+            "totalUsage",
+            p.total_tokens,
+            "totalCost",
+            p.total_cost,
+            "countObservations",
+            p.request_count,
+        )
+        per_day = (
+            select(
+                p.date,
+                sa_sum(p.total_cost).label("total_cost"),
+                sa_sum(p.request_count).label("request_count"),
+                func.json_agg(aggregate_order_by(usage, p.total_cost.desc(), p.model.asc())).label(
+                    "usage"
+                ),
             )
-            .group_by(literal_column("date"), _r.model)
-            .order_by(literal_column("date").asc(), literal_column("total_cost").desc())
+            .group_by(p.date)
+            .subquery("per_day")
+        )
+        d = per_day.c
+        day = func.json_build_object(
+            "date",
+            d.date,
+            "totalCost",
+            d.total_cost,
+            "countObservations",
+            d.request_count,
+            "usage",
+            d.usage,
         )
-        return [_row_to_daily_metric(row) for row in result.all()]
-
-    async def get_distinct_models(self) -> list[str]:
         result = await self._db.execute(
-            select(_r.model).where(_r.model.isnot(None)).distinct().order_by(_r.model.asc())
+            select(func.json_agg(aggregate_order_by(day, d.date.asc())))
         )
+        return result.scalar() or []
+
+    async def get_distinct_models(self) -> list[str]:
+        result = await self._db.execute(select(_lm.model).order_by(_lm.model.asc()))
         return [str(row[0]) for row in result.all()]
 
     async def upsert_requests(self, requests: list[LangfuseRequest]) -> None:
         if not requests:
             return
-        for r in requests:
-            stmt = pg_insert(langfuse_requests).values(
-                id=r.id,
-                trace_id=r.trace_id,
-                name=r.name,
-                model=r.model,
-                started_at=r.started_at,
-                finished_at=r.finished_at,
-                input_tokens=r.input_tokens,
-                output_tokens=r.output_tokens,
-                total_tokens=r.total_tokens,
-                cost=r.cost,
-                latency_ms=r.latency_ms,
-            )
+        rows = {
+            r.id: {
+                "id": r.id,
+                "trace_id": r.trace_id,
+                "name": r.name,
+                "model": r.model,
+                "started_at": r.started_at,
+                "finished_at": r.finished_at,
+                "input_tokens": r.input_tokens,
+                "output_tokens": r.output_tokens,
+                "total_tokens": r.total_tokens,
+                "cost": r.cost,
+                "latency_ms": r.latency_ms,
+            }
+            for r in requests
+        }
+        # Buckets and models the rows move out of need refreshing as well as
+        # the ones they land in.
+        buckets, previous_models = await self._rollup_keys_of(list(rows))
+        buckets.update(
+            (row["started_at"][:_HOUR_PREFIX_LEN], row["model"])
+            for row in rows.values()
+            if row["started_at"] and row["model"]
+        )
+        models = {row["model"] for row in rows.values() if row["model"]}
+        request_ids = list(rows)
+        for id_chunk in _chunked(request_ids, self._upsert_chunk_size):
+            await apply_cost_deltas(self._db, _r.id.in_(id_chunk), -1)
+        for chunk in _chunked(list(rows.values()), self._upsert_chunk_size):
+            stmt = pg_insert(langfuse_requests).values(list(chunk))
             stmt = stmt.on_conflict_do_update(
                 index_elements=[_r.id],
                 set_={
@@ -229,8 +365,166 @@ class DbLangfuseRepository(LangfuseRepositoryPort):
                 },
             )
             await self._db.execute(stmt)
+        for id_chunk in _chunked(request_ids, self._upsert_chunk_size):
+            await apply_cost_deltas(self._db, _r.id.in_(id_chunk), 1)
+        await self._refresh_hourly_costs(buckets)
+        await self._refresh_models(models, previous_models - models)
         await self._db.commit()
 
+    async def upsert_trace_links(self, links: list[TraceLink]) -> int:
+        if not links:
+            return 0
+        by_trace = {link.trace_id: link for link in links}
+        current: dict[str, TraceLink] = {}
+        for chunk in _chunked(list(by_trace), self._upsert_chunk_size):
+            result = await self._db.execute(
+                select(langfuse_trace_links).where(_l.trace_id.in_(chunk))
+            )
+            current.update((row.trace_id, _row_to_trace_link(row)) for row in result.all())
+
+        if self._run_attribution is None:
+            raise RuntimeError("DbLangfuseRepository needs run_attribution to link traces")
+        pending = [
+            link
+            for link in by_trace.values()
+            if not _link_is_current(current.get(link.trace_id), link)
+        ]
+        changed: list[TraceLink] = []
+        for link_chunk in _chunked(pending, self._upsert_chunk_size):
+            for resolved in await resolve_trace_links(link_chunk, self._run_attribution):
+                if resolved != current.get(resolved.trace_id):
+                    changed.append(resolved)
+        if not changed:
+            return 0
+
+        # Move the traces' already-imported requests from their old attribution to the new one.
+        trace_ids = [link.trace_id for link in changed]
+        for chunk in _chunked(trace_ids, self._upsert_chunk_size):
+            await apply_cost_deltas(self._db, _r.trace_id.in_(chunk), -1)
+        linked_at = datetime.now(timezone.utc).isoformat()
+        for link_chunk in _chunked(changed, self._upsert_chunk_size):
+            stmt = pg_insert(langfuse_trace_links).values(
+                [{**vars(link), "linked_at": linked_at} for link in link_chunk]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[_l.trace_id],
+                set_={
+                    "run_id": stmt.excluded.run_id,
+                    "correlation_id": stmt.excluded.correlation_id,
+                    "agent_id": stmt.excluded.agent_id,
+                    "work_item_id": stmt.excluded.work_item_id,
+                    "work_item_key": stmt.excluded.work_item_key,
+                    "linked_at": stmt.excluded.linked_at,
+                },
+            )
+            await self._db.execute(stmt)
+        for chunk in _chunked(trace_ids, self._upsert_chunk_size):
+            await apply_cost_deltas(self._db, _r.trace_id.in_(chunk), 1)
+        await self._db.commit()
+        return len(changed)
+
+    async def get_trace_link(self, trace_id: str) -> TraceLink | None:
+        result = await self._db.execute(select(langfuse_trace_links).where(_l.trace_id == trace_id))
+        row = result.first()
+        return _row_to_trace_link(row) if row else None
+
+    async def get_cost_attribution(self, scope: CostScope, key: str) -> CostAggregate | None:
+        result = await self._db.execute(
+            select(langfuse_cost_attribution)
+            .where(and_(_a.scope == scope, or_(_a.scope_id == key, _a.label == key)))
+            .order_by((_a.scope_id == key).desc())
+            .limit(1)
+        )
+        row = result.first()
+        return _row_to_cost_aggregate(row) if row else None
+
+    async def list_cost_attribution(self, scope: CostScope) -> list[CostAggregate]:
+        result = await self._db.execute(
+            select(langfuse_cost_attribution)
+            .where(_a.scope == scope)
+            .order_by(_a.total_cost.desc(), _a.scope_id.asc())
+        )
+        return [_row_to_cost_aggregate(row) for row in result.all()]
+
+    async def _rollup_keys_of(
+        self, request_ids: list[str]
+    ) -> tuple[set[tuple[str, str]], set[str]]:
+        """Hour buckets and models the stored versions of these requests count towards."""
+        hour_expr = func.substr(_r.started_at, 1, _HOUR_PREFIX_LEN)
+        buckets: set[tuple[str, str]] = set()
+        models: set[str] = set()
+        for chunk in _chunked(request_ids, self._upsert_chunk_size):
+            result = await self._db.execute(
+                select(hour_expr, _r.model)
+                .where(and_(_r.id.in_(chunk), _r.model.isnot(None)))
+                .distinct()
+            )
+            for hour, model in result.all():
+                models.add(str(model))
+                if hour is not None:
+                    buckets.add((str(hour), str(model)))
+        return buckets, models
+
+    async def _refresh_models(self, seen: set[str], dropped: set[str]) -> None:
+        if seen:
+            await self._db.execute(
+                pg_insert(langfuse_models)
+                .values([{"model": model} for model in sorted(seen)])
+                .on_conflict_do_nothing(index_elements=[_lm.model])
+            )
+        if dropped:
+            await self._db.execute(
+                delete(langfuse_models).where(
+                    and_(
+                        _lm.model.in_(sorted(dropped)),
+                        ~exists().where(_r.model == _lm.model),
+                    )
+                )
+            )
+
+    async def _refresh_hourly_costs(self, buckets: set[tuple[str, str]]) -> None:
+        """Recompute the given (hour, model) rollup rows from langfuse_requests."""
+        hour_expr = func.substr(_r.started_at, 1, _HOUR_PREFIX_LEN)
+        for chunk in _chunked(sorted(buckets), self._upsert_chunk_size):
+            hours = [hour for hour, _ in chunk]
+            await self._db.execute(
+                delete(langfuse_hourly_costs).where(tuple_(_h.hour, _h.model).in_(chunk))
+            )
+            totals = (
+                select(
+                    hour_expr,
+                    _r.model,
+                    sa_sum(_r.input_tokens),
+                    sa_sum(_r.output_tokens),
+                    sa_sum(_r.total_tokens),
+                    count(),
+                    coalesce(sa_sum(_r.cost), 0),
+                )
+                .where(
+                    and_(
+                        # Prunes by started_at range before the tuple match.
+                        _r.started_at >= min(hours),
+                        _r.started_at < _next_hour(max(hours)),
+                        tuple_(hour_expr, _r.model).in_(chunk),
+                    )
+                )
+                .group_by(hour_expr, _r.model)
+            )
+            await self._db.execute(
+                langfuse_hourly_costs.insert().from_select(
+                    [
+                        "hour",
+                        "model",
+                        "input_tokens",
+                        "output_tokens",
+                        "total_tokens",
+                        "request_count",
+                        "total_cost",
+                    ],
+                    totals,
+                )
+            )
+
     async def get_requests(
         self,
         page: int,
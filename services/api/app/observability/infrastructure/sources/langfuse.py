@@ -1,98 +1,114 @@
-import asyncio
 import base64
-import json
 import logging
+import time
+from collections.abc import AsyncIterator
 
 import httpx
 
 from app.observability.application.ports import LangfuseClientPort
+from app.observability.domain.models import ObservationPage
+from app.observability.infrastructure.sources.rate_limiter import TokenBucketRateLimiter
+from app.shared.http_clients import get_langfuse_http_client
+from app.shared.logging import log_event
 
 logger = logging.getLogger(__name__)
 
 OBSERVATIONS_PAGE_SIZE = 1000
 MAX_RETRIES = 3
 BASE_RETRY_DELAY_S = 1.0
+DEFAULT_RATE_LIMIT_PER_SECOND = 5.0
+DEFAULT_RATE_LIMIT_BURST = 10
 
 
 class HttpLangfuseClient(LangfuseClientPort):
-    def __init__(self, host: str, public_key: str, secret_key: str) -> None:
+    def __init__(
+        self,
+        host: str,
+        public_key: str,
+        secret_key: str,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self._host = host.rstrip("/")
         credentials = f"{public_key}:{secret_key}"
         self._auth_header = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+        self._rate_limiter = rate_limiter or TokenBucketRateLimiter(
+            rate=DEFAULT_RATE_LIMIT_PER_SECOND, burst=DEFAULT_RATE_LIMIT_BURST
+        )
+        self._http_client = http_client
 
-    async def fetch_daily_metrics(self, from_date: str, to_date: str) -> list[dict]:
-        query = {
-            "view": "observations",
-            "metrics": [
-                {"measure": "totalCost", "aggregation": "sum"},
-                {"measure": "inputTokens", "aggregation": "sum"},
-                {"measure": "outputTokens", "aggregation": "sum"},
-                {"measure": "totalTokens", "aggregation": "sum"},
-                {"measure": "count", "aggregation": "count"},
-            ],
-            "dimensions": [{"field": "providedModelName"}],
-            "timeDimension": {"granularity": "day"},
-            "fromTimestamp": f"{from_date}T00:00:00Z",
-            "toTimestamp": f"{to_date}T23:59:59Z",
-            "filters": [],
-        }
-
-        url = f"{self._host}/api/public/metrics"
-        params = {"query": json.dumps(query)}
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            res = await self._fetch_with_retry(client, url, params, "metrics")
-            res.raise_for_status()
-            data = res.json()
-            return data.get("data", [])
+    def _client(self) -> httpx.AsyncClient:
+        # Resolved per call so a client recycled by the app lifespan is picked up.
+        return self._http_client or get_langfuse_http_client()
 
-    async def fetch_all_observations(self, from_timestamp: str | None = None) -> list[dict]:
-        all_observations: list[dict] = []
-        cursor: str | None = None
+    def iter_observation_pages(
+        self,
+        from_timestamp: str | None = None,
+        cursor: str | None = None,
+        to_timestamp: str | None = None,
+    ) -> AsyncIterator[ObservationPage]:
+        return self._observation_pages(from_timestamp, cursor, to_timestamp)
+
+    async def _observation_pages(
+        self,
+        from_timestamp: str | None,
+        cursor: str | None,
+        to_timestamp: str | None,
+    ) -> AsyncIterator[ObservationPage]:
         page_num = 0
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            while True:
-                params: dict[str, str] = {
-                    "type": "GENERATION",
-                    "limit": str(OBSERVATIONS_PAGE_SIZE),
-                    "fields": "core,basic,usage,model",
-                }
-                if from_timestamp:
-                    params["fromStartTime"] = from_timestamp
-                if cursor:
-                    params["cursor"] = cursor
-
-                page_num += 1
-                url = f"{self._host}/api/public/v2/observations"
-                res = await self._fetch_with_retry(
-                    client, url, params, f"observations (page {page_num})"
-                )
-                res.raise_for_status()
-
-                body = res.json()
-                data = body.get("data", [])
-                all_observations.extend(data)
-
-                meta = body.get("meta", {})
-                next_cursor = meta.get("cursor") if meta else None
-                if not next_cursor or not data:
-                    break
-                cursor = next_cursor
-
-        return all_observations
+        while True:
+            params: dict[str, str] = {
+                "type": "GENERATION",
+                "limit": str(OBSERVATIONS_PAGE_SIZE),
+                "fields": "core,basic,usage,model,metadata",
+            }
+            if from_timestamp:
+                params["fromStartTime"] = from_timestamp
+            if to_timestamp:
+                params["toStartTime"] = to_timestamp
+            if cursor:
+                params["cursor"] = cursor
+
+            page_num += 1
+            url = f"{self._host}/api/public/v2/observations"
+            res = await self._fetch_with_retry(url, params, f"observations (page {page_num})")
+            res.raise_for_status()
+
+            body = res.json()
+            data = body.get("data", [])
+            meta = body.get("meta", {})
+            next_cursor = meta.get("cursor") if meta else None
+            if data:
+                yield ObservationPage(data=data, next_cursor=next_cursor or None)
+
+            if not next_cursor or not data:
+                break
+            cursor = next_cursor
 
     async def _fetch_with_retry(
         self,
-        client: httpx.AsyncClient,
         url: str,
         params: dict,
         label: str,
     ) -> httpx.Response:
         headers = {"Authorization": self._auth_header}
+        client = self._client()
 
         for attempt in range(MAX_RETRIES + 1):
+            await self._rate_limiter.acquire()
+            started = time.perf_counter()
             res = await client.get(url, params=params, headers=headers)
+            log_event(
+                logger,
+                level=logging.INFO,
+                event="observability.langfuse.request",
+                label=label,
+                status_code=res.status_code,
+                http_version=res.http_version,
+                attempt=attempt + 1,
+                duration_ms=round((time.perf_counter() - started) * 1000, 1),
+            )
 
             if res.status_code != 429 or attempt == MAX_RETRIES:
                 return res
@@ -101,12 +117,13 @@ class HttpLangfuseClient(LangfuseClientPort):
             delay = float(retry_after) if retry_after else BASE_RETRY_DELAY_S * (2**attempt)
 
             logger.info(
-                "[Langfuse] %s returned 429, retrying in %.1fs (attempt %d/%d)",
+                "[Langfuse] %s returned 429, pausing all requests for %.1fs (attempt %d/%d)",
                 label,
                 delay,
                 attempt + 1,
                 MAX_RETRIES,
             )
-            await asyncio.sleep(delay)
+            # Pausing the shared bucket backs off every concurrent fetcher, not just this one.
+            self._rate_limiter.pause(delay)
 
         raise RuntimeError(f"[Langfuse] {label} exceeded max retries")
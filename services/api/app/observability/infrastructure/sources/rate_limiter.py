@@ -0,0 +1,52 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+
+class TokenBucketRateLimiter:
+    """Async token bucket shared by every request a Langfuse client makes.
+
+    ``rate`` tokens are added per second up to ``burst``; ``acquire`` waits
+    for a token, so concurrent fetchers together stay under the limit.
+    ``pause`` empties the bucket and holds every caller back until the
+    delay passes, which is how a 429 slows all fetchers at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._rate = rate
+        self._burst = float(burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._paused_until:
+                    await self._sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await self._sleep((1 - self._tokens) / self._rate)
+
+    def pause(self, delay_s: float) -> None:
+        now = self._clock()
+        self._paused_until = max(self._paused_until, now + delay_s)
+        self._tokens = 0.0
+        self._updated_at = now
@@ -1,4 +1,4 @@
-from sqlalchemy import REAL, Column, Integer, Table, Text
+from sqlalchemy import REAL, Column, Double, Index, Integer, Table, Text
 
 from app.shared.db.metadata import metadata
 
@@ -13,6 +13,10 @@ imports = Table(
     Column("to_timestamp", Text, nullable=False),
     Column("status", Text, nullable=False),
     Column("error_message", Text),
+    Column("checkpoint_cursor", Text),
+    Column("checkpoint_start_time", Text),
+    Column("pages_imported", Integer, nullable=False, server_default="0"),
+    Column("requests_imported", Integer, nullable=False, server_default="0"),
 )
 
 langfuse_daily_metrics = Table(
@@ -42,3 +46,70 @@ langfuse_requests = Table(
     Column("cost", REAL),
     Column("latency_ms", Integer),
 )
+
+# Per-hour, per-model totals over langfuse_requests, kept in step by upsert_requests.
+langfuse_hourly_costs = Table(
+    "langfuse_hourly_costs",
+    metadata,
+    Column("hour", Text, primary_key=True),
+    Column("model", Text, primary_key=True),
+    Column("input_tokens", Integer, nullable=False, default=0),
+    Column("output_tokens", Integer, nullable=False, default=0),
+    Column("total_tokens", Integer, nullable=False, default=0),
+    Column("request_count", Integer, nullable=False, default=0),
+    Column("total_cost", REAL, nullable=False, default=0),
+)
+
+# Distinct models seen in langfuse_requests, kept current by upsert_requests.
+langfuse_models = Table(
+    "langfuse_models",
+    metadata,
+    Column("model", Text, primary_key=True),
+)
+
+# Trace -> run/agent/work item mapping, from observation metadata or explicit links.
+langfuse_trace_links = Table(
+    "langfuse_trace_links",
+    metadata,
+    Column("trace_id", Text, primary_key=True),
+    Column("run_id", Text),
+    Column("correlation_id", Text),
+    Column("agent_id", Text),
+    Column("work_item_id", Text),
+    Column("work_item_key", Text),
+    Column("linked_at", Text, nullable=False),
+)
+
+# Per-run / per-agent / per-work-item totals over linked requests. Maintained by
+# adding and subtracting deltas, hence DOUBLE PRECISION cost.
+langfuse_cost_attribution = Table(
+    "langfuse_cost_attribution",
+    metadata,
+    Column("scope", Text, primary_key=True),
+    Column("scope_id", Text, primary_key=True),
+    Column("label", Text),
+    Column("input_tokens", Integer, nullable=False, default=0),
+    Column("output_tokens", Integer, nullable=False, default=0),
+    Column("total_tokens", Integer, nullable=False, default=0),
+    Column("request_count", Integer, nullable=False, default=0),
+    Column("total_cost", Double, nullable=False, default=0),
+)
+
+Index(
+    "idx_langfuse_requests_started_at",
+    langfuse_requests.c.started_at.desc(),
+)
+Index(
+    "idx_langfuse_requests_model_started_at",
+    langfuse_requests.c.model,
+    langfuse_requests.c.started_at.desc(),
+)
+Index(
+    "idx_langfuse_requests_trace_id",
+    langfuse_requests.c.trace_id,
+)
+Index(
+    "idx_langfuse_cost_attribution_scope_label",
+    langfuse_cost_attribution.c.scope,
+    langfuse_cost_attribution.c.label,
+)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.planning.api.schemas.backlog import (
     ActiveSprintItemResponse,
@@ -17,8 +17,10 @@ from app.planning.api.schemas.backlog import (
     SprintMembershipResponse,
 )
 from app.planning.application.backlog_service import BacklogService
-from app.planning.dependencies import get_backlog_service, resolve_project_key
+from app.planning.application.ports import ChangeStampRepository
+from app.planning.dependencies import get_backlog_service, get_change_stamps, resolve_project_key
 from app.planning.domain.models import BacklogKind
+from app.shared.api.conditional import etag_json_response, not_modified_response, request_etag
 from app.shared.api.envelope import Envelope, ListEnvelope, ListMeta
 from app.shared.api.errors import AppError, ValidationError
 
@@ -45,19 +47,28 @@ def _validate_backlog_project_scope(backlog_project_id: str | None, project_id:
 # ------------------------------------------------------------------
 
 
-@router.get("/active-sprint")
+@router.get("/active-sprint", response_model=Envelope[ActiveSprintResponse])
 async def get_active_sprint(
+    request: Request,
     project_id: str | None = Depends(resolve_project_key),
     service: BacklogService = Depends(get_backlog_service),
-) -> Envelope[ActiveSprintResponse]:
+    stamps: ChangeStampRepository = Depends(get_change_stamps),
+) -> Response:
     if not project_id:
         raise ValidationError("Either project_id or project_key is required")
+    etag = request_etag(request, await stamps.get_stamp(project_id=project_id))
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
+
     backlog, items = await service.get_active_sprint(project_id)
-    return Envelope(
-        data=ActiveSprintResponse(
-            backlog=_backlog_response(backlog),
-            items=[ActiveSprintItemResponse(**item) for item in items],
-        )
+    return etag_json_response(
+        Envelope(
+            data=ActiveSprintResponse(
+                backlog=_backlog_response(backlog),
+                items=[ActiveSprintItemResponse(**item) for item in items],
+            )
+        ),
+        etag,
     )
 
 
@@ -110,9 +121,13 @@ async def create_backlog(
     return Envelope(data=_backlog_response(backlog))
 
 
-@router.get("")
+@router.get(
+    "", response_model=ListEnvelope[BacklogResponse] | ListEnvelope[BacklogWithItemsResponse]
+)
 async def list_backlogs(
+    request: Request,
     service: BacklogService = Depends(get_backlog_service),
+    stamps: ChangeStampRepository = Depends(get_change_stamps),
     project_id: str | None = Depends(resolve_project_key),
     status: str | None = Query(None),
     kind: str | None = Query(None),
@@ -120,10 +135,16 @@ async def list_backlogs(
     include: str | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-) -> ListEnvelope[BacklogResponse] | ListEnvelope[BacklogWithItemsResponse]:
+) -> Response:
     filter_global = project_id == "null"
     actual_project_id = None if filter_global else project_id
 
+    # Project-less backlogs live in the global ("") change scope.
+    stamp = await stamps.get_stamp(project_id="" if filter_global else actual_project_id)
+    etag = request_etag(request, stamp)
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
+
     backlogs, total = await service.list_backlogs(
         project_id=actual_project_id,
         filter_global=filter_global,
@@ -137,20 +158,26 @@ async def list_backlogs(
     if include == "items":
         backlog_ids = [b.id for b in backlogs]
         items_by_backlog = await service.get_backlog_items_batch(backlog_ids)
-        return ListEnvelope(
-            data=[
-                BacklogWithItemsResponse(
-                    **b.__dict__,
-                    items=items_by_backlog.get(b.id, []),
-                )
-                for b in backlogs
-            ],
-            meta=ListMeta(total=total, limit=limit, offset=offset),
+        return etag_json_response(
+            ListEnvelope(
+                data=[
+                    BacklogWithItemsResponse(
+                        **b.__dict__,
+                        items=items_by_backlog.get(b.id, []),
+                    )
+                    for b in backlogs
+                ],
+                meta=ListMeta(total=total, limit=limit, offset=offset),
+            ),
+            etag,
         )
 
-    return ListEnvelope(
-        data=[_backlog_response(b) for b in backlogs],
-        meta=ListMeta(total=total, limit=limit, offset=offset),
+    return etag_json_response(
+        ListEnvelope(
+            data=[_backlog_response(b) for b in backlogs],
+            meta=ListMeta(total=total, limit=limit, offset=offset),
+        ),
+        etag,
     )
 
 
@@ -278,13 +305,20 @@ async def bulk_add_items_to_backlog(
     )
 
 
-@router.get("/{backlog_id}/items")
+@router.get("/{backlog_id}/items", response_model=Envelope[list[dict]])
 async def list_backlog_items(
     backlog_id: str,
+    request: Request,
     service: BacklogService = Depends(get_backlog_service),
-) -> Envelope[list[dict]]:
+    stamps: ChangeStampRepository = Depends(get_change_stamps),
+) -> Response:
+    backlog = await service.get_backlog(backlog_id)
+    etag = request_etag(request, await stamps.get_stamp(project_id=backlog.project_id or ""))
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
+
     items = await service.get_backlog_items(backlog_id)
-    return Envelope(data=items)
+    return etag_json_response(Envelope(data=items), etag)
 
 
 @router.delete("/{backlog_id}/items/{work_item_id}", status_code=204)
@@ -1,8 +1,15 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from app.planning.api.schemas import ProjectCreate, ProjectResponse, ProjectUpdate
+from app.planning.api.schemas import (
+    ProjectBoardResponse,
+    ProjectCreate,
+    ProjectResponse,
+    ProjectUpdate,
+)
+from app.planning.application.ports import ChangeStampRepository
 from app.planning.application.project_service import ProjectService
-from app.planning.dependencies import get_project_service
+from app.planning.dependencies import get_change_stamps, get_project_service
+from app.shared.api.conditional import etag_json_response, not_modified_response, request_etag
 from app.shared.api.envelope import Envelope, ListEnvelope, ListMeta
 
 router = APIRouter(prefix="/projects", tags=["planning/projects"])
@@ -50,6 +57,21 @@ async def get_project(
     return Envelope(data=ProjectResponse(**project.__dict__))
 
 
+@router.get("/{project_id}/board", response_model=Envelope[ProjectBoardResponse])
+async def get_project_board(
+    project_id: str,
+    request: Request,
+    service: ProjectService = Depends(get_project_service),
+    stamps: ChangeStampRepository = Depends(get_change_stamps),
+) -> Response:
+    etag = request_etag(request, await stamps.get_stamp(project_id=project_id))
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
+
+    board = await service.get_board(project_id)
+    return etag_json_response(Envelope(data=ProjectBoardResponse(**board)), etag)
+
+
 @router.patch("/{project_id}")
 async def update_project(
     project_id: str,
@@ -19,11 +19,21 @@ from app.planning.api.schemas.backlog import (
     SprintMembershipRequest,
     SprintMembershipResponse,
 )
+from app.planning.api.schemas.board import (
+    BoardAgentResponse,
+    BoardBacklogResponse,
+    BoardItemResponse,
+    BoardLabelResponse,
+    ProjectBoardResponse,
+)
 from app.planning.api.schemas.bulk import (
     BulkOperationItemResult,
     BulkOperationResponse,
     BulkSprintMembershipRequest,
     BulkStatusUpdateRequest,
+    BulkWorkItemCreateItem,
+    BulkWorkItemCreateRequest,
+    BulkWorkItemCreateResponse,
 )
 from app.planning.api.schemas.label import LabelCreate, LabelResponse, LabelUpdate
 from app.planning.api.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
@@ -31,6 +41,9 @@ from app.planning.api.schemas.work_item import (
     WorkItemAssignAgentRequest,
     WorkItemAssignmentResponse,
     WorkItemAttachLabelRequest,
+    WorkItemBatchEntry,
+    WorkItemBatchGetRequest,
+    WorkItemBatchGetResponse,
     WorkItemCreate,
     WorkItemDetailResponse,
     WorkItemOverviewResponse,
@@ -55,13 +68,21 @@ __all__ = [
     "BacklogKindTransitionRequest",
     "BacklogResponse",
     "BacklogUpdate",
+    "BoardAgentResponse",
+    "BoardBacklogResponse",
+    "BoardItemResponse",
+    "BoardLabelResponse",
     "BulkOperationItemResult",
     "BulkOperationResponse",
     "BulkSprintMembershipRequest",
     "BulkStatusUpdateRequest",
+    "BulkWorkItemCreateItem",
+    "BulkWorkItemCreateRequest",
+    "BulkWorkItemCreateResponse",
     "LabelCreate",
     "LabelResponse",
     "LabelUpdate",
+    "ProjectBoardResponse",
     "ProjectCreate",
     "ProjectResponse",
     "ProjectUpdate",
@@ -71,6 +92,9 @@ __all__ = [
     "WorkItemAssignAgentRequest",
     "WorkItemAssignmentResponse",
     "WorkItemAttachLabelRequest",
+    "WorkItemBatchEntry",
+    "WorkItemBatchGetRequest",
+    "WorkItemBatchGetResponse",
     "WorkItemCreate",
     "WorkItemDetailResponse",
     "WorkItemOverviewResponse",
@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field
+
+from app.planning.api.schemas.backlog import BacklogResponse
+
+
+class BoardLabelResponse(BaseModel):
+    id: str
+    name: str
+    color: str | None
+
+
+class BoardAgentResponse(BaseModel):
+    id: str
+    name: str
+    last_name: str | None
+    initials: str | None
+    avatar: str | None
+
+
+class BoardItemResponse(BaseModel):
+    id: str
+    key: str | None
+    title: str
+    type: str
+    sub_type: str | None
+    status: str
+    priority: int | None
+    is_blocked: bool
+    parent_id: str | None
+    parent_key: str | None = None
+    parent_title: str | None = None
+    rank: str
+    children_count: int = 0
+    done_children_count: int = 0
+    assignee_agent_id: str | None = None
+    label_ids: list[str] = Field(default_factory=list)
+
+
+class BoardBacklogResponse(BacklogResponse):
+    items: list[BoardItemResponse] = Field(default_factory=list)
+
+
+class ProjectBoardResponse(BaseModel):
+    project_id: str
+    active_sprint_id: str | None
+    backlogs: list[BoardBacklogResponse]
+    labels: dict[str, BoardLabelResponse]
+    agents: dict[str, BoardAgentResponse]
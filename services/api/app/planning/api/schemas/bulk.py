@@ -1,5 +1,9 @@
 from pydantic import BaseModel, Field
 
+from app.planning.api.schemas.work_item import WorkItemCreate, WorkItemResponse
+
+BULK_CREATE_MAX_ITEMS = 1000
+
 
 class BulkStatusUpdateRequest(BaseModel):
     work_item_ids: list[str] = Field(..., min_length=1)
@@ -24,3 +28,16 @@ class BulkOperationResponse(BaseModel):
     succeeded: int
     failed: int
     results: list[BulkOperationItemResult]
+
+
+class BulkWorkItemCreateItem(WorkItemCreate):
+    label_ids: list[str] = Field(default_factory=list)
+
+
+class BulkWorkItemCreateRequest(BaseModel):
+    items: list[BulkWorkItemCreateItem] = Field(..., min_length=1, max_length=BULK_CREATE_MAX_ITEMS)
+
+
+class BulkWorkItemCreateResponse(BaseModel):
+    total: int
+    items: list[WorkItemResponse]
@@ -75,6 +75,23 @@ class WorkItemDetailResponse(WorkItemResponse):
     assignments: list["WorkItemAssignmentResponse"] = Field(default_factory=list)
 
 
+class WorkItemBatchGetRequest(BaseModel):
+    ids: list[str] | None = None
+    keys: list[str] | None = None
+
+
+class WorkItemBatchEntry(BaseModel):
+    ref: str
+    found: bool
+    item: WorkItemDetailResponse | None = None
+
+
+class WorkItemBatchGetResponse(BaseModel):
+    total: int
+    found: int
+    items: list[WorkItemBatchEntry]
+
+
 class WorkItemOverviewResponse(BaseModel):
     work_item_id: str
     work_item_key: str
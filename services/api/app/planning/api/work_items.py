@@ -1,15 +1,20 @@
-from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 
 from app.planning.api.schemas.bulk import (
     BulkOperationItemResult,
     BulkOperationResponse,
     BulkSprintMembershipRequest,
     BulkStatusUpdateRequest,
+    BulkWorkItemCreateRequest,
+    BulkWorkItemCreateResponse,
 )
 from app.planning.api.schemas.work_item import (
     WorkItemAssignAgentRequest,
     WorkItemAssignmentResponse,
     WorkItemAttachLabelRequest,
+    WorkItemBatchEntry,
+    WorkItemBatchGetRequest,
+    WorkItemBatchGetResponse,
     WorkItemCreate,
     WorkItemDetailResponse,
     WorkItemOverviewResponse,
@@ -18,15 +23,19 @@ from app.planning.api.schemas.work_item import (
     WorkItemStatusChangeResponse,
     WorkItemUpdate,
 )
+from app.planning.application.ports import ChangeStampRepository
 from app.planning.application.work_item_action_service import WorkItemActionService
-from app.planning.application.work_item_service import WorkItemService
+from app.planning.application.work_item_service import WorkItemDraft, WorkItemService
 from app.planning.dependencies import (
+    get_change_stamps,
     get_work_item_action_service,
     get_work_item_service,
     resolve_project_key,
 )
+from app.shared.api.conditional import etag_json_response, not_modified_response, request_etag
 from app.shared.api.envelope import ListEnvelope, ListMeta
 from app.shared.api.errors import ValidationError
+from app.shared.utils import utc_now
 
 router = APIRouter(prefix="/work-items", tags=["work-items"])
 
@@ -62,6 +71,7 @@ async def create_work_item(
 
 @router.get("", response_model=ListEnvelope[WorkItemResponse])
 async def list_work_items(
+    request: Request,
     project_id: str | None = Depends(resolve_project_key),
     type: str | None = Query(None),
     parent_id: str | None = Query(None),
@@ -76,7 +86,12 @@ async def list_work_items(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
     svc: WorkItemService = Depends(get_work_item_service),
-):
+    stamps: ChangeStampRepository = Depends(get_change_stamps),
+) -> Response:
+    etag = request_etag(request, await stamps.get_stamp(project_id=project_id))
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
+
     resolved_parent_id = parent_id
     if parent_key and not parent_id:
         parent_item = await svc.get_work_item_by_key_or_none(parent_key)
@@ -98,14 +113,18 @@ async def list_work_items(
         limit=limit,
         offset=offset,
     )
-    return ListEnvelope(
-        data=[WorkItemResponse(**i) for i in items],
-        meta=ListMeta(total=total, limit=limit, offset=offset),
+    return etag_json_response(
+        ListEnvelope(
+            data=[WorkItemResponse(**i) for i in items],
+            meta=ListMeta(total=total, limit=limit, offset=offset),
+        ),
+        etag,
     )
 
 
 @router.get("/overview", response_model=ListEnvelope[WorkItemOverviewResponse])
 async def list_overview(
+    request: Request,
     project_id: str | None = Depends(resolve_project_key),
     type: str | None = Query(None),
     status: str | None = Query(None),
@@ -117,7 +136,14 @@ async def list_overview(
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     svc: WorkItemService = Depends(get_work_item_service),
-):
+    stamps: ChangeStampRepository = Depends(get_change_stamps),
+) -> Response:
+    # stale_days moves with the clock, so the current hour is part of the version.
+    stamp = await stamps.get_stamp(project_id=project_id)
+    etag = request_etag(request, f"{stamp}@{utc_now()[:13]}")
+    if (not_modified := not_modified_response(request, etag)) is not None:
+        return not_modified
+
     items, total = await svc.list_overview(
         type=type,
         project_id=project_id,
@@ -130,27 +156,43 @@ async def list_overview(
         limit=limit,
         offset=offset,
     )
-    return ListEnvelope(
-        data=[WorkItemOverviewResponse(**_overview_to_dict(i)) for i in items],
-        meta=ListMeta(total=total, limit=limit, offset=offset),
+    return etag_json_response(
+        ListEnvelope(
+            data=[WorkItemOverviewResponse(**_overview_to_dict(i)) for i in items],
+            meta=ListMeta(total=total, limit=limit, offset=offset),
+        ),
+        etag,
     )
 
 
+@router.get("/batch", response_model=WorkItemBatchGetResponse)
+async def get_work_items_batch(
+    ids: str | None = Query(None, description="Comma-separated work item ids"),
+    keys: str | None = Query(None, description="Comma-separated work item keys, e.g. MC-12,MC-40"),
+    svc: WorkItemService = Depends(get_work_item_service),
+):
+    return _batch_response(
+        await svc.get_work_items_batch(
+            ids=ids.split(",") if ids is not None else None,
+            keys=keys.split(",") if keys is not None else None,
+        )
+    )
+
+
+@router.post("/batch", response_model=WorkItemBatchGetResponse)
+async def post_work_items_batch(
+    body: WorkItemBatchGetRequest,
+    svc: WorkItemService = Depends(get_work_item_service),
+):
+    return _batch_response(await svc.get_work_items_batch(ids=body.ids, keys=body.keys))
+
+
 @router.get("/by-key/{key}", response_model=WorkItemDetailResponse)
 async def get_by_key(
     key: str,
     svc: WorkItemService = Depends(get_work_item_service),
 ):
-    item, children_count = await svc.get_work_item_by_key(key)
-    assignments = await svc.list_assignments(item.id)
-    item_labels = await svc.get_labels(item.id)
-    return WorkItemDetailResponse(
-        **_to_dict(item),
-        children_count=children_count,
-        labels=item_labels,
-        label_ids=[la["id"] for la in item_labels],
-        assignments=[WorkItemAssignmentResponse(**_assignment_to_dict(a)) for a in assignments],
-    )
+    return WorkItemDetailResponse(**await svc.get_work_item_detail(key=key))
 
 
 @router.get("/{work_item_id}", response_model=WorkItemDetailResponse)
@@ -158,16 +200,7 @@ async def get_work_item(
     work_item_id: str,
     svc: WorkItemService = Depends(get_work_item_service),
 ):
-    item, children_count = await svc.get_work_item(work_item_id)
-    assignments = await svc.list_assignments(item.id)
-    item_labels = await svc.get_labels(work_item_id)
-    return WorkItemDetailResponse(
-        **_to_dict(item),
-        children_count=children_count,
-        labels=item_labels,
-        label_ids=[la["id"] for la in item_labels],
-        assignments=[WorkItemAssignmentResponse(**_assignment_to_dict(a)) for a in assignments],
-    )
+    return WorkItemDetailResponse(**await svc.get_work_item_detail(work_item_id=work_item_id))
 
 
 @router.patch("/{work_item_id}", response_model=WorkItemResponse)
@@ -318,6 +351,25 @@ async def change_status(
 # ------------------------------------------------------------------
 
 
+@router.post("/bulk", status_code=201, response_model=BulkWorkItemCreateResponse)
+async def bulk_create_work_items(
+    body: BulkWorkItemCreateRequest,
+    svc: WorkItemService = Depends(get_work_item_service),
+    x_actor_id: str | None = Header(None),
+):
+    items = await svc.create_work_items(
+        [WorkItemDraft(**entry.model_dump()) for entry in body.items],
+        actor=x_actor_id,
+    )
+    return BulkWorkItemCreateResponse(
+        total=len(items),
+        items=[
+            WorkItemResponse(**_to_dict(item), label_ids=list(dict.fromkeys(entry.label_ids)))
+            for item, entry in zip(items, body.items)
+        ],
+    )
+
+
 @router.post("/bulk/status", response_model=BulkOperationResponse)
 async def bulk_update_status(
     body: BulkStatusUpdateRequest,
@@ -448,6 +500,22 @@ def _to_dict(item):
     }
 
 
+def _batch_response(results):
+    entries = [
+        WorkItemBatchEntry(
+            ref=ref,
+            found=detail is not None,
+            item=WorkItemDetailResponse(**detail) if detail is not None else None,
+        )
+        for ref, detail in results
+    ]
+    return WorkItemBatchGetResponse(
+        total=len(entries),
+        found=sum(1 for e in entries if e.found),
+        items=entries,
+    )
+
+
 def _overview_to_dict(item):
     return {
         "work_item_id": item.work_item_id,
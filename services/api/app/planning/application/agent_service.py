@@ -1,5 +1,6 @@
 import json
 import re
+from dataclasses import replace
 from typing import Any
 
 from app.planning.application.ports import AgentRepository, OpenClawAgentSourcePort
@@ -81,10 +82,6 @@ class AgentService:
         return await self._repo.create(agent)
 
     async def update_agent(self, agent_id: str, data: dict[str, Any]) -> Agent:
-        existing = await self._repo.get_by_id(agent_id)
-        if not existing:
-            raise NotFoundError(f"Agent {agent_id} not found")
-
         data["updated_at"] = utc_now()
         updated = await self._repo.update(agent_id, data)
         if not updated:
@@ -98,6 +95,11 @@ class AgentService:
         await self._repo.delete(agent_id)
 
     async def sync_agents_from_openclaw(self) -> dict[str, int]:
+        """Diff the OpenClaw config against stored agents and write only the changes.
+
+        Existing agents are read once; creates and updates go out as one
+        upsert and stale OpenClaw agents as one deactivate, in one transaction.
+        """
         if self._openclaw_source is None:
             raise ValidationError("OpenClaw source is not configured")
 
@@ -129,81 +131,68 @@ class AgentService:
                 continue
             normalized_by_key[key] = normalized
 
-        synced_keys = set(normalized_by_key.keys())
-
+        existing_by_key = {
+            agent.openclaw_key: agent
+            for agent in await self._repo.list_for_openclaw_sync(sorted(normalized_by_key))
+        }
+        upserts: list[Agent] = []
         for openclaw_key in sorted(normalized_by_key):
             normalized = normalized_by_key[openclaw_key]
-            existing = await self._repo.get_by_openclaw_key(openclaw_key)
+            existing = existing_by_key.get(openclaw_key)
             if existing is None:
-                created = Agent(
-                    id=new_uuid(),
-                    openclaw_key=openclaw_key,
-                    name=normalized["name"],
-                    last_name=normalized["last_name"],
-                    initials=normalized["initials"],
-                    role=normalized["role"],
-                    worker_type=normalized["worker_type"],
-                    avatar=normalized["avatar"],
-                    is_active=normalized["is_active"],
-                    source=AgentSource.OPENCLAW_JSON,
-                    main_session_key=None,
-                    metadata_json=normalized["metadata_json"],
-                    last_synced_at=now,
-                    created_at=now,
-                    updated_at=now,
+                upserts.append(
+                    Agent(
+                        id=new_uuid(),
+                        openclaw_key=openclaw_key,
+                        name=normalized["name"],
+                        last_name=normalized["last_name"],
+                        initials=normalized["initials"],
+                        role=normalized["role"],
+                        worker_type=normalized["worker_type"],
+                        avatar=normalized["avatar"],
+                        is_active=normalized["is_active"],
+                        source=AgentSource.OPENCLAW_JSON,
+                        main_session_key=None,
+                        metadata_json=normalized["metadata_json"],
+                        last_synced_at=now,
+                        created_at=now,
+                        updated_at=now,
+                    )
                 )
-                await self._repo.create(created)
                 summary["created"] += 1
                 continue
 
-            changed = (
-                existing.name != normalized["name"]
-                or existing.last_name != normalized["last_name"]
-                or existing.initials != normalized["initials"]
-                or existing.role != normalized["role"]
-                or existing.worker_type != normalized["worker_type"]
-                or existing.avatar != normalized["avatar"]
-                or existing.is_active != normalized["is_active"]
-                or existing.metadata_json != normalized["metadata_json"]
-                or existing.source != AgentSource.OPENCLAW_JSON
+            synced = replace(
+                existing,
+                name=normalized["name"],
+                last_name=normalized["last_name"],
+                initials=normalized["initials"],
+                role=normalized["role"],
+                worker_type=normalized["worker_type"],
+                avatar=normalized["avatar"],
+                is_active=normalized["is_active"],
+                metadata_json=normalized["metadata_json"],
+                source=AgentSource.OPENCLAW_JSON,
             )
-
-            await self._repo.update(
-                existing.id,
-                {
-                    "name": normalized["name"],
-                    "last_name": normalized["last_name"],
-                    "initials": normalized["initials"],
-                    "role": normalized["role"],
-                    "worker_type": normalized["worker_type"],
-                    "avatar": normalized["avatar"],
-                    "is_active": normalized["is_active"],
-                    "metadata_json": normalized["metadata_json"],
-                    "source": AgentSource.OPENCLAW_JSON,
-                    "last_synced_at": now,
-                    "updated_at": now,
-                },
-            )
-            summary["updated" if changed else "unchanged"] += 1
-
-        openclaw_agents = await self._repo.list_by_source(AgentSource.OPENCLAW_JSON)
-        for agent in openclaw_agents:
-            if agent.openclaw_key in synced_keys:
+            if synced == existing:
+                summary["unchanged"] += 1
                 continue
+            upserts.append(replace(synced, last_synced_at=now, updated_at=now))
+            summary["updated"] += 1
 
+        deactivate_ids: list[str] = []
+        for agent in existing_by_key.values():
+            if agent.openclaw_key in normalized_by_key or agent.source != AgentSource.OPENCLAW_JSON:
+                continue
             if agent.is_active:
-                await self._repo.update(
-                    agent.id,
-                    {
-                        "is_active": False,
-                        "last_synced_at": now,
-                        "updated_at": now,
-                    },
-                )
+                deactivate_ids.append(agent.id)
                 summary["deactivated"] += 1
             else:
                 summary["unchanged"] += 1
 
+        await self._repo.apply_openclaw_sync(
+            upserts=upserts, deactivate_ids=deactivate_ids, synced_at=now
+        )
         return summary
 
     @staticmethod
@@ -0,0 +1,52 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from app.shared.logging import log_event
+from app.shared.periodic_task import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+
+class OpenClawSyncWatcher(PeriodicTask):
+    """Background loop that syncs agents when ``openclaw.json`` changes.
+
+    Each tick polls the config fingerprint (cheap while the file's mtime is
+    unchanged) and runs the sync only when it differs from the last synced
+    one. A failed sync keeps the old fingerprint so the next tick retries.
+    """
+
+    def __init__(
+        self,
+        *,
+        fingerprint: Callable[[], Awaitable[str | None]],
+        sync: Callable[[], Awaitable[dict[str, int]]],
+        interval_seconds: float,
+    ) -> None:
+        super().__init__(name="planning-openclaw-sync-watch", interval_seconds=interval_seconds)
+        self._fingerprint = fingerprint
+        self._sync = sync
+        self._synced_fingerprint: str | None = None
+
+    async def run_once(self) -> dict[str, int] | None:
+        try:
+            fingerprint = await self._fingerprint()
+            if fingerprint is None or fingerprint == self._synced_fingerprint:
+                return None
+            summary = await self._sync()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log_event(
+                logger,
+                level=logging.WARNING,
+                event="planning.openclaw_sync.failed",
+                error=str(exc),
+            )
+            return None
+        self._synced_fingerprint = fingerprint
+        log_event(
+            logger,
+            level=logging.INFO,
+            event="planning.openclaw_sync.synced",
+            fingerprint=fingerprint,
+            **summary,
+        )
+        return summary
@@ -1,6 +1,7 @@
 from app.planning.application.ports.activity_log import ActivityLogRepository
 from app.planning.application.ports.agent import AgentRepository, OpenClawAgentSourcePort
 from app.planning.application.ports.backlog import BacklogRepository
+from app.planning.application.ports.change_stamp import ChangeStampRepository
 from app.planning.application.ports.label import LabelRepository
 from app.planning.application.ports.project import ProjectRepository
 from app.planning.application.ports.work_item import WorkItemRepository
@@ -9,6 +10,7 @@ __all__ = [
     "ActivityLogRepository",
     "AgentRepository",
     "BacklogRepository",
+    "ChangeStampRepository",
     "LabelRepository",
     "OpenClawAgentSourcePort",
     "ProjectRepository",
@@ -26,6 +26,19 @@ class AgentRepository(ABC):
     @abstractmethod
     async def list_by_source(self, source: str) -> list[Agent]: ...
 
+    @abstractmethod
+    async def list_for_openclaw_sync(self, openclaw_keys: list[str]) -> list[Agent]:
+        """Agents whose key is in ``openclaw_keys`` or whose source is OpenClaw, in one read."""
+
+    @abstractmethod
+    async def apply_openclaw_sync(
+        self, *, upserts: list[Agent], deactivate_ids: list[str], synced_at: str
+    ) -> None:
+        """Upsert ``upserts`` by openclaw_key and deactivate ``deactivate_ids``.
+
+        Both happen in one transaction.
+        """
+
     @abstractmethod
     async def create(self, agent: Agent) -> Agent: ...
 
@@ -39,3 +52,7 @@ class AgentRepository(ABC):
 class OpenClawAgentSourcePort(ABC):
     @abstractmethod
     async def list_agents(self) -> list[dict[str, Any]]: ...
+
+    @abstractmethod
+    async def fingerprint(self) -> str | None:
+        """Content hash of the current config, or None when it does not exist."""
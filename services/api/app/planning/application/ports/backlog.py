@@ -22,6 +22,9 @@ class BacklogRepository(ABC):
         sort: str | None = None,
     ) -> tuple[list[Backlog], int]: ...
 
+    @abstractmethod
+    async def list_by_project(self, project_id: str) -> list[Backlog]: ...
+
     @abstractmethod
     async def get_by_id(self, backlog_id: str) -> Backlog | None: ...
 
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class ChangeStampRepository(ABC):
+    @abstractmethod
+    async def get_stamp(self, *, project_id: str | None = None) -> str:
+        """Opaque version of the planning data visible to a read.
+
+        Scoped to one project (plus project-less rows and agents) when
+        ``project_id`` is given, otherwise to all planning data. Changes
+        whenever a write that could alter such a read commits.
+        """
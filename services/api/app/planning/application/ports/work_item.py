@@ -12,9 +12,6 @@ class WorkItemRepository(ABC):
     @abstractmethod
     async def flush(self) -> None: ...
 
-    @abstractmethod
-    async def commit(self) -> None: ...
-
     # ------------------------------------------------------------------
     # CRUD
     # ------------------------------------------------------------------
@@ -61,12 +58,31 @@ class WorkItemRepository(ABC):
     @abstractmethod
     async def get_by_key(self, key: str) -> WorkItem | None: ...
 
+    @abstractmethod
+    async def get_details(
+        self, *, work_item_ids: list[str] | None = None, keys: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Detail rows (parent, child counts, labels, assignments) for ids or keys, unordered."""
+
+    @abstractmethod
+    async def get_by_ids(self, work_item_ids: list[str]) -> dict[str, WorkItem]: ...
+
     @abstractmethod
     async def create(self, work_item: WorkItem) -> WorkItem: ...
 
     @abstractmethod
     async def create_in_backlog(self, work_item: WorkItem, backlog_id: str) -> WorkItem: ...
 
+    @abstractmethod
+    async def create_many(
+        self,
+        items: list[WorkItem],
+        *,
+        backlog_ids: dict[str, str],
+        label_ids: dict[str, list[str]],
+    ) -> list[WorkItem]:
+        """Insert items with their backlog membership and labels in one transaction."""
+
     @abstractmethod
     async def update(self, work_item_id: str, data: dict[str, Any]) -> WorkItem | None: ...
 
@@ -122,6 +138,9 @@ class WorkItemRepository(ABC):
     @abstractmethod
     async def allocate_key(self, project_id: str) -> str: ...
 
+    @abstractmethod
+    async def allocate_keys(self, project_id: str, count: int) -> list[str]: ...
+
     # ------------------------------------------------------------------
     # Existence checks
     # ------------------------------------------------------------------
@@ -138,13 +157,21 @@ class WorkItemRepository(ABC):
     @abstractmethod
     async def backlog_exists(self, backlog_id: str) -> bool: ...
 
+    @abstractmethod
+    async def find_missing_references(
+        self,
+        *,
+        project_ids: set[str],
+        agent_ids: set[str],
+        backlog_ids: set[str],
+        label_ids: set[str],
+    ) -> dict[str, set[str]]:
+        """Return the requested ids that do not exist, keyed by project/agent/backlog/label."""
+
     # ------------------------------------------------------------------
     # Labels
     # ------------------------------------------------------------------
 
-    @abstractmethod
-    async def get_labels(self, work_item_id: str) -> list[dict[str, Any]]: ...
-
     @abstractmethod
     async def label_attached(self, work_item_id: str, label_id: str) -> bool: ...
 
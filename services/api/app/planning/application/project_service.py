@@ -40,6 +40,51 @@ class ProjectService:
             raise NotFoundError(f"Project {project_id} not found")
         return project
 
+    async def get_board(self, project_id: str) -> dict[str, Any]:
+        """Every backlog of the project with its ranked items.
+
+        Labels and assignees are returned once each in ``labels``/``agents``
+        and referenced from items by id, so the board is one payload built
+        from a fixed number of queries regardless of backlog or item count.
+        """
+        await self.get_project(project_id)
+        backlogs = await self._backlog_repo.list_by_project(project_id)
+        items_by_backlog = await self._backlog_repo.list_items_batch([b.id for b in backlogs])
+
+        labels: dict[str, dict[str, Any]] = {}
+        agents: dict[str, dict[str, Any]] = {}
+        for item in (i for items in items_by_backlog.values() for i in items):
+            for label in item["labels"]:
+                labels.setdefault(label["id"], label)
+            agent_id = item["assignee_agent_id"]
+            if agent_id and item["assignee_name"] is not None:
+                agents.setdefault(
+                    agent_id,
+                    {
+                        "id": agent_id,
+                        "name": item["assignee_name"],
+                        "last_name": item["assignee_last_name"],
+                        "initials": item["assignee_initials"],
+                        "avatar": item["assignee_avatar"],
+                    },
+                )
+
+        active_sprint = next(
+            (
+                b
+                for b in backlogs
+                if b.kind == BacklogKind.SPRINT and b.status == BacklogStatus.ACTIVE
+            ),
+            None,
+        )
+        return {
+            "project_id": project_id,
+            "active_sprint_id": active_sprint.id if active_sprint else None,
+            "backlogs": [{**b.__dict__, "items": items_by_backlog.get(b.id, [])} for b in backlogs],
+            "labels": labels,
+            "agents": agents,
+        }
+
     async def create_project(
         self,
         *,
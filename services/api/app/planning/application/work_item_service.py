@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from typing import Any
 
 from app.planning.application.ports.work_item import WorkItemRepository
@@ -18,6 +19,27 @@ from app.shared.api.errors import (
 from app.shared.ports import OnAssignmentChanged
 from app.shared.utils import new_uuid, utc_now
 
+WORK_ITEM_BATCH_MAX_REFS = 1000
+
+
+@dataclass
+class WorkItemDraft:
+    """One entry of a bulk create; mirrors the ``create_work_item`` arguments."""
+
+    type: str
+    title: str
+    project_id: str | None = None
+    parent_id: str | None = None
+    sub_type: str | None = None
+    summary: str | None = None
+    description: str | None = None
+    priority: int | None = None
+    estimate_points: float | None = None
+    due_at: str | None = None
+    current_assignee_agent_id: str | None = None
+    backlog_id: str | None = None
+    label_ids: list[str] = field(default_factory=list)
+
 
 class WorkItemService:
     def __init__(
@@ -70,12 +92,44 @@ class WorkItemService:
         children_count = await self._repo.get_children_count(work_item_id)
         return item, children_count
 
-    async def get_work_item_by_key(self, key: str) -> tuple[WorkItem, int]:
-        item = await self._repo.get_by_key(key)
-        if not item:
-            raise NotFoundError(f"Work item with key '{key}' not found")
-        children_count = await self._repo.get_children_count(item.id)
-        return item, children_count
+    async def get_work_item_detail(
+        self, *, work_item_id: str | None = None, key: str | None = None
+    ) -> dict[str, Any]:
+        if work_item_id is not None:
+            details = await self._repo.get_details(work_item_ids=[work_item_id])
+        elif key is not None:
+            details = await self._repo.get_details(keys=[key])
+        else:
+            details = []
+        if not details:
+            if key is not None:
+                raise NotFoundError(f"Work item with key '{key}' not found")
+            raise NotFoundError(f"Work item {work_item_id} not found")
+        return details[0]
+
+    async def get_work_items_batch(
+        self, *, ids: list[str] | None = None, keys: list[str] | None = None
+    ) -> list[tuple[str, dict[str, Any] | None]]:
+        """Resolve ids or keys in one query; ``(ref, detail-or-None)`` in request order."""
+        if (ids is None) == (keys is None):
+            raise ValidationError("Provide exactly one of 'ids' or 'keys'")
+        source = ids if ids is not None else (keys or [])
+        refs = [ref.strip() for ref in source if ref.strip()]
+        if not refs:
+            raise ValidationError("At least one id or key is required")
+        if len(refs) > WORK_ITEM_BATCH_MAX_REFS:
+            raise ValidationError(
+                f"At most {WORK_ITEM_BATCH_MAX_REFS} ids or keys per request, got {len(refs)}"
+            )
+
+        unique = list(dict.fromkeys(refs))
+        if ids is not None:
+            details = await self._repo.get_details(work_item_ids=unique)
+            by_ref = {d["id"]: d for d in details}
+            return [(ref, by_ref.get(ref)) for ref in refs]
+        details = await self._repo.get_details(keys=unique)
+        by_ref = {d["key"]: d for d in details}
+        return [(ref, by_ref.get(ref.upper())) for ref in refs]
 
     async def get_work_item_by_key_or_none(self, key: str) -> WorkItem | None:
         return await self._repo.get_by_key(key)
@@ -213,6 +267,110 @@ class WorkItemService:
             return await self._repo.create_in_backlog(item, backlog_id)
         return await self._repo.create(item)
 
+    async def create_work_items(
+        self,
+        drafts: list[WorkItemDraft],
+        *,
+        actor: str | None = None,
+    ) -> list[WorkItem]:
+        """Create many work items atomically.
+
+        References are validated with set queries, keys are reserved with
+        one counter increment per project, and all rows (with backlog
+        membership and labels) are written in one transaction. Any invalid
+        entry rejects the whole batch; messages are prefixed ``items[i]``.
+        """
+        for index, draft in enumerate(drafts):
+            try:
+                self._validate_type(draft.type)
+            except ValidationError as exc:
+                raise ValidationError(f"items[{index}]: {exc.message}") from exc
+
+        parents = await self._repo.get_by_ids(
+            sorted({d.parent_id for d in drafts if d.parent_id is not None})
+        )
+        project_ids: list[str | None] = []
+        for index, draft in enumerate(drafts):
+            project_id = draft.project_id
+            if draft.parent_id:
+                parent = parents.get(draft.parent_id)
+                if not parent:
+                    raise ValidationError(
+                        f"items[{index}]: Parent {draft.parent_id} does not exist"
+                    )
+                if project_id is None:
+                    project_id = parent.project_id
+                elif parent.project_id and project_id != parent.project_id:
+                    raise ConflictError(
+                        f"items[{index}]: Project {project_id} conflicts with parent project "
+                        f"{parent.project_id}"
+                    )
+            project_ids.append(project_id)
+
+        missing = await self._repo.find_missing_references(
+            project_ids={p for p in project_ids if p},
+            agent_ids={d.current_assignee_agent_id for d in drafts if d.current_assignee_agent_id},
+            backlog_ids={d.backlog_id for d in drafts if d.backlog_id},
+            label_ids={label_id for d in drafts for label_id in d.label_ids},
+        )
+        for index, draft in enumerate(drafts):
+            refs = [
+                ("project", "Project", project_ids[index]),
+                ("agent", "Agent", draft.current_assignee_agent_id),
+                ("backlog", "Backlog", draft.backlog_id),
+                *(("label", "Label", label_id) for label_id in draft.label_ids),
+            ]
+            for kind, noun, ref_id in refs:
+                if ref_id and ref_id in missing.get(kind, set()):
+                    raise ValidationError(f"items[{index}]: {noun} {ref_id} does not exist")
+
+        # Sorted so concurrent batches lock project counters in the same order.
+        keys: dict[str, list[str]] = {}
+        for project_id in sorted({p for p in project_ids if p}):
+            count = sum(1 for p in project_ids if p == project_id)
+            keys[project_id] = await self._repo.allocate_keys(project_id, count)
+        next_key = {project_id: iter(allocated) for project_id, allocated in keys.items()}
+
+        now = utc_now()
+        items: list[WorkItem] = []
+        backlog_ids: dict[str, str] = {}
+        label_ids: dict[str, list[str]] = {}
+        for draft, project_id in zip(drafts, project_ids):
+            item = WorkItem(
+                id=new_uuid(),
+                project_id=project_id,
+                parent_id=draft.parent_id,
+                key=next(next_key[project_id]) if project_id else None,
+                type=WorkItemType(draft.type),
+                sub_type=draft.sub_type,
+                title=draft.title,
+                summary=draft.summary,
+                description=draft.description,
+                status=WorkItemStatus.TODO,
+                status_mode=StatusMode.MANUAL,
+                status_override=None,
+                status_override_set_at=None,
+                is_blocked=False,
+                blocked_reason=None,
+                priority=draft.priority,
+                estimate_points=draft.estimate_points,
+                due_at=draft.due_at,
+                current_assignee_agent_id=draft.current_assignee_agent_id,
+                metadata_json=None,
+                created_by=actor,
+                updated_by=actor,
+                created_at=now,
+                updated_at=now,
+                started_at=None,
+                completed_at=None,
+            )
+            items.append(item)
+            if draft.backlog_id:
+                backlog_ids[item.id] = draft.backlog_id
+            if draft.label_ids:
+                label_ids[item.id] = list(dict.fromkeys(draft.label_ids))
+        return await self._repo.create_many(items, backlog_ids=backlog_ids, label_ids=label_ids)
+
     # ------------------------------------------------------------------
     # Update
     # ------------------------------------------------------------------
@@ -280,7 +438,6 @@ class WorkItemService:
                 agent_id=data.get("current_assignee_agent_id"),
                 previous_agent_id=existing.current_assignee_agent_id,
             )
-            await self._repo.commit()
 
         # Recompute parent derived status when child status changes.
         if "status" in data and existing.parent_id:
@@ -301,9 +458,6 @@ class WorkItemService:
     # Labels
     # ------------------------------------------------------------------
 
-    async def get_labels(self, work_item_id: str) -> list[dict[str, Any]]:
-        return await self._repo.get_labels(work_item_id)
-
     async def attach_label(self, work_item_id: str, label_id: str) -> None:
         if not await self._repo.get_by_id(work_item_id):
             raise NotFoundError(f"Work item {work_item_id} not found")
@@ -355,7 +509,6 @@ class WorkItemService:
             agent_id=agent_id,
             previous_agent_id=active.agent_id if active else None,
         )
-        await self._repo.commit()
         return assignment
 
     async def unassign_current_agent(self, work_item_id: str) -> None:
@@ -379,7 +532,6 @@ class WorkItemService:
             agent_id=None,
             previous_agent_id=active.agent_id,
         )
-        await self._repo.commit()
 
     async def list_assignments(self, work_item_id: str) -> list[WorkItemAssignment]:
         if not await self._repo.get_by_id(work_item_id):
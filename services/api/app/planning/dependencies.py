@@ -10,18 +10,22 @@ from app.control_plane.dependencies import build_queue_dispatch_service
 from app.planning.application.agent_service import AgentService
 from app.planning.application.backlog_service import BacklogService
 from app.planning.application.label_service import LabelService
+from app.planning.application.ports import ChangeStampRepository
 from app.planning.application.project_service import ProjectService
 from app.planning.application.work_item_action_service import WorkItemActionService
 from app.planning.application.work_item_service import WorkItemService
 from app.planning.infrastructure.repositories.activity_log import DbActivityLogRepository
 from app.planning.infrastructure.repositories.agents import DbAgentRepository
 from app.planning.infrastructure.repositories.backlogs.repository import DbBacklogRepository
+from app.planning.infrastructure.repositories.change_stamps import DbChangeStampRepository
 from app.planning.infrastructure.repositories.labels import DbLabelRepository
 from app.planning.infrastructure.repositories.projects import DbProjectRepository
 from app.planning.infrastructure.repositories.work_items import DbWorkItemRepository
 from app.planning.infrastructure.sources.openclaw import FileOpenClawAgentSource
 from app.shared.api.deps import get_db
 from app.shared.api.errors import NotFoundError
+from app.shared.db.unit_of_work import unit_of_work
+from app.shared.lookup_cache import project_repo_root_cache
 from app.shared.ports import OnAssignmentChanged
 
 if TYPE_CHECKING:
@@ -29,7 +33,7 @@ if TYPE_CHECKING:
 
 
 async def get_project_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> ProjectService:
     return ProjectService(
         project_repo=DbProjectRepository(db),
@@ -38,7 +42,7 @@ async def get_project_service(
 
 
 async def get_agent_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> AgentService:
     return AgentService(
         repo=DbAgentRepository(db),
@@ -46,8 +50,21 @@ async def get_agent_service(
     )
 
 
+async def run_openclaw_agent_sync() -> dict[str, int]:
+    """One OpenClaw agent sync in its own session (used by the config watcher)."""
+    async with unit_of_work() as db:
+        return await AgentService(
+            repo=DbAgentRepository(db),
+            openclaw_source=FileOpenClawAgentSource(settings.openclaw_config_path),
+        ).sync_agents_from_openclaw()
+
+
+async def openclaw_config_fingerprint() -> str | None:
+    return await FileOpenClawAgentSource(settings.openclaw_config_path).fingerprint()
+
+
 async def get_label_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> LabelService:
     return LabelService(DbLabelRepository(db))
 
@@ -69,9 +86,14 @@ def _make_assignment_hook(
     ) -> None:
         repo_root = ""
         if project_id:
-            project = await project_repo.get_by_id(project_id)
-            if project and project.repo_root:
-                repo_root = project.repo_root
+            cached_root = project_repo_root_cache.get(project_id)
+            if cached_root is not None:
+                repo_root = cached_root
+            else:
+                project = await project_repo.get_by_id(project_id)
+                if project:
+                    repo_root = project.repo_root or ""
+                    project_repo_root_cache.set(project_id, repo_root)
 
         await queue_dispatch_svc.enqueue_and_dispatch(
             work_item_id=work_item_id,
@@ -88,23 +110,30 @@ def _make_assignment_hook(
 
 
 async def get_work_item_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> WorkItemService:
-    svc = build_queue_dispatch_service(db)
+    # The hook runs inside the request's unit of work, which commits once.
+    svc = build_queue_dispatch_service(db, autocommit=False)
     hook = _make_assignment_hook(svc, project_repo=DbProjectRepository(db))
     return WorkItemService(DbWorkItemRepository(db), on_assignment_changed=hook)
 
 
 async def get_backlog_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> BacklogService:
     return BacklogService(DbBacklogRepository(db))
 
 
+async def get_change_stamps(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> ChangeStampRepository:
+    return DbChangeStampRepository(db)
+
+
 async def get_work_item_action_service(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> WorkItemActionService:
-    svc = build_queue_dispatch_service(db)
+    svc = build_queue_dispatch_service(db, autocommit=False)
     hook = _make_assignment_hook(svc, project_repo=DbProjectRepository(db))
     return WorkItemActionService(
         work_item_service=WorkItemService(DbWorkItemRepository(db), on_assignment_changed=hook),
@@ -116,7 +145,7 @@ async def get_work_item_action_service(
 async def resolve_project_key(
     project_id: str | None = Query(None),
     project_key: str | None = Query(None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> str | None:
     """Resolve project_key to project_id. project_key takes precedence."""
     if project_key is not None:
@@ -37,7 +37,7 @@ class DbActivityLogRepository(ActivityLogRepository):
             metadata=metadata,
             occurred_at=occurred_at,
         )
-        await self._db.commit()
+        await self._db.flush()
 
     async def _insert_event(
         self,
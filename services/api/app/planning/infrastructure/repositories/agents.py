@@ -1,16 +1,19 @@
 from typing import Any
 from typing import cast as type_cast
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.functions import count
 
 from app.planning.application.ports import AgentRepository
-from app.planning.domain.models import Agent
+from app.planning.domain.models import Agent, AgentSource
 from app.planning.infrastructure.shared.mappers import _row_to_agent
 from app.planning.infrastructure.shared.sorting import parse_sort
 from app.planning.infrastructure.tables import agents
+from app.shared.db.unit_of_work import after_commit
+from app.shared.lookup_cache import agent_info_cache
 
 _SORT_ALLOWED_AGENT = {
     "created_at": agents.c.created_at,
@@ -20,6 +23,26 @@ _SORT_ALLOWED_AGENT = {
 }
 
 
+def _agent_values(agent: Agent) -> dict[str, Any]:
+    return {
+        "id": agent.id,
+        "openclaw_key": agent.openclaw_key,
+        "name": agent.name,
+        "last_name": agent.last_name,
+        "initials": agent.initials,
+        "role": agent.role,
+        "worker_type": agent.worker_type,
+        "avatar": agent.avatar,
+        "is_active": 1 if agent.is_active else 0,
+        "source": agent.source,
+        "main_session_key": agent.main_session_key,
+        "metadata_json": agent.metadata_json,
+        "last_synced_at": agent.last_synced_at,
+        "created_at": agent.created_at,
+        "updated_at": agent.updated_at,
+    }
+
+
 class DbAgentRepository(AgentRepository):
     def __init__(self, db: AsyncSession) -> None:
         self._db = db
@@ -87,27 +110,59 @@ class DbAgentRepository(AgentRepository):
         )
         return [_row_to_agent(r) for r in rows]
 
-    async def create(self, agent: Agent) -> Agent:
-        await self._db.execute(
-            insert(agents).values(
-                id=agent.id,
-                openclaw_key=agent.openclaw_key,
-                name=agent.name,
-                last_name=agent.last_name,
-                initials=agent.initials,
-                role=agent.role,
-                worker_type=agent.worker_type,
-                avatar=agent.avatar,
-                is_active=1 if agent.is_active else 0,
-                source=agent.source,
-                main_session_key=agent.main_session_key,
-                metadata_json=agent.metadata_json,
-                last_synced_at=agent.last_synced_at,
-                created_at=agent.created_at,
-                updated_at=agent.updated_at,
+    async def list_for_openclaw_sync(self, openclaw_keys: list[str]) -> list[Agent]:
+        rows = (
+            (
+                await self._db.execute(
+                    select(agents).where(
+                        or_(
+                            agents.c.openclaw_key.in_(openclaw_keys),
+                            agents.c.source == AgentSource.OPENCLAW_JSON,
+                        )
+                    )
+                )
             )
+            .mappings()
+            .all()
         )
-        await self._db.commit()
+        return [_row_to_agent(r) for r in rows]
+
+    async def apply_openclaw_sync(
+        self, *, upserts: list[Agent], deactivate_ids: list[str], synced_at: str
+    ) -> None:
+        if upserts:
+            stmt = pg_insert(agents).values([_agent_values(agent) for agent in upserts])
+            # id, created_at and main_session_key belong to the existing row.
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[agents.c.openclaw_key],
+                set_={
+                    "name": stmt.excluded.name,
+                    "last_name": stmt.excluded.last_name,
+                    "initials": stmt.excluded.initials,
+                    "role": stmt.excluded.role,
+                    "worker_type": stmt.excluded.worker_type,
+                    "avatar": stmt.excluded.avatar,
+                    "is_active": stmt.excluded.is_active,
+                    "source": stmt.excluded.source,
+                    "metadata_json": stmt.excluded.metadata_json,
+                    "last_synced_at": stmt.excluded.last_synced_at,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            await self._db.execute(stmt)
+        if deactivate_ids:
+            await self._db.execute(
+                update(agents)
+                .where(agents.c.id.in_(deactivate_ids))
+                .values(is_active=0, last_synced_at=synced_at, updated_at=synced_at)
+            )
+        await self._db.flush()
+        for agent_id in [agent.id for agent in upserts] + deactivate_ids:
+            self._invalidate_on_commit(agent_id)
+
+    async def create(self, agent: Agent) -> Agent:
+        await self._db.execute(insert(agents).values(**_agent_values(agent)))
+        await self._db.flush()
         return agent
 
     async def update(self, agent_id: str, data: dict[str, Any]) -> Agent | None:
@@ -132,13 +187,26 @@ class DbAgentRepository(AgentRepository):
         if "is_active" in values:
             values["is_active"] = 1 if values["is_active"] else 0
 
-        await self._db.execute(update(agents).where(agents.c.id == agent_id).values(**values))
-        await self._db.commit()
-        return await self.get_by_id(agent_id)
+        row = (
+            (
+                await self._db.execute(
+                    update(agents).where(agents.c.id == agent_id).values(**values).returning(agents)
+                )
+            )
+            .mappings()
+            .first()
+        )
+        await self._db.flush()
+        self._invalidate_on_commit(agent_id)
+        return _row_to_agent(row) if row else None
 
     async def delete(self, agent_id: str) -> bool:
         result = type_cast(
             CursorResult, await self._db.execute(delete(agents).where(agents.c.id == agent_id))
         )
-        await self._db.commit()
+        await self._db.flush()
+        self._invalidate_on_commit(agent_id)
         return (result.rowcount or 0) > 0
+
+    def _invalidate_on_commit(self, agent_id: str) -> None:
+        after_commit(self._db, lambda: agent_info_cache.invalidate(agent_id))
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.planning.application.ports.backlog import BacklogRepository
 from app.planning.domain.models import Backlog, BacklogItem
+from app.planning.infrastructure.shared.loaders import attach_work_item_labels
 from app.planning.infrastructure.shared.mappers import _row_to_backlog
 from app.planning.infrastructure.shared.sorting import parse_sort
 from app.planning.infrastructure.shared.sql import affected_rows
@@ -12,8 +13,6 @@ from app.planning.infrastructure.tables import (
     agents,
     backlog_items,
     backlogs,
-    labels,
-    work_item_labels,
     work_items,
 )
 from app.shared.lexorank import rank_after as lr_after
@@ -88,6 +87,16 @@ class DbBacklogRepository(BacklogRepository):
         rows = (await self._db.execute(select_q)).mappings().all()
         return [_row_to_backlog(r) for r in rows], total
 
+    async def list_by_project(self, project_id: str) -> list[Backlog]:
+        """All backlogs of a project in the default ``list_all`` order, unpaged."""
+        q = (
+            select(backlogs)
+            .where(backlogs.c.project_id == project_id)
+            .order_by(_BACKLOG_PRIORITY_EXPR.asc(), backlogs.c.rank.asc(), backlogs.c.id.asc())
+        )
+        rows = (await self._db.execute(q)).mappings().all()
+        return [_row_to_backlog(r) for r in rows]
+
     async def get_by_id(self, backlog_id: str) -> Backlog | None:
         row = (
             (await self._db.execute(select(backlogs).where(backlogs.c.id == backlog_id)))
@@ -116,7 +125,7 @@ class DbBacklogRepository(BacklogRepository):
                 updated_at=backlog.updated_at,
             )
         )
-        await self._db.commit()
+        await self._db.flush()
         return backlog
 
     async def update(self, backlog_id: str, data: dict[str, Any]) -> Backlog | None:
@@ -140,13 +149,24 @@ class DbBacklogRepository(BacklogRepository):
         if "is_default" in values:
             values["is_default"] = 1 if values["is_default"] else 0
 
-        await self._db.execute(update(backlogs).where(backlogs.c.id == backlog_id).values(**values))
-        await self._db.commit()
-        return await self.get_by_id(backlog_id)
+        row = (
+            (
+                await self._db.execute(
+                    update(backlogs)
+                    .where(backlogs.c.id == backlog_id)
+                    .values(**values)
+                    .returning(backlogs)
+                )
+            )
+            .mappings()
+            .first()
+        )
+        await self._db.flush()
+        return _row_to_backlog(row) if row else None
 
     async def delete(self, backlog_id: str) -> bool:
         result = await self._db.execute(delete(backlogs).where(backlogs.c.id == backlog_id))
-        await self._db.commit()
+        await self._db.flush()
         return affected_rows(result) > 0
 
     # ------------------------------------------------------------------
@@ -223,7 +243,7 @@ class DbBacklogRepository(BacklogRepository):
                 added_at=now,
             )
         )
-        await self._db.commit()
+        await self._db.flush()
         return BacklogItem(
             backlog_id=backlog_id,
             work_item_id=work_item_id,
@@ -238,117 +258,29 @@ class DbBacklogRepository(BacklogRepository):
                 backlog_items.c.work_item_id == work_item_id,
             )
         )
-        await self._db.commit()
+        await self._db.flush()
         return affected_rows(result) > 0
 
     async def list_items(self, backlog_id: str) -> list[dict[str, Any]]:
-        parent = work_items.alias("parent")
-        children = work_items.alias("children")
-        assignee = agents.alias("assignee")
-
-        children_count = (
-            select(func.count())
-            .where(children.c.parent_id == work_items.c.id)
-            .correlate(work_items)
-            .scalar_subquery()
-            .label("children_count")
-        )
-        done_children_count = (
-            select(func.count())
-            .where(
-                children.c.parent_id == work_items.c.id,
-                children.c.status == "DONE",
-            )
-            .correlate(work_items)
-            .scalar_subquery()
-            .label("done_children_count")
+        return await self._query_items(
+            backlog_items.c.backlog_id == backlog_id,
+            order_by=[backlog_items.c.rank.asc()],
         )
 
-        q = (
-            select(
-                backlog_items.c.backlog_id,
-                backlog_items.c.work_item_id,
-                backlog_items.c.rank,
-                backlog_items.c.added_at,
-                work_items.c.id,
-                work_items.c.key,
-                work_items.c.title,
-                work_items.c.type,
-                work_items.c.sub_type,
-                work_items.c.status,
-                work_items.c.priority,
-                work_items.c.parent_id,
-                parent.c.key.label("parent_key"),
-                parent.c.title.label("parent_title"),
-                work_items.c.current_assignee_agent_id,
-                assignee.c.name.label("assignee_name"),
-                assignee.c.last_name.label("assignee_last_name"),
-                assignee.c.initials.label("assignee_initials"),
-                assignee.c.avatar.label("assignee_avatar"),
-                work_items.c.is_blocked,
-                children_count,
-                done_children_count,
-            )
-            .select_from(
-                backlog_items.join(
-                    work_items,
-                    backlog_items.c.work_item_id == work_items.c.id,
-                )
-                .outerjoin(
-                    parent,
-                    work_items.c.parent_id == parent.c.id,
-                )
-                .outerjoin(
-                    assignee,
-                    work_items.c.current_assignee_agent_id == assignee.c.id,
-                )
-            )
-            .where(backlog_items.c.backlog_id == backlog_id)
-            .order_by(backlog_items.c.rank.asc())
-        )
-        rows = (await self._db.execute(q)).mappings().all()
-
-        # Enrich with labels
-        item_ids = [r["id"] for r in rows]
-        labels_by_item: dict[str, list[dict[str, Any]]] = {item_id: [] for item_id in item_ids}
-        if item_ids:
-            lq = (
-                select(
-                    work_item_labels.c.work_item_id,
-                    labels.c.id.label("label_id"),
-                    labels.c.name,
-                    labels.c.color,
-                )
-                .select_from(
-                    work_item_labels.join(
-                        labels,
-                        work_item_labels.c.label_id == labels.c.id,
-                    )
-                )
-                .where(work_item_labels.c.work_item_id.in_(item_ids))
-            )
-            label_rows = (await self._db.execute(lq)).mappings().all()
-            for lr in label_rows:
-                wid = lr["work_item_id"]
-                if wid in labels_by_item:
-                    labels_by_item[wid].append(
-                        {"id": lr["label_id"], "name": lr["name"], "color": lr["color"]}
-                    )
-
-        result = []
-        for r in rows:
-            d = dict(r)
-            item_labels = labels_by_item.get(d["id"], [])
-            d["labels"] = item_labels
-            d["label_ids"] = [l["id"] for l in item_labels]
-            d["assignee_agent_id"] = d.get("current_assignee_agent_id")
-            result.append(d)
-        return result
-
     async def list_items_batch(self, backlog_ids: list[str]) -> dict[str, list[dict[str, Any]]]:
         if not backlog_ids:
             return {}
+        items = await self._query_items(
+            backlog_items.c.backlog_id.in_(backlog_ids),
+            order_by=[backlog_items.c.backlog_id.asc(), backlog_items.c.rank.asc()],
+        )
+        grouped: dict[str, list[dict[str, Any]]] = {bid: [] for bid in backlog_ids}
+        for item in items:
+            grouped[item["backlog_id"]].append(item)
+        return grouped
 
+    async def _query_items(self, condition: Any, *, order_by: list[Any]) -> list[dict[str, Any]]:
+        """Backlog item cards in one query; labels come from the request loaders."""
         parent = work_items.alias("parent")
         children = work_items.alias("children")
         assignee = agents.alias("assignee")
@@ -410,52 +342,14 @@ class DbBacklogRepository(BacklogRepository):
                     work_items.c.current_assignee_agent_id == assignee.c.id,
                 )
             )
-            .where(backlog_items.c.backlog_id.in_(backlog_ids))
-            .order_by(
-                backlog_items.c.backlog_id.asc(),
-                backlog_items.c.rank.asc(),
-            )
+            .where(condition)
+            .order_by(*order_by)
         )
-        rows = (await self._db.execute(q)).mappings().all()
-
-        item_ids = [r["id"] for r in rows]
-        labels_by_item: dict[str, list[dict[str, Any]]] = {iid: [] for iid in item_ids}
-        if item_ids:
-            lq = (
-                select(
-                    work_item_labels.c.work_item_id,
-                    labels.c.id.label("label_id"),
-                    labels.c.name,
-                    labels.c.color,
-                )
-                .select_from(
-                    work_item_labels.join(
-                        labels,
-                        work_item_labels.c.label_id == labels.c.id,
-                    )
-                )
-                .where(work_item_labels.c.work_item_id.in_(item_ids))
-            )
-            for lr in (await self._db.execute(lq)).mappings().all():
-                wid = lr["work_item_id"]
-                if wid in labels_by_item:
-                    labels_by_item[wid].append(
-                        {
-                            "id": lr["label_id"],
-                            "name": lr["name"],
-                            "color": lr["color"],
-                        }
-                    )
-
-        grouped: dict[str, list[dict[str, Any]]] = {bid: [] for bid in backlog_ids}
-        for r in rows:
-            d = dict(r)
-            il = labels_by_item.get(d["id"], [])
-            d["labels"] = il
-            d["label_ids"] = [la["id"] for la in il]
-            d["assignee_agent_id"] = d.get("current_assignee_agent_id")
-            grouped[d["backlog_id"]].append(d)
-        return grouped
+        items = [dict(r) for r in (await self._db.execute(q)).mappings().all()]
+        await attach_work_item_labels(self._db, items)
+        for item in items:
+            item["assignee_agent_id"] = item["current_assignee_agent_id"]
+        return items
 
     async def update_item_rank(self, backlog_id: str, work_item_id: str, rank: str) -> bool:
         result = await self._db.execute(
@@ -466,7 +360,7 @@ class DbBacklogRepository(BacklogRepository):
             )
             .values(rank=rank)
         )
-        await self._db.commit()
+        await self._db.flush()
         return affected_rows(result) > 0
 
     # ------------------------------------------------------------------
@@ -557,7 +451,7 @@ class DbBacklogRepository(BacklogRepository):
                 added_at=now,
             )
         )
-        await self._db.commit()
+        await self._db.flush()
         return BacklogItem(
             backlog_id=target_backlog_id,
             work_item_id=work_item_id,
@@ -610,5 +504,5 @@ class DbBacklogRepository(BacklogRepository):
                     added_at=now,
                 )
             )
-        await self._db.commit()
+        await self._db.flush()
         return len(rows)
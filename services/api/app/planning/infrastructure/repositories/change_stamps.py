@@ -0,0 +1,25 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.planning.application.ports.change_stamp import ChangeStampRepository
+from app.planning.infrastructure.tables import planning_change_counters
+
+_GLOBAL_SCOPE = ""
+
+
+class DbChangeStampRepository(ChangeStampRepository):
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def get_stamp(self, *, project_id: str | None = None) -> str:
+        c = planning_change_counters.c
+        if project_id is None:
+            total = (
+                await self._db.execute(select(func.coalesce(func.sum(c.version), 0)))
+            ).scalar_one()
+            return f"all:{total}"
+        rows = await self._db.execute(
+            select(c.scope, c.version).where(c.scope.in_([project_id, _GLOBAL_SCOPE]))
+        )
+        versions = dict(rows.tuples().all())
+        return f"{project_id}:{versions.get(project_id, 0)}:{versions.get(_GLOBAL_SCOPE, 0)}"
@@ -68,7 +68,7 @@ class DbLabelRepository(LabelRepository):
                 created_at=label.created_at,
             )
         )
-        await self._db.commit()
+        await self._db.flush()
         return label
 
     async def update(self, label_id: str, data: dict[str, Any]) -> Label | None:
@@ -76,13 +76,21 @@ class DbLabelRepository(LabelRepository):
         if not values:
             return await self.get_by_id(label_id)
 
-        await self._db.execute(update(labels).where(labels.c.id == label_id).values(**values))
-        await self._db.commit()
-        return await self.get_by_id(label_id)
+        row = (
+            (
+                await self._db.execute(
+                    update(labels).where(labels.c.id == label_id).values(**values).returning(labels)
+                )
+            )
+            .mappings()
+            .first()
+        )
+        await self._db.flush()
+        return _row_to_label(row) if row else None
 
     async def delete(self, label_id: str) -> bool:
         result = type_cast(
             CursorResult, await self._db.execute(delete(labels).where(labels.c.id == label_id))
         )
-        await self._db.commit()
+        await self._db.flush()
         return (result.rowcount or 0) > 0
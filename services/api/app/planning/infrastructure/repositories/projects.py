@@ -12,6 +12,8 @@ from app.planning.domain.models import Project
 from app.planning.infrastructure.shared.mappers import _row_to_project
 from app.planning.infrastructure.shared.sorting import parse_sort
 from app.planning.infrastructure.tables import project_counters, projects
+from app.shared.db.unit_of_work import after_commit
+from app.shared.lookup_cache import project_repo_root_cache
 from app.shared.utils import utc_now
 
 _SORT_ALLOWED_PROJECT = {
@@ -103,7 +105,7 @@ class DbProjectRepository(ProjectRepository):
                 updated_at=project.updated_at,
             )
         )
-        await self._db.commit()
+        await self._db.flush()
         return project
 
     async def update(self, project_id: str, data: dict[str, Any]) -> Project | None:
@@ -123,16 +125,29 @@ class DbProjectRepository(ProjectRepository):
         if data.get("is_default") is True:
             await self._unset_default_projects(except_project_id=project_id)
 
-        await self._db.execute(update(projects).where(projects.c.id == project_id).values(**values))
-        await self._db.commit()
-        return await self.get_by_id(project_id)
+        row = (
+            (
+                await self._db.execute(
+                    update(projects)
+                    .where(projects.c.id == project_id)
+                    .values(**values)
+                    .returning(projects)
+                )
+            )
+            .mappings()
+            .first()
+        )
+        await self._db.flush()
+        after_commit(self._db, lambda: project_repo_root_cache.invalidate(project_id))
+        return _row_to_project(row) if row else None
 
     async def delete(self, project_id: str) -> bool:
         result = type_cast(
             CursorResult,
             await self._db.execute(delete(projects).where(projects.c.id == project_id)),
         )
-        await self._db.commit()
+        await self._db.flush()
+        after_commit(self._db, lambda: project_repo_root_cache.invalidate(project_id))
         return (result.rowcount or 0) > 0
 
     async def create_project_counter(self, project_id: str) -> None:
@@ -141,4 +156,4 @@ class DbProjectRepository(ProjectRepository):
             .values(project_id=project_id, next_number=1, updated_at=utc_now())
             .on_conflict_do_nothing()
         )
-        await self._db.commit()
+        await self._db.flush()
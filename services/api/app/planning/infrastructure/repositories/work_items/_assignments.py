@@ -54,7 +54,7 @@ async def create_assignment(db: AsyncSession, assignment: WorkItemAssignment) ->
             reason=assignment.reason,
         )
     )
-    await db.commit()
+    await db.flush()
     return assignment
 
 
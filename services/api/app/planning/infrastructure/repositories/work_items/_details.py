@@ -0,0 +1,150 @@
+"""Work item detail reads: the item with its parent, child counts, labels and assignments."""
+
+from typing import Any
+
+from sqlalchemy import Text, any_, bindparam, func, literal_column, select
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.planning.domain.models import WorkItem
+from app.planning.infrastructure.shared.mappers import _row_to_work_item
+from app.planning.infrastructure.tables import (
+    labels,
+    work_item_assignments,
+    work_item_labels,
+    work_items,
+)
+
+
+async def get_details(
+    db: AsyncSession, *, work_item_ids: list[str] | None = None, keys: list[str] | None = None
+) -> list[dict[str, Any]]:
+    """Item, parent, child counts, labels and assignment history in one query.
+
+    Matches ``id = ANY(:ids)`` or ``key = ANY(:keys)`` (keys upper-cased);
+    rows come back in no particular order and missing refs are simply absent.
+    """
+    parent = work_items.alias("parent")
+    children = work_items.alias("children")
+    wa = work_item_assignments
+
+    children_count = (
+        select(func.count())
+        .where(children.c.parent_id == work_items.c.id)
+        .correlate(work_items)
+        .scalar_subquery()
+    )
+    done_children_count = (
+        select(func.count())
+        .where(children.c.parent_id == work_items.c.id, children.c.status == "DONE")
+        .correlate(work_items)
+        .scalar_subquery()
+    )
+    label_json = func.json_build_object(
+        "id", labels.c.id, "name", labels.c.name, "color", labels.c.color
+    )
+    labels_agg = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        label_json, work_item_labels.c.added_at.asc(), labels.c.name.asc()
+                    )
+                ),
+                literal_column("'[]'::json"),
+            )
+        )
+        .select_from(work_item_labels.join(labels, work_item_labels.c.label_id == labels.c.id))
+        .where(work_item_labels.c.work_item_id == work_items.c.id)
+        .correlate(work_items)
+        .scalar_subquery()
+    )
+    assignment_json = func.json_build_object(
+        "id",
+        wa.c.id,
+        "work_item_id",
+        wa.c.work_item_id,
+        "agent_id",
+        wa.c.agent_id,
+        "assigned_at",
+        wa.c.assigned_at,
+        "unassigned_at",
+        wa.c.unassigned_at,
+        "assigned_by",
+        wa.c.assigned_by,
+        "reason",
+        wa.c.reason,
+    )
+    assignments_agg = (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(assignment_json, wa.c.assigned_at.desc())),
+                literal_column("'[]'::json"),
+            )
+        )
+        .where(wa.c.work_item_id == work_items.c.id)
+        .correlate(work_items)
+        .scalar_subquery()
+    )
+
+    q = select(
+        work_items,
+        parent.c.key.label("parent_key"),
+        parent.c.title.label("parent_title"),
+        children_count.label("children_count"),
+        done_children_count.label("done_children_count"),
+        labels_agg.label("labels"),
+        assignments_agg.label("assignments"),
+    ).select_from(work_items.outerjoin(parent, work_items.c.parent_id == parent.c.id))
+    if work_item_ids:
+        q = q.where(
+            work_items.c.id == any_(bindparam("ids", list(work_item_ids), type_=ARRAY(Text)))
+        )
+    elif keys:
+        upper_keys = [k.upper() for k in keys]
+        q = q.where(work_items.c.key == any_(bindparam("keys", upper_keys, type_=ARRAY(Text))))
+    else:
+        return []
+
+    details = []
+    for row in (await db.execute(q)).mappings():
+        detail = to_enriched_dict(_row_to_work_item(row))
+        detail["parent_key"] = row["parent_key"]
+        detail["parent_title"] = row["parent_title"]
+        detail["children_count"] = row["children_count"]
+        detail["done_children_count"] = row["done_children_count"]
+        detail["labels"] = row["labels"]
+        detail["label_ids"] = [la["id"] for la in row["labels"]]
+        detail["assignments"] = row["assignments"]
+        details.append(detail)
+    return details
+
+
+def to_enriched_dict(item: WorkItem) -> dict[str, Any]:
+    return {
+        "id": item.id,
+        "type": item.type.value,
+        "project_id": item.project_id,
+        "parent_id": item.parent_id,
+        "key": item.key,
+        "title": item.title,
+        "sub_type": item.sub_type,
+        "summary": item.summary,
+        "description": item.description,
+        "status": item.status.value,
+        "status_mode": item.status_mode.value,
+        "status_override": item.status_override,
+        "is_blocked": item.is_blocked,
+        "blocked_reason": item.blocked_reason,
+        "priority": item.priority,
+        "estimate_points": item.estimate_points,
+        "due_at": item.due_at,
+        "current_assignee_agent_id": item.current_assignee_agent_id,
+        "metadata_json": item.metadata_json,
+        "created_by": item.created_by,
+        "updated_by": item.updated_by,
+        "created_at": item.created_at,
+        "updated_at": item.updated_at,
+        "started_at": item.started_at,
+        "completed_at": item.completed_at,
+    }
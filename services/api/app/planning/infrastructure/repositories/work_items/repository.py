@@ -1,6 +1,14 @@
 from typing import Any
 
-from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy import (
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    union_all,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.planning.application.ports.work_item import WorkItemRepository
@@ -11,9 +19,12 @@ from app.planning.domain.models import (
     WorkItemStatus,
 )
 from app.planning.infrastructure.repositories.work_items import _assignments
+from app.planning.infrastructure.repositories.work_items._details import get_details as _get_details
+from app.planning.infrastructure.repositories.work_items._details import to_enriched_dict
 from app.planning.infrastructure.repositories.work_items._overview import (
     list_overview as _list_overview,
 )
+from app.planning.infrastructure.shared.loaders import attach_work_item_labels
 from app.planning.infrastructure.shared.mappers import _row_to_work_item
 from app.planning.infrastructure.shared.sorting import parse_sort
 from app.planning.infrastructure.shared.sql import affected_rows
@@ -27,6 +38,7 @@ from app.planning.infrastructure.tables import (
     work_item_labels,
     work_items,
 )
+from app.shared.lexorank import rank_batch
 from app.shared.utils import utc_now
 
 _SORT_ALLOWED = {
@@ -40,6 +52,37 @@ _SORT_ALLOWED = {
 }
 
 
+def _work_item_values(work_item: WorkItem) -> dict[str, Any]:
+    return {
+        "id": work_item.id,
+        "project_id": work_item.project_id,
+        "parent_id": work_item.parent_id,
+        "key": work_item.key,
+        "type": work_item.type.value,
+        "sub_type": work_item.sub_type,
+        "title": work_item.title,
+        "summary": work_item.summary,
+        "description": work_item.description,
+        "status": work_item.status.value,
+        "status_mode": work_item.status_mode.value,
+        "status_override": work_item.status_override,
+        "status_override_set_at": work_item.status_override_set_at,
+        "is_blocked": 1 if work_item.is_blocked else 0,
+        "blocked_reason": work_item.blocked_reason,
+        "priority": work_item.priority,
+        "estimate_points": work_item.estimate_points,
+        "due_at": work_item.due_at,
+        "current_assignee_agent_id": work_item.current_assignee_agent_id,
+        "metadata_json": work_item.metadata_json,
+        "created_by": work_item.created_by,
+        "updated_by": work_item.updated_by,
+        "created_at": work_item.created_at,
+        "updated_at": work_item.updated_at,
+        "started_at": work_item.started_at,
+        "completed_at": work_item.completed_at,
+    }
+
+
 class DbWorkItemRepository(WorkItemRepository):
     def __init__(self, db: AsyncSession) -> None:
         self._db = db
@@ -47,9 +90,6 @@ class DbWorkItemRepository(WorkItemRepository):
     async def flush(self) -> None:
         await self._db.flush()
 
-    async def commit(self) -> None:
-        await self._db.commit()
-
     # ------------------------------------------------------------------
     # CRUD
     # ------------------------------------------------------------------
@@ -128,71 +168,28 @@ class DbWorkItemRepository(WorkItemRepository):
         )
         return _row_to_work_item(row) if row else None
 
-    async def create(self, work_item: WorkItem) -> WorkItem:
-        await self._db.execute(
-            insert(work_items).values(
-                id=work_item.id,
-                project_id=work_item.project_id,
-                parent_id=work_item.parent_id,
-                key=work_item.key,
-                type=work_item.type.value,
-                sub_type=work_item.sub_type,
-                title=work_item.title,
-                summary=work_item.summary,
-                description=work_item.description,
-                status=work_item.status.value,
-                status_mode=work_item.status_mode.value,
-                status_override=work_item.status_override,
-                status_override_set_at=work_item.status_override_set_at,
-                is_blocked=1 if work_item.is_blocked else 0,
-                blocked_reason=work_item.blocked_reason,
-                priority=work_item.priority,
-                estimate_points=work_item.estimate_points,
-                due_at=work_item.due_at,
-                current_assignee_agent_id=work_item.current_assignee_agent_id,
-                metadata_json=work_item.metadata_json,
-                created_by=work_item.created_by,
-                updated_by=work_item.updated_by,
-                created_at=work_item.created_at,
-                updated_at=work_item.updated_at,
-                started_at=work_item.started_at,
-                completed_at=work_item.completed_at,
-            )
+    async def get_details(
+        self, *, work_item_ids: list[str] | None = None, keys: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        return await _get_details(self._db, work_item_ids=work_item_ids, keys=keys)
+
+    async def get_by_ids(self, work_item_ids: list[str]) -> dict[str, WorkItem]:
+        if not work_item_ids:
+            return {}
+        rows = (
+            (await self._db.execute(select(work_items).where(work_items.c.id.in_(work_item_ids))))
+            .mappings()
+            .all()
         )
-        await self._db.commit()
+        return {row["id"]: _row_to_work_item(row) for row in rows}
+
+    async def create(self, work_item: WorkItem) -> WorkItem:
+        await self._db.execute(insert(work_items).values(**_work_item_values(work_item)))
+        await self._db.flush()
         return work_item
 
     async def create_in_backlog(self, work_item: WorkItem, backlog_id: str) -> WorkItem:
-        await self._db.execute(
-            insert(work_items).values(
-                id=work_item.id,
-                project_id=work_item.project_id,
-                parent_id=work_item.parent_id,
-                key=work_item.key,
-                type=work_item.type.value,
-                sub_type=work_item.sub_type,
-                title=work_item.title,
-                summary=work_item.summary,
-                description=work_item.description,
-                status=work_item.status.value,
-                status_mode=work_item.status_mode.value,
-                status_override=work_item.status_override,
-                status_override_set_at=work_item.status_override_set_at,
-                is_blocked=1 if work_item.is_blocked else 0,
-                blocked_reason=work_item.blocked_reason,
-                priority=work_item.priority,
-                estimate_points=work_item.estimate_points,
-                due_at=work_item.due_at,
-                current_assignee_agent_id=work_item.current_assignee_agent_id,
-                metadata_json=work_item.metadata_json,
-                created_by=work_item.created_by,
-                updated_by=work_item.updated_by,
-                created_at=work_item.created_at,
-                updated_at=work_item.updated_at,
-                started_at=work_item.started_at,
-                completed_at=work_item.completed_at,
-            )
-        )
+        await self._db.execute(insert(work_items).values(**_work_item_values(work_item)))
         await self._db.execute(
             insert(backlog_items).values(
                 backlog_id=backlog_id,
@@ -201,9 +198,60 @@ class DbWorkItemRepository(WorkItemRepository):
                 added_at=work_item.created_at,
             )
         )
-        await self._db.commit()
+        await self._db.flush()
         return work_item
 
+    async def create_many(
+        self,
+        items: list[WorkItem],
+        *,
+        backlog_ids: dict[str, str],
+        label_ids: dict[str, list[str]],
+    ) -> list[WorkItem]:
+        if not items:
+            return []
+        await self._db.execute(insert(work_items), [_work_item_values(i) for i in items])
+
+        # Append each backlog's new members after its current last rank, in input order.
+        members: dict[str, list[WorkItem]] = {}
+        for item in items:
+            if item.id in backlog_ids:
+                members.setdefault(backlog_ids[item.id], []).append(item)
+        if members:
+            last_ranks = dict(
+                (
+                    await self._db.execute(
+                        select(backlog_items.c.backlog_id, func.max(backlog_items.c.rank))
+                        .where(backlog_items.c.backlog_id.in_(list(members)))
+                        .group_by(backlog_items.c.backlog_id)
+                    )
+                ).all()
+            )
+            await self._db.execute(
+                insert(backlog_items),
+                [
+                    {
+                        "backlog_id": backlog_id,
+                        "work_item_id": item.id,
+                        "rank": last_ranks.get(backlog_id, "") + rank,
+                        "added_at": item.created_at,
+                    }
+                    for backlog_id, backlog_members in members.items()
+                    for item, rank in zip(backlog_members, rank_batch(len(backlog_members)))
+                ],
+            )
+
+        label_rows = [
+            {"work_item_id": item.id, "label_id": label_id, "added_at": item.created_at}
+            for item in items
+            for label_id in label_ids.get(item.id, [])
+        ]
+        if label_rows:
+            await self._db.execute(insert(work_item_labels), label_rows)
+
+        await self._db.flush()
+        return items
+
     async def update(self, work_item_id: str, data: dict[str, Any]) -> WorkItem | None:
         allowed = {
             "title",
@@ -234,15 +282,24 @@ class DbWorkItemRepository(WorkItemRepository):
         if "is_blocked" in values:
             values["is_blocked"] = 1 if values["is_blocked"] else 0
 
-        await self._db.execute(
-            update(work_items).where(work_items.c.id == work_item_id).values(**values)
+        row = (
+            (
+                await self._db.execute(
+                    update(work_items)
+                    .where(work_items.c.id == work_item_id)
+                    .values(**values)
+                    .returning(work_items)
+                )
+            )
+            .mappings()
+            .first()
         )
-        await self._db.commit()
-        return await self.get_by_id(work_item_id)
+        await self._db.flush()
+        return _row_to_work_item(row) if row else None
 
     async def delete(self, work_item_id: str) -> bool:
         result = await self._db.execute(delete(work_items).where(work_items.c.id == work_item_id))
-        await self._db.commit()
+        await self._db.flush()
         return affected_rows(result) > 0
 
     # ------------------------------------------------------------------
@@ -332,10 +389,67 @@ class DbWorkItemRepository(WorkItemRepository):
         allocated = row - 1
         return f"{proj_row['key']}-{allocated}"
 
+    async def allocate_keys(self, project_id: str, count: int) -> list[str]:
+        # One increment reserves the whole range under a single row lock.
+        row = (
+            (
+                await self._db.execute(
+                    update(project_counters)
+                    .where(
+                        project_counters.c.project_id == project_id,
+                        projects.c.id == project_counters.c.project_id,
+                    )
+                    .values(
+                        next_number=project_counters.c.next_number + count,
+                        updated_at=utc_now(),
+                    )
+                    .returning(project_counters.c.next_number, projects.c.key)
+                )
+            )
+            .mappings()
+            .first()
+        )
+        if row is None:
+            msg = f"Counter for project {project_id} not found"
+            raise ValueError(msg)
+
+        first = row["next_number"] - count
+        return [f"{row['key']}-{number}" for number in range(first, first + count)]
+
     # ------------------------------------------------------------------
     # Existence checks
     # ------------------------------------------------------------------
 
+    async def find_missing_references(
+        self,
+        *,
+        project_ids: set[str],
+        agent_ids: set[str],
+        backlog_ids: set[str],
+        label_ids: set[str],
+    ) -> dict[str, set[str]]:
+        requested = {
+            "project": (projects, project_ids),
+            "agent": (agents, agent_ids),
+            "backlog": (backlogs, backlog_ids),
+            "label": (labels, label_ids),
+        }
+        selects = [
+            select(literal(kind).label("kind"), table.c.id).where(table.c.id.in_(list(ids)))
+            for kind, (table, ids) in requested.items()
+            if ids
+        ]
+        if not selects:
+            return {}
+        found: dict[str, set[str]] = {}
+        for kind, ref_id in (await self._db.execute(union_all(*selects))).all():
+            found.setdefault(kind, set()).add(ref_id)
+        return {
+            kind: missing
+            for kind, (_, ids) in requested.items()
+            if (missing := ids - found.get(kind, set()))
+        }
+
     async def project_exists(self, project_id: str) -> bool:
         row = await self._db.execute(
             select(func.count()).select_from(projects).where(projects.c.id == project_id)
@@ -364,19 +478,6 @@ class DbWorkItemRepository(WorkItemRepository):
     # Labels
     # ------------------------------------------------------------------
 
-    async def get_labels(self, work_item_id: str) -> list[dict[str, Any]]:
-        q = (
-            select(
-                labels.c.id.label("label_id"),
-                labels.c.name,
-                labels.c.color,
-            )
-            .select_from(work_item_labels.join(labels, work_item_labels.c.label_id == labels.c.id))
-            .where(work_item_labels.c.work_item_id == work_item_id)
-        )
-        rows = (await self._db.execute(q)).mappings().all()
-        return [{"id": r["label_id"], "name": r["name"], "color": r["color"]} for r in rows]
-
     async def label_attached(self, work_item_id: str, label_id: str) -> bool:
         row = await self._db.execute(
             select(func.count())
@@ -396,7 +497,7 @@ class DbWorkItemRepository(WorkItemRepository):
                 added_at=utc_now(),
             )
         )
-        await self._db.commit()
+        await self._db.flush()
 
     async def detach_label(self, work_item_id: str, label_id: str) -> bool:
         result = await self._db.execute(
@@ -405,7 +506,7 @@ class DbWorkItemRepository(WorkItemRepository):
                 work_item_labels.c.label_id == label_id,
             )
         )
-        await self._db.commit()
+        await self._db.flush()
         return affected_rows(result) > 0
 
     # ------------------------------------------------------------------
@@ -555,7 +656,7 @@ class DbWorkItemRepository(WorkItemRepository):
                 updated_at=utc_now(),
             )
         )
-        await self._db.commit()
+        await self._db.flush()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -629,7 +730,6 @@ class DbWorkItemRepository(WorkItemRepository):
         if not order:
             order = [work_items.c.created_at.desc()]
 
-        parent = work_items.alias("parent")
         children = work_items.alias("children")
 
         children_count = (
@@ -650,6 +750,7 @@ class DbWorkItemRepository(WorkItemRepository):
             .label("done_children_count")
         )
 
+        parent = work_items.alias("parent")
         count_q = select(func.count()).select_from(work_items)
         select_q = select(
             work_items,
@@ -666,75 +767,13 @@ class DbWorkItemRepository(WorkItemRepository):
         total = (await self._db.execute(count_q)).scalar_one()
         rows = (await self._db.execute(select_q)).mappings().all()
 
-        item_ids = [r["id"] for r in rows]
-        labels_by_item: dict[str, list[dict[str, Any]]] = {iid: [] for iid in item_ids}
-        if item_ids:
-            lq = (
-                select(
-                    work_item_labels.c.work_item_id,
-                    labels.c.id.label("label_id"),
-                    labels.c.name,
-                    labels.c.color,
-                )
-                .select_from(
-                    work_item_labels.join(
-                        labels,
-                        work_item_labels.c.label_id == labels.c.id,
-                    )
-                )
-                .where(work_item_labels.c.work_item_id.in_(item_ids))
-            )
-            for lr in (await self._db.execute(lq)).mappings().all():
-                wid = lr["work_item_id"]
-                if wid in labels_by_item:
-                    labels_by_item[wid].append(
-                        {
-                            "id": lr["label_id"],
-                            "name": lr["name"],
-                            "color": lr["color"],
-                        }
-                    )
-
         result = []
         for r in rows:
-            item = _row_to_work_item(r)
-            d = _to_enriched_dict(item)
+            d = to_enriched_dict(_row_to_work_item(r))
             d["parent_key"] = r["parent_key"]
             d["parent_title"] = r["parent_title"]
             d["children_count"] = r["children_count"]
             d["done_children_count"] = r["done_children_count"]
-            item_labels = labels_by_item.get(d["id"], [])
-            d["labels"] = item_labels
-            d["label_ids"] = [la["id"] for la in item_labels]
             result.append(d)
+        await attach_work_item_labels(self._db, result)
         return result, total
-
-
-def _to_enriched_dict(item: WorkItem) -> dict[str, Any]:
-    return {
-        "id": item.id,
-        "type": item.type.value,
-        "project_id": item.project_id,
-        "parent_id": item.parent_id,
-        "key": item.key,
-        "title": item.title,
-        "sub_type": item.sub_type,
-        "summary": item.summary,
-        "description": item.description,
-        "status": item.status.value,
-        "status_mode": item.status_mode.value,
-        "status_override": item.status_override,
-        "is_blocked": item.is_blocked,
-        "blocked_reason": item.blocked_reason,
-        "priority": item.priority,
-        "estimate_points": item.estimate_points,
-        "due_at": item.due_at,
-        "current_assignee_agent_id": item.current_assignee_agent_id,
-        "metadata_json": item.metadata_json,
-        "created_by": item.created_by,
-        "updated_by": item.updated_by,
-        "created_at": item.created_at,
-        "updated_at": item.updated_at,
-        "started_at": item.started_at,
-        "completed_at": item.completed_at,
-    }
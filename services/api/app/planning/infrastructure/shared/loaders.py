@@ -0,0 +1,111 @@
+"""Request-scoped batch loaders for planning read enrichment.
+
+Labels per work item are a one-to-many lookup that a list query cannot join
+without multiplying its rows, so every read path used to run its own copy of
+the label query. The loaders live on the request's session
+(``session.info``), so all repositories used within one request share them:
+labels are fetched with one ``IN (...)`` query for the items not loaded yet,
+and repeated items are served from the cache. Any INSERT/UPDATE/DELETE
+through the session, or a rollback, drops the cached values so reads after a
+write see fresh rows. To-one refs (parent, assignee) stay joins in the list
+queries themselves, which costs no extra round trip.
+"""
+
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.planning.infrastructure.tables import labels, work_item_labels
+
+V = TypeVar("V")
+
+_LOADERS_KEY = "planning_loaders"
+
+
+class BatchLoader(Generic[V]):
+    """Caches ``key -> value`` and fetches unseen keys in one batch call."""
+
+    def __init__(self, fetch: Callable[[list[str]], Awaitable[dict[str, V]]]) -> None:
+        self._fetch = fetch
+        self._cache: dict[str, V | None] = {}
+
+    async def load_many(self, keys: Iterable[str | None]) -> dict[str, V]:
+        wanted = list(dict.fromkeys(k for k in keys if k is not None))
+        missing = [k for k in wanted if k not in self._cache]
+        if missing:
+            found = await self._fetch(missing)
+            for k in missing:
+                self._cache[k] = found.get(k)
+        return {k: v for k in wanted if (v := self._cache[k]) is not None}
+
+    async def load(self, key: str | None) -> V | None:
+        if key is None:
+            return None
+        return (await self.load_many([key])).get(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class PlanningLoaders:
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+        self.labels: BatchLoader[list[dict[str, Any]]] = BatchLoader(self._fetch_labels)
+
+    def clear(self) -> None:
+        self.labels.clear()
+
+    async def _fetch_labels(self, work_item_ids: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Labels per work item id, in attach order."""
+        q = (
+            select(
+                work_item_labels.c.work_item_id,
+                labels.c.id,
+                labels.c.name,
+                labels.c.color,
+            )
+            .select_from(work_item_labels.join(labels, work_item_labels.c.label_id == labels.c.id))
+            .where(work_item_labels.c.work_item_id.in_(work_item_ids))
+            .order_by(work_item_labels.c.added_at.asc(), labels.c.name.asc())
+        )
+        by_item: dict[str, list[dict[str, Any]]] = {wid: [] for wid in work_item_ids}
+        for row in (await self._db.execute(q)).mappings():
+            by_item[row["work_item_id"]].append(
+                {"id": row["id"], "name": row["name"], "color": row["color"]}
+            )
+        return by_item
+
+
+def planning_loaders(db: AsyncSession) -> PlanningLoaders:
+    """The loaders bound to *db*, created on first use."""
+    loaders = db.info.get(_LOADERS_KEY)
+    if loaders is None:
+        loaders = db.info[_LOADERS_KEY] = PlanningLoaders(db)
+    return loaders
+
+
+async def attach_work_item_labels(db: AsyncSession, items: list[dict[str, Any]]) -> None:
+    """Fill ``labels`` and ``label_ids`` of each work item row in place."""
+    labels_by_item = await planning_loaders(db).labels.load_many(item["id"] for item in items)
+    for item in items:
+        item_labels = labels_by_item.get(item["id"], [])
+        item["labels"] = item_labels
+        item["label_ids"] = [la["id"] for la in item_labels]
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _clear_on_write(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        loaders = state.session.info.get(_LOADERS_KEY)
+        if loaders is not None:
+            loaders.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session: Session) -> None:
+    loaders = session.info.get(_LOADERS_KEY)
+    if loaders is not None:
+        loaders.clear()
@@ -1,36 +1,116 @@
 import asyncio
+import hashlib
 import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from app.planning.application.ports import OpenClawAgentSourcePort
 
 
+@dataclass(frozen=True)
+class _Snapshot:
+    mtime_ns: int
+    size: int
+    digest: str
+    agents: list[dict[str, Any]]
+    error: str | None
+
+
+# Parsed configs per path, shared by the per-request sources and the watcher.
+_snapshots: dict[Path, _Snapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def parse_agents_list(data: bytes, path: Path) -> list[dict[str, Any]]:
+    """The ``agents.list`` entries of an ``openclaw.json`` payload."""
+    try:
+        payload = json.loads(data.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"OpenClaw config is not valid JSON: {path}") from exc
+
+    if not isinstance(payload, dict):
+        raise ValueError("OpenClaw config root must be an object")
+
+    agents_section = payload.get("agents")
+    if not isinstance(agents_section, dict):
+        raise ValueError("OpenClaw config must contain agents.list")
+
+    raw_list = agents_section.get("list")
+    if not isinstance(raw_list, list):
+        raise ValueError("OpenClaw config agents.list must be an array")
+
+    return [item for item in raw_list if isinstance(item, dict)]
+
+
 class FileOpenClawAgentSource(OpenClawAgentSourcePort):
-    def __init__(self, config_path: str) -> None:
+    """Reads ``agents.list`` from ``openclaw.json``.
+
+    The parsed list is cached per path. An unchanged mtime and size skip the
+    read entirely; a changed mtime with identical content (e.g. ``touch``)
+    re-hashes the file but does not re-parse it.
+    """
+
+    def __init__(
+        self,
+        config_path: str,
+        *,
+        parse: Callable[[bytes, Path], list[dict[str, Any]]] = parse_agents_list,
+    ) -> None:
         self._path = Path(config_path)
+        self._parse = parse
 
     async def list_agents(self) -> list[dict[str, Any]]:
-        return await asyncio.to_thread(self._read_agents)
-
-    def _read_agents(self) -> list[dict[str, Any]]:
-        if not self._path.exists():
+        snapshot = await asyncio.to_thread(self._snapshot)
+        if snapshot is None:
             raise ValueError(f"OpenClaw config not found: {self._path}")
+        if snapshot.error is not None:
+            raise ValueError(snapshot.error)
+        return [dict(item) for item in snapshot.agents]
 
-        try:
-            payload = json.loads(self._path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"OpenClaw config is not valid JSON: {self._path}") from exc
+    async def fingerprint(self) -> str | None:
+        snapshot = await asyncio.to_thread(self._snapshot)
+        return None if snapshot is None else snapshot.digest
 
-        if not isinstance(payload, dict):
-            raise ValueError("OpenClaw config root must be an object")
+    def _snapshot(self) -> _Snapshot | None:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return None
 
-        agents_section = payload.get("agents")
-        if not isinstance(agents_section, dict):
-            raise ValueError("OpenClaw config must contain agents.list")
+        with _snapshots_lock:
+            cached = _snapshots.get(self._path)
+        if cached and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+            return cached
 
-        raw_list = agents_section.get("list")
-        if not isinstance(raw_list, list):
-            raise ValueError("OpenClaw config agents.list must be an array")
+        try:
+            data = self._path.read_bytes()
+        except FileNotFoundError:
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        if cached and cached.digest == digest:
+            snapshot = _Snapshot(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                digest=digest,
+                agents=cached.agents,
+                error=cached.error,
+            )
+        else:
+            try:
+                agents, error = self._parse(data, self._path), None
+            except ValueError as exc:
+                agents, error = [], str(exc)
+            snapshot = _Snapshot(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                digest=digest,
+                agents=agents,
+                error=error,
+            )
 
-        return [item for item in raw_list if isinstance(item, dict)]
+        with _snapshots_lock:
+            _snapshots[self._path] = snapshot
+        return snapshot
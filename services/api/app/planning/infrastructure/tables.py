@@ -1,5 +1,6 @@
 from sqlalchemy import (
     REAL,
+    BigInteger,
     Column,
     ForeignKey,
     Index,
@@ -240,6 +241,17 @@ work_item_status_history = Table(
     Column("note", Text),
 )
 
+# ---------------------------------------------------------------------------
+# Change counters — bumped by DB triggers (see migration 20260327_019)
+# ---------------------------------------------------------------------------
+
+planning_change_counters = Table(
+    "planning_change_counters",
+    metadata,
+    Column("scope", Text, primary_key=True),
+    Column("version", BigInteger, nullable=False, server_default=text("0")),
+)
+
 # ---------------------------------------------------------------------------
 # Indexes
 # ---------------------------------------------------------------------------
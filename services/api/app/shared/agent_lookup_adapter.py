@@ -1,6 +1,7 @@
 from sqlalchemy import column, select, table
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.shared.lookup_cache import agent_info_cache
 from app.shared.ports import AgentInfo, AgentLookupPort
 
 # Ad-hoc table reference — avoids importing app.planning.infrastructure.tables
@@ -12,13 +13,18 @@ class DbAgentLookupAdapter(AgentLookupPort):
     """Thin adapter implementing AgentLookupPort via direct DB read.
 
     Lives in shared/ because both planning and control-plane modules
-    need it in their composition roots.
+    need it in their composition roots. Results are served from the
+    process-wide ``agent_info_cache``; planning agent writes invalidate it.
     """
 
     def __init__(self, db: AsyncSession) -> None:
         self._db = db
 
     async def get_agent_by_id(self, agent_id: str) -> AgentInfo | None:
+        cached = agent_info_cache.get(agent_id)
+        if cached is not None:
+            return cached
+
         row = (
             await self._db.execute(
                 select(
@@ -30,8 +36,10 @@ class DbAgentLookupAdapter(AgentLookupPort):
         ).first()
         if row is None:
             return None
-        return AgentInfo(
+        info = AgentInfo(
             agent_id=str(row.id),
             openclaw_key=str(row.openclaw_key),
             main_session_key=str(row.main_session_key) if row.main_session_key else None,
         )
+        agent_info_cache.set(agent_id, info)
+        return info
@@ -0,0 +1,70 @@
+"""ETag / If-None-Match handling for cacheable GET responses."""
+
+import hashlib
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Clients may keep the body but must revalidate it (cheaply, via 304) before each reuse.
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an If-None-Match header (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    opaque = etag.removeprefix("W/")
+    return any(c == "*" or c.removeprefix("W/") == opaque for c in candidates)
+
+
+def request_etag(request: Request, stamp: str) -> str:
+    """Weak ETag for a data version ``stamp`` as seen through this URL (path and query)."""
+    key = "\x1f".join((stamp, request.url.path, request.url.query))
+    return f'W/"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def not_modified_response(
+    request: Request,
+    etag: str,
+    *,
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+) -> Response | None:
+    """304 when If-None-Match already names ``etag``; ``None`` means build the body.
+
+    Lets a route compare a cheap version stamp before running its expensive queries.
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    return None
+
+
+def etag_json_response(
+    content: BaseModel,
+    etag: str,
+    *,
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+) -> Response:
+    body = JSONResponse(content=jsonable_encoder(content)).body
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def conditional_json_response(
+    request: Request,
+    content: BaseModel,
+    *,
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+) -> Response:
+    """Serialize ``content`` with a body-hash ETag; 304 when the client already has it."""
+    body = JSONResponse(content=jsonable_encoder(content)).body
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
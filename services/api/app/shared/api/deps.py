@@ -2,9 +2,14 @@ from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.shared.db.session import get_db_session
+from app.shared.db.unit_of_work import unit_of_work
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async for session in get_db_session():
+    """Request-scoped unit of work; commits after the endpoint returns.
+
+    Declare it with ``Depends(get_db, scope="function")`` so the commit (and
+    any commit error) lands before the response is sent.
+    """
+    async with unit_of_work() as session:
         yield session
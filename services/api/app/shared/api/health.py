@@ -1,8 +1,18 @@
+from dataclasses import asdict
+from typing import Any
+
 from fastapi import APIRouter
 
+from app.shared.lookup_cache import lookup_cache_stats
+
 router = APIRouter(tags=["health"])
 
 
 @router.get("/healthz")
 def healthz() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/healthz/caches")
+def healthz_caches() -> dict[str, Any]:
+    return {"caches": [asdict(stats) for stats in lookup_cache_stats()]}
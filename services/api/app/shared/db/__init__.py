@@ -3,17 +3,18 @@ from app.shared.db.revision_check import assert_database_revision_is_current
 from app.shared.db.session import (
     close_db_engine,
     get_async_engine,
-    get_db_session,
     get_session_factory,
     init_db_engine,
 )
+from app.shared.db.unit_of_work import after_commit, unit_of_work
 
 __all__ = [
+    "after_commit",
     "assert_database_revision_is_current",
     "close_db_engine",
     "get_async_engine",
-    "get_db_session",
     "get_session_factory",
     "init_db_engine",
     "metadata",
+    "unit_of_work",
 ]
@@ -0,0 +1,49 @@
+"""One transaction per request or background task.
+
+Repositories only flush; whoever opens the unit of work commits once at the
+end, or rolls back when the work raises. Side effects that must wait until
+the data is durable (cache invalidation) are registered with ``after_commit``
+and dropped on rollback.
+"""
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.shared.db.session import get_session_factory
+
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[AsyncSession]:
+    async with get_session_factory()() as session:
+        committed = False
+        try:
+            yield session
+            await session.commit()
+            committed = True
+        finally:
+            # Also reached when the caller's generator is closed (GeneratorExit)
+            # or cancelled mid-request, not only when the work raises.
+            if not committed:
+                await session.rollback()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run *callback* once the session's current transaction commits."""
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
@@ -0,0 +1,76 @@
+import importlib.util
+import logging
+
+import httpx
+
+from app.config import settings
+from app.shared.logging import log_event
+
+logger = logging.getLogger(__name__)
+
+_state: dict[str, httpx.AsyncClient] = {}
+
+_DAPR_KEY = "dapr"
+_LANGFUSE_KEY = "langfuse"
+
+_DAPR_TIMEOUT_SECONDS = 8.0
+_DAPR_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=30.0,
+)
+
+
+def get_dapr_http_client() -> httpx.AsyncClient:
+    """App-lifetime keep-alive client for the local Dapr sidecar."""
+    client = _state.get(_DAPR_KEY)
+    if client is not None and not client.is_closed:
+        return client
+    new_client = httpx.AsyncClient(timeout=_DAPR_TIMEOUT_SECONDS, limits=_DAPR_LIMITS)
+    _state[_DAPR_KEY] = new_client
+    return new_client
+
+
+def get_langfuse_http_client() -> httpx.AsyncClient:
+    """App-lifetime pooled client for the Langfuse public API, shared across import runs."""
+    client = _state.get(_LANGFUSE_KEY)
+    if client is not None and not client.is_closed:
+        return client
+    new_client = httpx.AsyncClient(
+        timeout=settings.langfuse_http_timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=settings.langfuse_http_max_connections,
+            max_keepalive_connections=settings.langfuse_http_max_connections,
+            keepalive_expiry=30.0,
+        ),
+        http2=_langfuse_http2_enabled(),
+    )
+    _state[_LANGFUSE_KEY] = new_client
+    return new_client
+
+
+def _langfuse_http2_enabled() -> bool:
+    if not settings.langfuse_http2_enabled:
+        return False
+    # HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it.
+    if importlib.util.find_spec("h2") is None:
+        log_event(
+            logger,
+            level=logging.WARNING,
+            event="observability.langfuse.http2_unavailable",
+            reason="h2 package is not installed; using HTTP/1.1",
+        )
+        return False
+    return True
+
+
+async def init_http_clients() -> None:
+    get_dapr_http_client()
+    get_langfuse_http_client()
+
+
+async def close_http_clients() -> None:
+    clients = list(_state.values())
+    _state.clear()
+    for client in clients:
+        await client.aclose()
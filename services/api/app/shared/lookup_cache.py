@@ -0,0 +1,131 @@
+"""Process-wide TTL caches for rarely-changing lookups on the dispatch path.
+
+Agent dispatch info and project ``repo_root`` are read on every assignment
+push and manual dispatch but change only through the planning agent/project
+update paths (and OpenClaw agent sync), which invalidate the affected keys.
+The TTL bounds staleness across API worker processes that did not see the
+write.
+
+The observability response cache follows the same rules for dashboard reads
+that only change when a Langfuse import writes.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from app.config import settings
+from app.shared.ports import AgentInfo
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    name: str
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+class TtlCache(Generic[V]):
+    """Size-capped LRU cache whose entries expire ``ttl_seconds`` after insert."""
+
+    def __init__(self, *, name: str, ttl_seconds: float, max_entries: int) -> None:
+        self._name = name
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: str) -> V | None:
+        item = self._entries.get(key)
+        if item is None:
+            self._misses += 1
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: str, value: V) -> None:
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            name=self._name,
+            size=len(self._entries),
+            max_entries=self._max_entries,
+            ttl_seconds=self._ttl_seconds,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+        )
+
+
+agent_info_cache: TtlCache[AgentInfo] = TtlCache(
+    name="agent_info",
+    ttl_seconds=settings.lookup_cache_ttl_seconds,
+    max_entries=settings.lookup_cache_max_entries,
+)
+
+project_repo_root_cache: TtlCache[str] = TtlCache(
+    name="project_repo_root",
+    ttl_seconds=settings.lookup_cache_ttl_seconds,
+    max_entries=settings.lookup_cache_max_entries,
+)
+
+observability_response_cache: TtlCache[Any] = TtlCache(
+    name="observability_response",
+    ttl_seconds=settings.observability_cache_ttl_seconds,
+    max_entries=settings.observability_cache_max_entries,
+)
+
+_ALL_CACHES: tuple[TtlCache[Any], ...] = (
+    agent_info_cache,
+    project_repo_root_cache,
+    observability_response_cache,
+)
+
+
+def lookup_cache_stats() -> list[CacheStats]:
+    return [cache.stats() for cache in _ALL_CACHES]
+
+
+def clear_lookup_caches() -> None:
+    for cache in _ALL_CACHES:
+        cache.clear()
+        cache.reset_stats()
@@ -0,0 +1,43 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class PeriodicTask(ABC):
+    """Background loop that calls ``run_once`` every ``interval_seconds``.
+
+    Subclasses supply only the tick. ``run_once`` must handle and log its
+    own errors, so one failed tick never stops the loop.
+    """
+
+    def __init__(self, *, name: str, interval_seconds: float) -> None:
+        self._name = name
+        self._interval_seconds = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name=self._name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @abstractmethod
+    async def run_once(self) -> Any: ...
+
+    async def _run(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self._interval_seconds)
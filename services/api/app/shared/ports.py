@@ -15,6 +15,23 @@ class AgentLookupPort(Protocol):
     async def get_agent_by_id(self, agent_id: str) -> AgentInfo | None: ...
 
 
+@dataclass
+class RunAttribution:
+    """Run, agent and work item behind a control-plane dispatch (no control-plane model leak)."""
+
+    run_id: str | None
+    correlation_id: str | None
+    agent_id: str | None
+    work_item_id: str | None
+    work_item_key: str | None
+
+
+class RunAttributionPort(Protocol):
+    async def by_run_ids(self, run_ids: list[str]) -> dict[str, RunAttribution]: ...
+
+    async def by_correlation_ids(self, correlation_ids: list[str]) -> dict[str, RunAttribution]: ...
+
+
 class OnAssignmentChanged(Protocol):
     async def __call__(
         self,
@@ -29,6 +29,7 @@ from app.planning.infrastructure import (  # noqa: E402,F401  # pylint: disable=
 )
 from app.shared.db.metadata import metadata  # noqa: E402,F401  # pylint: disable=unused-import
 from app.shared.db.session import close_db_engine  # noqa: E402
+from app.shared.lookup_cache import clear_lookup_caches  # noqa: E402
 from tests.support.postgres_compat import (  # noqa: E402
     reset_database_schema,
     truncate_all_tables,
@@ -70,6 +71,7 @@ def _configure_database(
 @pytest.fixture(autouse=True)
 def _reset_database(database_url: str) -> Iterator[None]:
     truncate_all_tables(database_url, table_names=_TABLE_NAMES)
+    clear_lookup_caches()
     yield
 
 
@@ -14,58 +14,46 @@ _ACTIVE_RUNTIME = frozenset(
     }
 )
 
+_CANCELLABLE = frozenset(
+    {
+        AgentQueueStatus.QUEUED,
+        AgentQueueStatus.DISPATCHING,
+        AgentQueueStatus.ACK_PENDING,
+        AgentQueueStatus.PARKED,
+    }
+)
+
 
 class FakeAgentQueueRepo(AgentQueueRepository):
     """In-memory fake that implements the full AgentQueueRepository port."""
 
     def __init__(self) -> None:
         self.entries: list[AgentQueueEntry] = []
+        self.position_counters: dict[str, int] = {}
 
     async def enqueue(self, *, entry: AgentQueueEntry) -> None:
-        pos = (
-            max(
-                (
-                    e.queue_position
-                    for e in self.entries
-                    if e.agent_id == entry.agent_id and e.status == AgentQueueStatus.QUEUED
-                ),
-                default=0,
-            )
-            + 1
-        )
+        pos = self.position_counters.get(entry.agent_id, 0) + 1
+        self.position_counters[entry.agent_id] = pos
         entry.queue_position = pos
         self.entries.append(entry)
 
     async def get_active_by_work_item(self, *, work_item_id: str) -> AgentQueueEntry | None:
         for e in self.entries:
-            if e.work_item_id == work_item_id and e.status in (
-                AgentQueueStatus.QUEUED,
-                AgentQueueStatus.DISPATCHING,
-                AgentQueueStatus.ACK_PENDING,
-            ):
+            if e.work_item_id == work_item_id and e.status in _CANCELLABLE:
                 return e
         return None
 
     async def cancel_by_work_item(self, *, work_item_id: str, cancelled_at: str) -> bool:
         found = False
         for e in self.entries:
-            if e.work_item_id == work_item_id and e.status in (
-                AgentQueueStatus.QUEUED,
-                AgentQueueStatus.DISPATCHING,
-                AgentQueueStatus.ACK_PENDING,
-            ):
+            if e.work_item_id == work_item_id and e.status in _CANCELLABLE:
                 e.status = AgentQueueStatus.CANCELLED
                 e.cancelled_at = cancelled_at
                 found = True
         return found
 
     async def next_queue_position(self, *, agent_id: str) -> int:
-        positions = [
-            e.queue_position
-            for e in self.entries
-            if e.agent_id == agent_id and e.status == AgentQueueStatus.QUEUED
-        ]
-        return max(positions, default=0) + 1
+        return self.position_counters.get(agent_id, 0) + 1
 
     async def list_queued_by_agent(
         self,
@@ -86,6 +74,7 @@ class FakeAgentQueueRepo(AgentQueueRepository):
         self,
         *,
         agent_id: str,
+        due_at: str | None = None,
     ) -> AgentQueueEntry | None:
         queued = [
             e
@@ -94,8 +83,31 @@ class FakeAgentQueueRepo(AgentQueueRepository):
         ]
         if not queued:
             return None
-        queued.sort(key=lambda e: e.queue_position)
-        return queued[0]
+        head = min(queued, key=lambda e: e.queue_position)
+        if (
+            due_at is not None
+            and head.next_attempt_at is not None
+            and head.next_attempt_at > due_at
+        ):
+            return None
+        return head
+
+    async def list_agents_with_due_retries(
+        self,
+        *,
+        due_at: str,
+        limit: int = 50,
+    ) -> list[str]:
+        agent_ids: list[str] = []
+        for e in self.entries:
+            if (
+                e.status == AgentQueueStatus.QUEUED
+                and e.next_attempt_at is not None
+                and e.next_attempt_at <= due_at
+                and e.agent_id not in agent_ids
+            ):
+                agent_ids.append(e.agent_id)
+        return agent_ids[:limit]
 
     async def has_active_item(self, *, agent_id: str) -> bool:
         return any(e.agent_id == agent_id and e.status in _ACTIVE_RUNTIME for e in self.entries)
@@ -125,5 +137,39 @@ class FakeAgentQueueRepo(AgentQueueRepository):
                 return True
         return False
 
+    async def reschedule_dispatch(
+        self,
+        *,
+        entry_id: str,
+        expected_status: AgentQueueStatus,
+        new_status: AgentQueueStatus,
+        dispatch_attempts: int,
+        next_attempt_at: str | None,
+        updated_at: str,
+    ) -> bool:
+        for e in self.entries:
+            if e.id == entry_id and e.status == expected_status:
+                e.status = new_status
+                e.dispatch_attempts = dispatch_attempts
+                e.next_attempt_at = next_attempt_at
+                e.updated_at = updated_at
+                return True
+        return False
+
+    async def requeue_parked(
+        self,
+        *,
+        entry_id: str,
+        updated_at: str,
+    ) -> AgentQueueEntry | None:
+        for e in self.entries:
+            if e.id == entry_id and e.status == AgentQueueStatus.PARKED:
+                e.status = AgentQueueStatus.QUEUED
+                e.dispatch_attempts = 0
+                e.next_attempt_at = None
+                e.updated_at = updated_at
+                return e
+        return None
+
     async def commit(self) -> None:
         pass  # no-op for in-memory fake
@@ -18,6 +18,8 @@ class FakeOpenClawAdapter(OpenClawDispatchPort):
 class FailingOpenClawAdapter(OpenClawDispatchPort):
     def __init__(self, error: str = "dispatch failed") -> None:
         self._error = error
+        self.attempt_count: int = 0
 
     async def send_dispatch(self, *, envelope: DispatchEnvelope) -> OpenClawSessionMetadata:
+        self.attempt_count += 1
         raise RuntimeError(self._error)
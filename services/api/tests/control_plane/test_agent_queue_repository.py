@@ -0,0 +1,176 @@
+import asyncio
+
+import pytest
+
+from app.control_plane.domain.models import AgentQueueEntry, AgentQueueStatus
+from app.control_plane.infrastructure.repositories.agent_queue import DbAgentQueueRepository
+from app.shared.db.session import get_session_factory
+from app.shared.utils import utc_now
+
+_AGENT = "agent-queue-repo"
+
+
+def _entry(entry_id: str, *, agent_id: str = _AGENT) -> AgentQueueEntry:
+    now = utc_now()
+    return AgentQueueEntry(
+        id=entry_id,
+        work_item_id=f"wi-{entry_id}",
+        work_item_key=f"MC-{entry_id}",
+        work_item_type="STORY",
+        work_item_title="",
+        project_repo_root="",
+        agent_id=agent_id,
+        status=AgentQueueStatus.QUEUED,
+        queue_position=0,
+        correlation_id=f"corr-{entry_id}",
+        causation_id=None,
+        enqueued_at=now,
+        updated_at=now,
+    )
+
+
+async def _enqueue_in_own_session(entry: AgentQueueEntry) -> int:
+    async with get_session_factory()() as session:
+        repo = DbAgentQueueRepository(session)
+        await repo.enqueue(entry=entry)
+        await repo.commit()
+    return entry.queue_position
+
+
+@pytest.mark.asyncio
+async def test_concurrent_enqueues_get_distinct_positions() -> None:
+    entries = [_entry(f"c{i}") for i in range(8)]
+
+    positions = await asyncio.gather(*(_enqueue_in_own_session(e) for e in entries))
+
+    assert sorted(positions) == list(range(1, 9))
+
+
+@pytest.mark.asyncio
+async def test_positions_keep_increasing_after_queue_drains() -> None:
+    first = _entry("d1")
+    await _enqueue_in_own_session(first)
+
+    async with get_session_factory()() as session:
+        repo = DbAgentQueueRepository(session)
+        await repo.cancel_by_work_item(work_item_id=first.work_item_id, cancelled_at=utc_now())
+        await repo.commit()
+        assert await repo.next_queue_position(agent_id=_AGENT) == 2
+
+    second = _entry("d2")
+    assert await _enqueue_in_own_session(second) == 2
+
+    async with get_session_factory()() as session:
+        repo = DbAgentQueueRepository(session)
+        oldest = await repo.get_oldest_queued_for_agent(agent_id=_AGENT)
+
+    assert oldest is not None
+    assert oldest.id == "d2"
+
+
+@pytest.mark.asyncio
+async def test_counters_are_per_agent() -> None:
+    await _enqueue_in_own_session(_entry("a1", agent_id="agent-a"))
+    await _enqueue_in_own_session(_entry("a2", agent_id="agent-a"))
+
+    assert await _enqueue_in_own_session(_entry("b1", agent_id="agent-b")) == 1
+
+
+@pytest.mark.asyncio
+async def test_backing_off_entries_are_skipped_until_due() -> None:
+    entry = _entry("r1")
+    await _enqueue_in_own_session(entry)
+
+    async with get_session_factory()() as session:
+        repo = DbAgentQueueRepository(session)
+        await repo.transition_status(
+            entry_id="r1",
+            expected_status=AgentQueueStatus.QUEUED,
+            new_status=AgentQueueStatus.ACK_PENDING,
+            updated_at=utc_now(),
+        )
+        rescheduled = await repo.reschedule_dispatch(
+            entry_id="r1",
+            expected_status=AgentQueueStatus.ACK_PENDING,
+            new_status=AgentQueueStatus.QUEUED,
+            dispatch_attempts=1,
+            next_attempt_at="2026-03-25T10:00:05+00:00",
+            updated_at="2026-03-25T10:00:00+00:00",
+        )
+        await repo.commit()
+
+        early = "2026-03-25T10:00:01+00:00"
+        due = "2026-03-25T10:00:06+00:00"
+        assert rescheduled is True
+        assert await repo.get_oldest_queued_for_agent(agent_id=_AGENT, due_at=early) is None
+        assert await repo.list_agents_with_due_retries(due_at=early) == []
+        assert await repo.list_agents_with_due_retries(due_at=due) == [_AGENT]
+        oldest = await repo.get_oldest_queued_for_agent(agent_id=_AGENT, due_at=due)
+
+    assert oldest is not None
+    assert oldest.dispatch_attempts == 1
+    assert oldest.next_attempt_at == "2026-03-25T10:00:05+00:00"
+
+
+@pytest.mark.asyncio
+async def test_backing_off_head_holds_later_entries() -> None:
+    await _enqueue_in_own_session(_entry("h1"))
+    await _enqueue_in_own_session(_entry("h2"))
+
+    async with get_session_factory()() as session:
+        repo = DbAgentQueueRepository(session)
+        await repo.reschedule_dispatch(
+            entry_id="h1",
+            expected_status=AgentQueueStatus.QUEUED,
+            new_status=AgentQueueStatus.QUEUED,
+            dispatch_attempts=1,
+            next_attempt_at="2026-03-25T10:00:05+00:00",
+            updated_at="2026-03-25T10:00:00+00:00",
+        )
+        await repo.commit()
+
+        early = await repo.get_oldest_queued_for_agent(
+            agent_id=_AGENT, due_at="2026-03-25T10:00:01+00:00"
+        )
+        due = await repo.get_oldest_queued_for_agent(
+            agent_id=_AGENT, due_at="2026-03-25T10:00:06+00:00"
+        )
+
+    assert early is None
+    assert due is not None
+    assert due.id == "h1"
+
+
+@pytest.mark.asyncio
+async def test_parked_entries_can_be_requeued_or_cancelled() -> None:
+    await _enqueue_in_own_session(_entry("p1"))
+    await _enqueue_in_own_session(_entry("p2"))
+
+    async with get_session_factory()() as session:
+        repo = DbAgentQueueRepository(session)
+        for entry_id in ("p1", "p2"):
+            await repo.reschedule_dispatch(
+                entry_id=entry_id,
+                expected_status=AgentQueueStatus.QUEUED,
+                new_status=AgentQueueStatus.PARKED,
+                dispatch_attempts=5,
+                next_attempt_at=None,
+                updated_at=utc_now(),
+            )
+        await repo.commit()
+
+        requeued = await repo.requeue_parked(entry_id="p1", updated_at=utc_now())
+        assert await repo.requeue_parked(entry_id="p1", updated_at=utc_now()) is None
+        cancelled = await repo.cancel_by_work_item(work_item_id="wi-p2", cancelled_at=utc_now())
+        await repo.commit()
+        entries, _ = await repo.list_queued_by_agent(agent_id=_AGENT)
+
+    assert requeued is not None
+    assert requeued.status == AgentQueueStatus.QUEUED
+    assert requeued.dispatch_attempts == 0
+    assert requeued.next_attempt_at is None
+    assert cancelled is True
+    assert {e.id: e.status for e in entries} == {
+        "p1": AgentQueueStatus.QUEUED,
+        "p2": AgentQueueStatus.CANCELLED,
+    }
@@ -1,11 +1,15 @@
+import asyncio
 from collections.abc import Sequence
 from typing import Any
 from unittest.mock import patch
 
 import httpx
 
+from app.shared.http_clients import close_http_clients, get_dapr_http_client
 from tests.support.postgres_compat import pg_connect
 
+_CLIENT_TARGET = "app.control_plane.api.dapr_router.get_dapr_http_client"
+
 
 class _FakeAsyncClient:
     def __init__(
@@ -23,12 +27,6 @@ class _FakeAsyncClient:
         self.get_calls: list[tuple[str, dict[str, Any]]] = []
         self.post_calls: list[tuple[str, dict[str, Any]]] = []
 
-    async def __aenter__(self) -> "_FakeAsyncClient":
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb) -> None:
-        return None
-
     async def get(self, url: str, **kwargs: Any) -> httpx.Response:
         self.get_calls.append((url, kwargs))
         if self._get_error is not None:
@@ -60,6 +58,31 @@ def test_dapr_subscribe_contract(client) -> None:
     ]
 
 
+def test_dapr_subscribe_registers_bulk_route_when_enabled(client, monkeypatch) -> None:
+    monkeypatch.setattr(
+        "app.control_plane.api.dapr_router.settings.control_plane_dapr_bulk_subscribe_enabled", True
+    )
+    monkeypatch.setattr(
+        "app.control_plane.api.dapr_router.settings.control_plane_dapr_bulk_max_messages_count", 50
+    )
+    monkeypatch.setattr(
+        "app.control_plane.api.dapr_router.settings.control_plane_dapr_bulk_max_await_duration_ms",
+        250,
+    )
+
+    response = client.get("/dapr/subscribe")
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "pubsubname": "local-pubsub",
+            "topic": "control-plane.events",
+            "routes": {"default": "v1/control-plane/dapr/events/bulk"},
+            "bulkSubscribe": {"enabled": True, "maxMessagesCount": 50, "maxAwaitDurationMs": 250},
+        }
+    ]
+
+
 def test_dapr_subscribe_returns_empty_when_ingest_disabled(client, monkeypatch) -> None:
     monkeypatch.setattr(
         "app.control_plane.api.dapr_router.settings.control_plane_dapr_ingest_enabled", False
@@ -76,7 +99,7 @@ def test_dapr_healthz_success(client) -> None:
             httpx.Response(200, request=httpx.Request("GET", "http://127.0.0.1:3500/v1.0/metadata"))
         ]
     )
-    with patch("app.control_plane.api.dapr_router.httpx.AsyncClient", return_value=fake):
+    with patch(_CLIENT_TARGET, return_value=fake):
         response = client.get("/healthz/dapr")
 
     assert response.status_code == 200
@@ -86,7 +109,7 @@ def test_dapr_healthz_success(client) -> None:
 
 def test_dapr_healthz_failure_returns_503(client) -> None:
     fake = _FakeAsyncClient(get_error=httpx.ConnectError("connection refused"))
-    with patch("app.control_plane.api.dapr_router.httpx.AsyncClient", return_value=fake):
+    with patch(_CLIENT_TARGET, return_value=fake):
         response = client.get("/healthz/dapr")
 
     assert response.status_code == 503
@@ -115,7 +138,7 @@ def test_dapr_event_bridge_persists_state_and_invokes_worker(client, db_path: st
             ),
         ]
     )
-    with patch("app.control_plane.api.dapr_router.httpx.AsyncClient", return_value=fake):
+    with patch(_CLIENT_TARGET, return_value=fake):
         response = client.post(
             "/v1/control-plane/dapr/events",
             json={
@@ -163,7 +186,7 @@ def test_dapr_event_bridge_failure_returns_503(client) -> None:
             )
         ]
     )
-    with patch("app.control_plane.api.dapr_router.httpx.AsyncClient", return_value=fake):
+    with patch(_CLIENT_TARGET, return_value=fake):
         response = client.post(
             "/v1/control-plane/dapr/events",
             json={"data": {"run_id": "run-500", "correlation_id": "corr-500"}},
@@ -173,6 +196,41 @@ def test_dapr_event_bridge_failure_returns_503(client) -> None:
     assert "Failed to persist control-plane event in Dapr state store" in response.json()["detail"]
 
 
+def test_dapr_event_bridge_ack_failure_returns_503(client) -> None:
+    invoke_url = "http://127.0.0.1:3500/v1.0/invoke/mission-control-worker/method/control-plane/ack"
+    fake = _FakeAsyncClient(
+        post_responses=[
+            httpx.Response(
+                204,
+                request=httpx.Request("POST", "http://127.0.0.1:3500/v1.0/state/local-statestore"),
+            ),
+            httpx.Response(502, request=httpx.Request("POST", invoke_url)),
+        ]
+    )
+    with patch(_CLIENT_TARGET, return_value=fake):
+        response = client.post(
+            "/v1/control-plane/dapr/events",
+            json={"data": {"run_id": "run-502", "correlation_id": "corr-502"}},
+        )
+
+    assert response.status_code == 503
+    assert "Failed to invoke worker acknowledgement endpoint" in response.json()["detail"]
+    # Both sidecar calls were issued (concurrently), not short-circuited
+    assert len(fake.post_calls) == 2
+
+
+def test_dapr_http_client_is_shared_until_closed() -> None:
+    first = get_dapr_http_client()
+    assert get_dapr_http_client() is first
+
+    asyncio.run(close_http_clients())
+
+    assert first.is_closed
+    replacement = get_dapr_http_client()
+    assert replacement is not first
+    asyncio.run(close_http_clients())
+
+
 def test_dapr_event_bridge_uses_traceparent_as_fallback_causation(client, db_path: str) -> None:
     invoke_url = "".join(
         [
@@ -195,7 +253,7 @@ def test_dapr_event_bridge_uses_traceparent_as_fallback_causation(client, db_pat
             ),
         ]
     )
-    with patch("app.control_plane.api.dapr_router.httpx.AsyncClient", return_value=fake):
+    with patch(_CLIENT_TARGET, return_value=fake):
         response = client.post(
             "/v1/control-plane/dapr/events",
             json={
@@ -238,3 +296,102 @@ def test_dapr_event_bridge_returns_ignored_when_ingest_disabled(client, monkeypa
     payload = response.json()
     assert payload["status"] == "IGNORED"
     assert payload["reason"] == "CONTROL_PLANE_DAPR_INGEST_DISABLED"
+
+
+def _bulk_entry(entry_id: str, run_id: str, event_type: str) -> dict[str, Any]:
+    return {
+        "entryId": entry_id,
+        "contentType": "application/cloudevents+json",
+        "event": {
+            "id": f"cloud-{entry_id}",
+            "data": {
+                "run_id": run_id,
+                "type": event_type,
+                "correlation_id": f"corr-{run_id}",
+                "occurred_at": "2026-03-08T12:00:00Z",
+            },
+        },
+    }
+
+
+def test_dapr_bulk_bridge_applies_batch_and_reports_per_entry_status(client, db_path: str) -> None:
+    fake = _FakeAsyncClient()
+    with patch(_CLIENT_TARGET, return_value=fake):
+        response = client.post(
+            "/v1/control-plane/dapr/events/bulk",
+            json={
+                "id": "bulk-1",
+                "topic": "control-plane.events",
+                "pubsubname": "local-pubsub",
+                "entries": [
+                    _bulk_entry("e1", "run-bulk-1", "control-plane.run.submit.accepted"),
+                    _bulk_entry("e2", "run-bulk-1", "control-plane.run.started"),
+                    {"entryId": "e3", "event": "not-a-cloud-event"},
+                    _bulk_entry("e4", "run-bulk-2", "control-plane.run.submit.accepted"),
+                ],
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "statuses": [
+            {"entryId": "e1", "status": "SUCCESS"},
+            {"entryId": "e2", "status": "SUCCESS"},
+            {"entryId": "e3", "status": "DROP"},
+            {"entryId": "e4", "status": "SUCCESS"},
+        ]
+    }
+    state_calls = [call for call in fake.post_calls if call[0].endswith("/state/local-statestore")]
+    ack_calls = [call for call in fake.post_calls if call[0].endswith("/control-plane/ack")]
+    assert len(state_calls) == 1
+    assert len(state_calls[0][1]["json"]) == 3
+    assert len(ack_calls) == 3
+
+    with pg_connect(db_path) as conn:
+        runs = conn.execute(
+            "SELECT run_id, status FROM control_plane_runs ORDER BY run_id"
+        ).fetchall()
+    assert runs == [("run-bulk-1", "RUNNING"), ("run-bulk-2", "PENDING")]
+
+
+def test_dapr_bulk_bridge_retries_entries_when_state_save_fails(client) -> None:
+    fake = _FakeAsyncClient(
+        post_responses=[
+            httpx.Response(
+                500,
+                request=httpx.Request("POST", "http://127.0.0.1:3500/v1.0/state/local-statestore"),
+            )
+        ]
+    )
+    with patch(_CLIENT_TARGET, return_value=fake):
+        response = client.post(
+            "/v1/control-plane/dapr/events/bulk",
+            json={
+                "entries": [
+                    _bulk_entry("e1", "run-bulk-3", "control-plane.run.submit.accepted"),
+                    _bulk_entry("e2", "run-bulk-4", "control-plane.run.submit.accepted"),
+                ]
+            },
+        )
+
+    assert response.status_code == 200
+    assert [entry["status"] for entry in response.json()["statuses"]] == ["RETRY", "RETRY"]
+
+
+def test_dapr_bulk_bridge_acknowledges_without_processing_when_ingest_disabled(
+    client, db_path: str, monkeypatch
+) -> None:
+    monkeypatch.setattr(
+        "app.control_plane.api.dapr_router.settings.control_plane_dapr_ingest_enabled", False
+    )
+
+    response = client.post(
+        "/v1/control-plane/dapr/events/bulk",
+        json={"entries": [_bulk_entry("e1", "run-bulk-5", "control-plane.run.submit.accepted")]},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"statuses": [{"entryId": "e1", "status": "SUCCESS"}]}
+    with pg_connect(db_path) as conn:
+        count = conn.execute("SELECT COUNT(*) FROM control_plane_runs").fetchone()
+    assert count == (0,)
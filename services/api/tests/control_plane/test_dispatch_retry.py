@@ -0,0 +1,206 @@
+"""Tests for dispatch retry backoff, parking and the retry scheduler."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.control_plane.application.dispatch_retry_scheduler import DispatchRetryScheduler
+from app.control_plane.application.dispatch_selection_service import DispatchSelectionService
+from app.control_plane.application.openclaw_dispatch_service import OpenClawDispatchService
+from app.control_plane.application.queue_dispatch_service import QueueDispatchService
+from app.control_plane.application.queue_ingress_service import QueueIngressService
+from app.control_plane.domain.models import AgentQueueStatus
+from app.shared.api.errors import NotFoundError
+from app.shared.ports import AgentInfo
+from tests.control_plane.fake_agent_lookup import FakeAgentLookup
+from tests.control_plane.fake_agent_queue_repo import FakeAgentQueueRepo
+from tests.control_plane.fake_dispatch_repo import FakeDispatchRecordRepo
+from tests.control_plane.fake_openclaw_adapter import FailingOpenClawAdapter, FakeOpenClawAdapter
+
+_AGENT = "agent-naomi-id"
+
+
+def _build_svc(
+    queue_repo: FakeAgentQueueRepo,
+    adapter: FakeOpenClawAdapter | FailingOpenClawAdapter,
+) -> QueueDispatchService:
+    return QueueDispatchService(
+        ingress=QueueIngressService(repo=queue_repo),
+        selection=DispatchSelectionService(repo=queue_repo),
+        dispatch=OpenClawDispatchService(
+            queue_repo=queue_repo,
+            dispatch_repo=FakeDispatchRecordRepo(),
+            openclaw_adapter=adapter,
+            mc_api_base_url="http://127.0.0.1:5000",
+        ),
+        agent_lookup=FakeAgentLookup(
+            agents={
+                _AGENT: AgentInfo(
+                    agent_id=_AGENT,
+                    openclaw_key="naomi",
+                    main_session_key="agent:naomi:main",
+                ),
+            }
+        ),
+    )
+
+
+async def _enqueue(svc: QueueDispatchService) -> None:
+    await svc.enqueue_and_dispatch(
+        work_item_id="wi-001",
+        work_item_key="MC-100",
+        work_item_type="STORY",
+        work_item_status="TODO",
+        agent_id=_AGENT,
+        previous_agent_id=None,
+    )
+
+
+def _make_due(repo: FakeAgentQueueRepo) -> None:
+    past = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+    for entry in repo.entries:
+        if entry.next_attempt_at is not None:
+            entry.next_attempt_at = past
+
+
+def _backoff_seconds(entry_next_attempt_at: str, updated_at: str) -> float:
+    delta = datetime.fromisoformat(entry_next_attempt_at) - datetime.fromisoformat(updated_at)
+    return delta.total_seconds()
+
+
+@pytest.mark.asyncio
+async def test_failed_send_schedules_backoff() -> None:
+    repo = FakeAgentQueueRepo()
+    adapter = FailingOpenClawAdapter()
+    svc = _build_svc(repo, adapter)
+
+    await _enqueue(svc)
+
+    entry = repo.entries[0]
+    assert entry.status == AgentQueueStatus.QUEUED
+    assert entry.dispatch_attempts == 1
+    assert entry.next_attempt_at is not None
+    assert _backoff_seconds(entry.next_attempt_at, entry.updated_at) == 5
+
+
+@pytest.mark.asyncio
+async def test_backing_off_entry_is_not_redispatched_early() -> None:
+    repo = FakeAgentQueueRepo()
+    adapter = FailingOpenClawAdapter()
+    svc = _build_svc(repo, adapter)
+    await _enqueue(svc)
+
+    manual = await svc.manual_dispatch(agent_id=_AGENT)
+    swept = await svc.dispatch_due_retries()
+
+    assert manual.action == "skipped"
+    assert manual.reason == "queue_empty"
+    assert not swept
+    assert adapter.attempt_count == 1
+
+
+@pytest.mark.asyncio
+async def test_due_retry_is_redispatched_by_sweep() -> None:
+    repo = FakeAgentQueueRepo()
+    failing = FailingOpenClawAdapter()
+    await _enqueue(_build_svc(repo, failing))
+    _make_due(repo)
+
+    adapter = FakeOpenClawAdapter()
+    swept = await _build_svc(repo, adapter).dispatch_due_retries()
+
+    assert swept == [_AGENT]
+    assert adapter.dispatch_count == 1
+    assert repo.entries[0].status == AgentQueueStatus.ACK_PENDING
+
+
+@pytest.mark.asyncio
+async def test_backoff_grows_exponentially_then_parks() -> None:
+    repo = FakeAgentQueueRepo()
+    adapter = FailingOpenClawAdapter()
+    svc = _build_svc(repo, adapter)
+    await _enqueue(svc)
+
+    backoffs: list[float] = []
+    entry = repo.entries[0]
+    while entry.status == AgentQueueStatus.QUEUED:
+        assert entry.next_attempt_at is not None
+        backoffs.append(_backoff_seconds(entry.next_attempt_at, entry.updated_at))
+        _make_due(repo)
+        await svc.dispatch_due_retries()
+
+    assert backoffs == [5, 10, 20, 40]
+    assert entry.status == AgentQueueStatus.PARKED
+    assert entry.dispatch_attempts == 5
+    assert entry.next_attempt_at is None
+    assert adapter.attempt_count == 5
+
+    # Parked entries are never picked up again automatically
+    assert await svc.dispatch_due_retries() == []
+    assert adapter.attempt_count == 5
+
+
+@pytest.mark.asyncio
+async def test_backing_off_head_is_not_overtaken() -> None:
+    repo = FakeAgentQueueRepo()
+    svc = _build_svc(repo, FailingOpenClawAdapter())
+    await _enqueue(svc)
+    await svc.enqueue_and_dispatch(
+        work_item_id="wi-002",
+        work_item_key="MC-101",
+        work_item_type="STORY",
+        work_item_status="TODO",
+        agent_id=_AGENT,
+        previous_agent_id=None,
+    )
+
+    adapter = FakeOpenClawAdapter()
+    manual = await _build_svc(repo, adapter).manual_dispatch(agent_id=_AGENT)
+
+    assert manual.reason == "queue_empty"
+    assert adapter.dispatch_count == 0
+    assert [e.status for e in repo.entries] == [AgentQueueStatus.QUEUED] * 2
+
+
+@pytest.mark.asyncio
+async def test_requeue_parked_entry_resets_attempts_and_dispatches() -> None:
+    repo = FakeAgentQueueRepo()
+    svc = _build_svc(repo, FailingOpenClawAdapter())
+    await _enqueue(svc)
+    entry = repo.entries[0]
+    while entry.status == AgentQueueStatus.QUEUED:
+        _make_due(repo)
+        await svc.dispatch_due_retries()
+
+    adapter = FakeOpenClawAdapter()
+    requeued = await _build_svc(repo, adapter).requeue_parked(entry_id=entry.id)
+
+    assert requeued.id == entry.id
+    assert entry.dispatch_attempts == 0
+    assert entry.status == AgentQueueStatus.ACK_PENDING
+    assert adapter.dispatch_count == 1
+    with pytest.raises(NotFoundError):
+        await svc.requeue_parked(entry_id=entry.id)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_run_once_swallows_sweep_errors() -> None:
+    async def _failing_sweep() -> list[str]:
+        raise RuntimeError("db unavailable")
+
+    scheduler = DispatchRetryScheduler(sweep=_failing_sweep, interval_seconds=1)
+
+    assert await scheduler.run_once() == []
+
+
+@pytest.mark.asyncio
+async def test_scheduler_start_and_stop() -> None:
+    async def _sweep() -> list[str]:
+        return []
+
+    scheduler = DispatchRetryScheduler(sweep=_sweep, interval_seconds=60)
+    scheduler.start()
+    assert scheduler.running
+    await scheduler.stop()
+
+    assert not scheduler.running
@@ -1,7 +1,10 @@
 import pytest
 from sqlalchemy import text
 
-from app.control_plane.application.worker_state_machine_service import WorkerStateMachineService
+from app.control_plane.application.worker_state_machine_service import (
+    WorkerMessage,
+    WorkerStateMachineService,
+)
 from app.control_plane.infrastructure.repositories.consumer import DbConsumerRepository
 from app.control_plane.infrastructure.repositories.run import DbRunRepository
 from app.shared.db.session import get_session_factory
@@ -230,3 +233,60 @@ async def test_worker_startup_reconciliation_records_only_in_flight_runs() -> No
 
     assert reconciled == ["run-4"]
     assert rows == [("run-4", "control-plane.run.reconciled", "WORKER_STARTUP_RECONCILIATION")]
+
+
+class _FailingRunRepository(DbRunRepository):
+    """Raises on timeline writes for one run to exercise per-message rollback."""
+
+    def __init__(self, session, *, failing_run_id: str) -> None:
+        super().__init__(session, autocommit=False)
+        self._failing_run_id = failing_run_id
+
+    async def append_timeline_entry(self, *, entry) -> None:
+        if entry.run_id == self._failing_run_id:
+            raise RuntimeError("timeline write failed")
+        await super().append_timeline_entry(entry=entry)
+
+
+def _message(message_id: str, run_id: str) -> WorkerMessage:
+    return WorkerMessage(
+        stream_key=_STREAM,
+        consumer_group=_GROUP,
+        consumer_name=_CONSUMER,
+        message_id=message_id,
+        run_id=run_id,
+        event_type="control-plane.run.submit.accepted",
+        correlation_id=f"corr-{run_id}",
+        causation_id=None,
+        occurred_at="2026-03-08T12:00:00Z",
+        payload={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_batch_rolls_back_only_the_failing_message() -> None:
+    async with get_session_factory()() as session:
+        service = WorkerStateMachineService(
+            run_repo=_FailingRunRepository(session, failing_run_id="run-bad"),
+            consumer_repo=DbConsumerRepository(session, autocommit=False),
+        )
+        results = await service.process_batch(
+            [_message("m-1", "run-ok-1"), _message("m-2", "run-bad"), _message("m-3", "run-ok-2")]
+        )
+
+    assert results[0] is not None and results[0]["decision"] == "ACCEPTED"
+    assert results[1] is None
+    assert results[2] is not None and results[2]["decision"] == "ACCEPTED"
+
+    async with get_session_factory()() as session:
+        runs = (
+            await session.execute(text("SELECT run_id FROM control_plane_runs ORDER BY run_id"))
+        ).all()
+        processed = (
+            await session.execute(
+                text("SELECT message_id FROM control_plane_processed_messages ORDER BY message_id")
+            )
+        ).all()
+
+    assert [row[0] for row in runs] == ["run-ok-1", "run-ok-2"]
+    assert [row[0] for row in processed] == ["m-1", "m-3"]
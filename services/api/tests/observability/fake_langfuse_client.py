@@ -0,0 +1,95 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+
+from app.observability.application.ports import LangfuseClientPort
+from app.observability.domain.models import ObservationPage
+
+
+def _parse(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def hours_ago(hours: float) -> str:
+    moment = datetime.now(timezone.utc) - timedelta(hours=hours)
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def observation(
+    obs_id: str,
+    *,
+    model: str = "gpt-4o",
+    start: str | None = None,
+    trace_id: str | None = None,
+    metadata: dict | None = None,
+) -> dict:
+    return {
+        "id": obs_id,
+        "traceId": trace_id or f"trace-{obs_id}",
+        "name": "generation",
+        "model": model,
+        "startTime": start or hours_ago(1),
+        "endTime": None,
+        "inputUsage": 10,
+        "outputUsage": 5,
+        "totalUsage": 15,
+        "totalCost": 0.5,
+        "latency": 1.0,
+        "metadata": metadata or {},
+    }
+
+
+class FakeLangfuseClient(LangfuseClientPort):
+    """Pages the observations inside the requested startTime window behind
+    cursors ``c1``, ``c2``, ... like the v2 observations API."""
+
+    def __init__(
+        self,
+        observations: list[dict],
+        *,
+        page_size: int = 1,
+        fail_on_id: str | None = None,
+    ) -> None:
+        self._observations = observations
+        self._page_size = page_size
+        self._fail_on_id = fail_on_id
+        self._active = 0
+        self.max_active = 0
+        self.observation_calls: list[tuple[str | None, str | None, str | None]] = []
+
+    def iter_observation_pages(
+        self,
+        from_timestamp: str | None = None,
+        cursor: str | None = None,
+        to_timestamp: str | None = None,
+    ) -> AsyncIterator[ObservationPage]:
+        return self._observation_pages(from_timestamp, cursor, to_timestamp)
+
+    async def _observation_pages(
+        self,
+        from_timestamp: str | None,
+        cursor: str | None,
+        to_timestamp: str | None,
+    ) -> AsyncIterator[ObservationPage]:
+        self.observation_calls.append((from_timestamp, cursor, to_timestamp))
+        window = [
+            obs
+            for obs in self._observations
+            if (from_timestamp is None or _parse(obs["startTime"]) >= _parse(from_timestamp))
+            and (to_timestamp is None or _parse(obs["startTime"]) < _parse(to_timestamp))
+        ]
+        pages = [
+            window[start : start + self._page_size]
+            for start in range(0, len(window), self._page_size)
+        ]
+        self._active += 1
+        self.max_active = max(self.max_active, self._active)
+        try:
+            for index in range(int(cursor[1:]) if cursor else 0, len(pages)):
+                await asyncio.sleep(0)
+                if any(obs["id"] == self._fail_on_id for obs in pages[index]):
+                    raise RuntimeError("Langfuse unavailable")
+                next_cursor = f"c{index + 1}" if index + 1 < len(pages) else None
+                yield ObservationPage(data=pages[index], next_cursor=next_cursor)
+        finally:
+            self._active -= 1
@@ -0,0 +1,162 @@
+import pytest
+from sqlalchemy import event, text
+
+from app.control_plane.dependencies import build_run_attribution
+from app.observability.application.import_service import ImportService
+from app.observability.domain.models import CostScope, LangfuseRequest, TraceLink
+from app.observability.infrastructure.repositories.langfuse import DbLangfuseRepository
+from app.shared.db.session import get_async_engine, get_session_factory
+from tests.observability.fake_langfuse_client import FakeLangfuseClient, observation
+
+
+def _request(req_id: str, trace_id: str, *, cost: float = 0.5) -> LangfuseRequest:
+    return LangfuseRequest(
+        id=req_id,
+        trace_id=trace_id,
+        name="generation",
+        model="gpt-4o",
+        started_at="2026-03-01T10:00:00Z",
+        finished_at=None,
+        input_tokens=10,
+        output_tokens=5,
+        total_tokens=15,
+        cost=cost,
+        latency_ms=None,
+    )
+
+
+async def _seed_dispatch(session, *, run_id: str, agent_id: str, key: str, corr: str) -> None:
+    now = "2026-03-01T09:00:00+00:00"
+    await session.execute(
+        text(
+            "INSERT INTO control_plane_agent_queue (id, work_item_id, work_item_key, "
+            "work_item_type, agent_id, status, queue_position, correlation_id, "
+            "enqueued_at, updated_at) VALUES (:id, :wi, :key, 'STORY', :agent, 'DISPATCHED', "
+            "1, :corr, :now, :now)"
+        ),
+        {
+            "id": f"q-{run_id}",
+            "wi": f"wi-{key}",
+            "key": key,
+            "agent": agent_id,
+            "corr": corr,
+            "now": now,
+        },
+    )
+    await session.execute(
+        text(
+            "INSERT INTO control_plane_dispatch_records (id, queue_entry_id, run_id, agent_id, "
+            "work_item_id, work_item_key, status, envelope_json, created_at) VALUES "
+            "(:id, :q, :run, :agent, :wi, :key, 'SENT', '{}', :now)"
+        ),
+        {
+            "id": f"d-{run_id}",
+            "q": f"q-{run_id}",
+            "run": run_id,
+            "agent": agent_id,
+            "wi": f"wi-{key}",
+            "key": key,
+            "now": now,
+        },
+    )
+    await session.commit()
+
+
+def _totals(aggregate) -> tuple[int, float] | None:
+    return (aggregate.request_count, round(aggregate.total_cost, 2)) if aggregate else None
+
+
+@pytest.mark.asyncio
+async def test_links_resolve_dispatch_and_attribute_requests_incrementally() -> None:
+    async with get_session_factory()() as session:
+        await _seed_dispatch(session, run_id="run-1", agent_id="naomi", key="MC-1", corr="corr-1")
+        await _seed_dispatch(session, run_id="run-2", agent_id="amos", key="MC-2", corr="corr-2")
+        repo = DbLangfuseRepository(session, run_attribution=build_run_attribution(session))
+
+        # Requests imported before their trace is linked are picked up by the link.
+        await repo.upsert_requests([_request("r1", "t1"), _request("r2", "t1")])
+        assert await repo.get_cost_attribution(CostScope.RUN, "run-1") is None
+        assert await repo.upsert_trace_links([TraceLink(trace_id="t1", correlation_id="corr-1")])
+
+        link = await repo.get_trace_link("t1")
+        assert link is not None
+        assert (link.run_id, link.agent_id, link.work_item_key) == ("run-1", "naomi", "MC-1")
+        assert _totals(await repo.get_cost_attribution(CostScope.RUN, "run-1")) == (2, 1.0)
+
+        # Re-importing the same page is a no-op; new requests add on.
+        assert await repo.upsert_trace_links([TraceLink(trace_id="t1", run_id="run-1")]) == 0
+        await repo.upsert_requests([_request("r1", "t1"), _request("r3", "t1", cost=1.0)])
+        work_item = await repo.get_cost_attribution(CostScope.WORK_ITEM, "MC-1")
+        assert work_item is not None
+        assert work_item.scope_id == "wi-MC-1"
+        assert _totals(work_item) == (3, 2.0)
+
+        # A request moving to another trace moves its cost with it.
+        await repo.upsert_requests([_request("r3", "t2", cost=1.0)])
+        await repo.upsert_trace_links([TraceLink(trace_id="t2", run_id="run-2")])
+
+        agents = await repo.list_cost_attribution(CostScope.AGENT)
+
+    assert [(a.scope_id, _totals(a)) for a in agents] == [
+        ("amos", (1, 1.0)),
+        ("naomi", (2, 1.0)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_links_traces_from_observation_metadata() -> None:
+    client = FakeLangfuseClient(
+        [
+            observation("o1", trace_id="t1", metadata={"mc_run_id": "run-1"}),
+            observation("o2", trace_id="t1"),
+            observation("o3", trace_id="t3", metadata={"other": "value"}),
+        ]
+    )
+    async with get_session_factory()() as session:
+        await _seed_dispatch(session, run_id="run-1", agent_id="naomi", key="MC-1", corr="corr-1")
+        repo = DbLangfuseRepository(session, run_attribution=build_run_attribution(session))
+        await ImportService(repo, client).run_import()
+
+        run = await repo.get_cost_attribution(CostScope.RUN, "run-1")
+        unlinked = await repo.get_trace_link("t3")
+
+    assert _totals(run) == (2, 1.0)
+    assert unlinked is None
+
+
+@pytest.mark.asyncio
+async def test_links_are_resolved_in_one_batch_per_kind() -> None:
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    async with get_session_factory()() as session:
+        for n in range(1, 4):
+            await _seed_dispatch(
+                session, run_id=f"run-{n}", agent_id="naomi", key=f"MC-{n}", corr=f"corr-{n}"
+            )
+        repo = DbLangfuseRepository(session, run_attribution=build_run_attribution(session))
+        engine = get_async_engine().sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            linked = await repo.upsert_trace_links(
+                [
+                    TraceLink(trace_id="t1", run_id="run-1"),
+                    TraceLink(trace_id="t2", run_id="run-2"),
+                    TraceLink(trace_id="t3", correlation_id="corr-3"),
+                    TraceLink(trace_id="t4", correlation_id="corr-missing"),
+                ]
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        links = [await repo.get_trace_link(f"t{n}") for n in range(1, 5)]
+
+    assert linked == 4
+    assert len([s for s in statements if "control_plane_" in s]) == 4
+    assert [link.work_item_key if link else None for link in links] == [
+        "MC-1",
+        "MC-2",
+        "MC-3",
+        None,
+    ]
@@ -0,0 +1,184 @@
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+
+from app.observability.application.import_service import ImportService
+from app.observability.domain.models import LangfuseRequest
+from app.observability.infrastructure.repositories.langfuse import DbLangfuseRepository
+from app.shared.db.session import get_session_factory
+from app.shared.lookup_cache import TtlCache
+from tests.observability.fake_langfuse_client import (
+    FakeLangfuseClient,
+    hours_ago,
+    observation,
+)
+
+
+class _RecordingRepository(DbLangfuseRepository):
+    def __init__(self, db) -> None:
+        super().__init__(db)
+        self.upsert_batches: list[int] = []
+
+    async def upsert_requests(self, requests: list[LangfuseRequest]) -> None:
+        self.upsert_batches.append(len(requests))
+        await super().upsert_requests(requests)
+
+
+async def _count(query: str) -> int:
+    async with get_session_factory()() as session:
+        return int((await session.execute(text(query))).scalar() or 0)
+
+
+@pytest.mark.asyncio
+async def test_import_persists_each_page_as_it_arrives() -> None:
+    client = FakeLangfuseClient([observation(f"obs-{i}") for i in range(6)], page_size=2)
+    async with get_session_factory()() as session:
+        repo = _RecordingRepository(session)
+        result = await ImportService(repo, client).run_import()
+
+    assert result["status"] == "success"
+    assert repo.upsert_batches == [2, 2, 2]
+    assert await _count("SELECT COUNT(*) FROM langfuse_requests") == 6
+
+
+class _CountingCache(TtlCache[Any]):
+    def __init__(self) -> None:
+        super().__init__(name="test", ttl_seconds=60, max_entries=8)
+        self.clears = 0
+
+    def clear(self) -> None:
+        self.clears += 1
+        super().clear()
+
+
+@pytest.mark.asyncio
+async def test_import_clears_cached_reads_when_it_starts_and_finishes_only() -> None:
+    cache = _CountingCache()
+    client = FakeLangfuseClient([observation(f"obs-{i}") for i in range(3)])
+    async with get_session_factory()() as session:
+        service = ImportService(DbLangfuseRepository(session), client, cache=cache)
+        prepared = await service.start_import()
+        assert cache.clears == 1
+        await service.execute_import(prepared)
+
+    assert cache.clears == 2
+
+
+@pytest.mark.asyncio
+async def test_import_fetches_time_slices_concurrently() -> None:
+    observations = [
+        observation("ancient", start=hours_ago(24 * 200)),
+        observation("week-10", start=hours_ago(24 * 70)),
+        observation("week-5", start=hours_ago(24 * 35)),
+        observation("week-1", start=hours_ago(24 * 3)),
+    ]
+    client = FakeLangfuseClient(observations)
+    async with get_session_factory()() as session:
+        repo = DbLangfuseRepository(session)
+        await ImportService(repo, client, concurrency=3, slice_days=7).run_import()
+        record = await repo.get_latest_import()
+
+    assert await _count("SELECT COUNT(*) FROM langfuse_requests") == 4
+    assert 1 < client.max_active <= 3
+    windows = sorted(client.observation_calls, key=lambda call: call[0] or "")
+    assert windows[0][0] is None
+    # Slices tile the range without gaps and end at the run's to_timestamp.
+    assert all(prev[2] == nxt[0] for prev, nxt in zip(windows, windows[1:]))
+    assert record is not None
+    assert windows[-1][2] == record.to_timestamp
+    assert record.checkpoint_start_time == record.to_timestamp
+    assert record.pages_imported == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_import_keeps_pages_persisted_before_the_failure() -> None:
+    client = FakeLangfuseClient([observation(f"obs-{i}") for i in range(3)], fail_on_id="obs-2")
+    async with get_session_factory()() as session:
+        repo = DbLangfuseRepository(session)
+        with pytest.raises(RuntimeError):
+            await ImportService(repo, client, concurrency=1).run_import()
+
+    assert await _count("SELECT COUNT(*) FROM langfuse_requests") == 2
+    assert await _count("SELECT COUNT(*) FROM imports WHERE status = 'failed'") == 1
+
+
+@pytest.mark.asyncio
+async def test_resume_continues_failed_run_from_its_checkpoint() -> None:
+    observations = [
+        observation("obs-0", start=hours_ago(3)),
+        observation("obs-1", start=hours_ago(2)),
+        observation("obs-2", start=hours_ago(1)),
+    ]
+    async with get_session_factory()() as session:
+        repo = DbLangfuseRepository(session)
+        with pytest.raises(RuntimeError):
+            await ImportService(
+                repo, FakeLangfuseClient(observations, fail_on_id="obs-2"), concurrency=1
+            ).run_import()
+
+        failed = await repo.get_latest_import()
+        assert failed is not None
+        assert failed.checkpoint_cursor == "c2"
+        assert failed.checkpoint_start_time is not None
+        assert failed.pages_imported == 2
+
+        client = FakeLangfuseClient(observations)
+        result = await ImportService(repo, client, concurrency=1).run_import(resume=True)
+        resumed = await repo.get_latest_import()
+
+    assert client.observation_calls == [(failed.checkpoint_start_time, "c2", failed.to_timestamp)]
+    assert result["id"] == failed.id
+    assert resumed is not None
+    assert resumed.status == "success"
+    assert resumed.pages_imported == 3
+    assert resumed.requests_imported == 3
+    assert resumed.checkpoint_start_time == resumed.to_timestamp
+    assert resumed.checkpoint_cursor is None
+    assert await _count("SELECT COUNT(*) FROM imports") == 1
+    assert await _count("SELECT COUNT(*) FROM langfuse_requests") == 3
+
+
+@pytest.mark.asyncio
+async def test_resume_starts_new_run_when_latest_import_succeeded() -> None:
+    async with get_session_factory()() as session:
+        repo = DbLangfuseRepository(session)
+        first = await ImportService(repo, FakeLangfuseClient([observation("obs-0")])).run_import()
+        second = await ImportService(repo, FakeLangfuseClient([observation("obs-0")])).run_import(
+            resume=True
+        )
+
+    assert second["id"] != first["id"]
+    assert second["mode"] == "incremental"
+
+
+@pytest.mark.asyncio
+async def test_resume_does_not_count_slices_finished_after_the_checkpoint_twice() -> None:
+    observations = [
+        *(observation(f"ancient-{i}", start=hours_ago(24 * 200 - i)) for i in range(6)),
+        observation("recent", start=hours_ago(1)),
+    ]
+    async with get_session_factory()() as session:
+        repo = DbLangfuseRepository(session)
+        with pytest.raises(RuntimeError):
+            await ImportService(
+                repo, FakeLangfuseClient(observations, fail_on_id="ancient-5"), concurrency=20
+            ).run_import()
+
+        failed = await repo.get_latest_import()
+        assert failed is not None
+        assert failed.checkpoint_start_time is None
+        assert failed.checkpoint_cursor == "c5"
+        assert failed.pages_imported == 5
+        assert await _count("SELECT COUNT(*) FROM langfuse_requests WHERE id = 'recent'") == 1
+
+        await ImportService(repo, FakeLangfuseClient(observations), concurrency=20).run_import(
+            resume=True
+        )
+        resumed = await repo.get_latest_import()
+
+    assert resumed is not None
+    assert resumed.status == "success"
+    assert resumed.pages_imported == 7
+    assert resumed.requests_imported == 7
+    assert await _count("SELECT COUNT(*) FROM langfuse_requests") == 7
@@ -0,0 +1,50 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.observability.infrastructure.sources.langfuse import HttpLangfuseClient
+from app.shared.http_clients import close_http_clients, get_langfuse_http_client
+
+
+def _observations_handler(requests: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.params.get("cursor") is None:
+            return httpx.Response(200, json={"data": [{"id": "o1"}], "meta": {"cursor": "c2"}})
+        return httpx.Response(200, json={"data": [{"id": "o2"}], "meta": {}})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_pages_share_one_pooled_client_and_log_timings() -> None:
+    requests: list[httpx.Request] = []
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(_observations_handler(requests))
+    ) as http:
+        client = HttpLangfuseClient("https://langfuse.test/", "pk", "sk", http_client=http)
+
+        with patch("app.observability.infrastructure.sources.langfuse.log_event") as log:
+            pages = [page async for page in client.iter_observation_pages()]
+        assert not http.is_closed
+
+    assert [page.data[0]["id"] for page in pages] == ["o1", "o2"]
+    assert [r.url.params.get("cursor") for r in requests] == [None, "c2"]
+    timings = [call.kwargs for call in log.call_args_list]
+    assert {t["event"] for t in timings} == {"observability.langfuse.request"}
+    assert [t["label"] for t in timings] == ["observations (page 1)", "observations (page 2)"]
+    assert all(t["status_code"] == 200 and t["duration_ms"] >= 0 for t in timings)
+
+
+@pytest.mark.asyncio
+async def test_langfuse_http_client_is_shared_until_closed() -> None:
+    first = get_langfuse_http_client()
+    assert get_langfuse_http_client() is first
+
+    await close_http_clients()
+
+    assert first.is_closed
+    replacement = get_langfuse_http_client()
+    assert replacement is not first
+    await close_http_clients()
@@ -0,0 +1,137 @@
+import pytest
+from sqlalchemy import text
+
+from app.observability.domain.models import LangfuseRequest
+from app.observability.infrastructure.repositories.langfuse import DbLangfuseRepository
+from app.shared.db.session import get_session_factory
+
+
+def _request(
+    req_id: str,
+    *,
+    cost: float = 0.25,
+    model: str = "gpt-4o",
+    started_at: str = "2026-03-01T10:00:00Z",
+) -> LangfuseRequest:
+    return LangfuseRequest(
+        id=req_id,
+        trace_id=f"trace-{req_id}",
+        name="generation",
+        model=model,
+        started_at=started_at,
+        finished_at="2026-03-01T10:00:01Z",
+        input_tokens=10,
+        output_tokens=5,
+        total_tokens=15,
+        cost=cost,
+        latency_ms=1000,
+    )
+
+
+@pytest.mark.asyncio
+async def test_upsert_requests_chunks_rows_and_updates_existing() -> None:
+    async with get_session_factory()() as session:
+        repo = DbLangfuseRepository(session, upsert_chunk_size=2)
+        await repo.upsert_requests([_request(f"r{i}") for i in range(5)])
+        # Same id twice in one batch and an update to an existing row.
+        await repo.upsert_requests(
+            [_request("r0", cost=1.0), _request("r0", cost=2.0), _request("r5")]
+        )
+
+        rows = (
+            await session.execute(text("SELECT id, cost FROM langfuse_requests ORDER BY id"))
+        ).all()
+
+    assert len(rows) == 6
+    assert rows[0] == ("r0", 2.0)
+
+
+async def _hourly_costs(session) -> list[tuple]:
+    result = await session.execute(
+        text(
+            "SELECT hour, model, request_count, total_tokens, total_cost "
+            "FROM langfuse_hourly_costs ORDER BY hour, model"
+        )
+    )
+    return [tuple(row) for row in result.all()]
+
+
+@pytest.mark.asyncio
+async def test_upsert_requests_maintains_hourly_costs() -> None:
+    async with get_session_factory()() as session:
+        repo = DbLangfuseRepository(session, upsert_chunk_size=2)
+        await repo.upsert_requests(
+            [
+                _request("a", started_at="2026-03-01T10:05:00Z"),
+                _request("b", started_at="2026-03-01T10:55:00Z"),
+                _request("c", started_at="2026-03-01T11:00:00Z", model="claude"),
+            ]
+        )
+        assert await _hourly_costs(session) == [
+            ("2026-03-01T10", "gpt-4o", 2, 30, 0.5),
+            ("2026-03-01T11", "claude", 1, 15, 0.25),
+        ]
+
+        # Re-importing is idempotent; a row that changes model or hour leaves
+        # its old bucket, and an emptied bucket disappears.
+        await repo.upsert_requests(
+            [
+                _request("a", started_at="2026-03-01T10:05:00Z"),
+                _request("b", started_at="2026-03-01T10:55:00Z", model="claude"),
+                _request("c", started_at="2026-03-01T12:00:00Z", model="claude"),
+            ]
+        )
+        assert await _hourly_costs(session) == [
+            ("2026-03-01T10", "claude", 1, 15, 0.25),
+            ("2026-03-01T10", "gpt-4o", 1, 15, 0.25),
+            ("2026-03-01T12", "claude", 1, 15, 0.25),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_get_daily_costs_shapes_days_from_hourly_rollups() -> None:
+    async with get_session_factory()() as session:
+        repo = DbLangfuseRepository(session)
+        await repo.upsert_requests(
+            [
+                _request("a", started_at="2026-03-01T09:00:00Z", cost=1.0),
+                _request("b", started_at="2026-03-01T23:30:00Z", model="claude", cost=2.0),
+                _request("c", started_at="2026-03-02T00:10:00Z", cost=0.5),
+                _request("d", started_at="2026-03-03T00:00:00Z", cost=4.0),
+            ]
+        )
+
+        daily = await repo.get_daily_costs("2026-03-01T09", "2026-03-03T00")
+        empty = await repo.get_daily_costs("2026-04-01T00", "2026-04-02T00")
+
+    assert empty == []
+    assert [(d["date"], d["totalCost"], d["countObservations"]) for d in daily] == [
+        ("2026-03-01", 3.0, 2),
+        ("2026-03-02", 0.5, 1),
+    ]
+    assert [u["model"] for u in daily[0]["usage"]] == ["claude", "gpt-4o"]
+    assert daily[1]["usage"] == [
+        {
+            "model": "gpt-4o",
+            "inputUsage": 10,
+            "outputUsage": 5,
+            "totalUsage": 15,
+            "totalCost": 0.5,
+            "countObservations": 1,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_upsert_requests_keeps_models_dimension_current() -> None:
+    async with get_session_factory()() as session:
+        repo = DbLangfuseRepository(session)
+        await repo.upsert_requests(
+            [_request("a", model="gpt-4o"), _request("b", model="claude"), _request("c")]
+        )
+        assert await repo.get_distinct_models() == ["claude", "gpt-4o"]
+
+        # "claude" loses its only request; "gpt-4o" is still referenced by "c".
+        await repo.upsert_requests([_request("a", model="mistral"), _request("b")])
+
+        assert await repo.get_distinct_models() == ["gpt-4o", "mistral"]
@@ -4,15 +4,34 @@ Integration tests for the observability API endpoints.
 Coverage:
 - GET /healthz — health check (via observability test client)
 - GET /v1/observability/costs?days=N — daily cost aggregation (empty DB)
+- GET /v1/observability/costs?from=&to= — cost breakdown from hourly rollups
+- ETag / If-None-Match on cached reads, invalidated by imports
 - GET /v1/observability/requests — paginated request list (empty DB)
 - GET /v1/observability/requests/models — distinct model list (empty DB)
 - GET /v1/observability/imports/status — import status summary (empty DB)
+- POST /v1/observability/imports — background import job + single-flight lock
+- PUT /v1/observability/traces/{id}/link + GET /v1/observability/costs/{runs,agents,work-items}
 
 Fixtures:
 - client — FastAPI TestClient (from conftest)
 - _setup_test_db — Langfuse settings mock (from conftest)
 """
 
+from unittest.mock import patch
+
+import pytest
+
+from app.observability.application.import_service import ImportService
+from app.observability.infrastructure.repositories.import_lock import (
+    LANGFUSE_IMPORT_LOCK_KEY,
+    PgAdvisoryImportLock,
+)
+from app.shared.db.session import get_async_engine
+from tests.observability.fake_langfuse_client import FakeLangfuseClient, observation
+from tests.support.postgres_compat import pg_connect
+
+_CLIENT_FACTORY = "app.observability.dependencies.build_langfuse_client"
+
 
 def test_healthz(client) -> None:
     response = client.get("/healthz")
@@ -27,6 +46,78 @@ def test_get_costs_empty_db(client) -> None:
     assert isinstance(body["data"]["daily"], list)
 
 
+def test_get_costs_reads_hourly_rollups_for_timestamp_range(client, database_url) -> None:
+    with pg_connect(database_url) as conn:
+        conn.execute(
+            "INSERT INTO langfuse_hourly_costs "
+            "(hour, model, input_tokens, output_tokens, total_tokens, request_count, total_cost) "
+            "VALUES ('2026-03-01T09', 'gpt-4o', 10, 5, 15, 1, 0.5), "
+            "('2026-03-01T10', 'gpt-4o', 20, 10, 30, 2, 1.0), "
+            "('2026-03-01T12', 'gpt-4o', 10, 5, 15, 1, 8.0)"
+        )
+        conn.commit()
+
+    # Partial hours widen to the whole hour: 10:00 through 11:59 here.
+    response = client.get(
+        "/v1/observability/costs",
+        params={"from": "2026-03-01T10:15:00Z", "to": "2026-03-01T11:30:00.000Z"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["daily"] == [
+        {
+            "date": "2026-03-01",
+            "totalCost": 1.0,
+            "countObservations": 2,
+            "usage": [
+                {
+                    "model": "gpt-4o",
+                    "inputUsage": 20,
+                    "outputUsage": 10,
+                    "totalUsage": 30,
+                    "totalCost": 1.0,
+                    "countObservations": 2,
+                }
+            ],
+        }
+    ]
+
+
+def test_get_costs_rejects_unparseable_bounds(client) -> None:
+    response = client.get("/v1/observability/costs", params={"from": "yesterday", "to": "now"})
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+
+
+def test_cached_reads_carry_etag_and_answer_304_until_an_import_writes(
+    client, database_url
+) -> None:
+    first = client.get("/v1/observability/requests/models")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert first.json()["data"]["models"] == []
+
+    revalidated = client.get("/v1/observability/requests/models", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    # Writes outside the importer are not seen until the cache is invalidated...
+    with pg_connect(database_url) as conn:
+        conn.execute("INSERT INTO langfuse_models (model) VALUES ('claude')")
+        conn.commit()
+    stale = client.get("/v1/observability/requests/models", headers={"If-None-Match": etag})
+    assert stale.status_code == 304
+
+    # ...which every import does once it finishes.
+    fake = FakeLangfuseClient([observation("obs-1", model="gpt-4o")])
+    with patch(_CLIENT_FACTORY, return_value=fake):
+        client.post("/v1/observability/imports")
+    fresh = client.get("/v1/observability/requests/models", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+    assert fresh.json()["data"]["models"] == ["claude", "gpt-4o"]
+
+
 def test_get_requests_empty_db(client) -> None:
     response = client.get("/v1/observability/requests")
     assert response.status_code == 200
@@ -49,3 +140,86 @@ def test_get_import_status_empty_db(client) -> None:
     data = response.json()
     assert "lastImport" in data
     assert "counts" in data
+
+
+def test_trigger_import_returns_running_record_and_completes_in_background(client) -> None:
+    fake = FakeLangfuseClient([observation("obs-1"), observation("obs-2")])
+    with patch(_CLIENT_FACTORY, return_value=fake):
+        response = client.post("/v1/observability/imports")
+
+    assert response.status_code == 202
+    record = response.json()["data"]
+    assert record["status"] == "running"
+    assert record["mode"] == "full"
+
+    status = client.get("/v1/observability/imports/status").json()
+    assert status["lastImport"]["id"] == record["id"]
+    assert status["lastStatus"] == "success"
+    assert status["lastImport"]["requests_imported"] == 2
+    assert status["counts"]["requests"] == 2
+
+
+def test_import_job_failure_outside_the_service_is_logged_and_marks_the_run_failed(client) -> None:
+    with (
+        patch.object(ImportService, "execute_import", side_effect=RuntimeError("boom")),
+        patch("app.observability.dependencies.logger") as logger,
+    ):
+        response = client.post("/v1/observability/imports")
+
+    assert response.status_code == 202
+    record = response.json()["data"]
+    logger.exception.assert_called_once_with("Langfuse import job %d failed", record["id"])
+    status = client.get("/v1/observability/imports/status").json()
+    assert status["lastStatus"] == "failed"
+    assert status["lastImport"]["error_message"] == "boom"
+    # The lock was released, so the next import can start.
+    with patch(_CLIENT_FACTORY, return_value=FakeLangfuseClient([])):
+        assert client.post("/v1/observability/imports").status_code == 202
+
+
+def test_linked_trace_costs_are_served_per_run_agent_and_work_item(client) -> None:
+    fake = FakeLangfuseClient([observation("obs-1", trace_id="t1"), observation("obs-2")])
+    with patch(_CLIENT_FACTORY, return_value=fake):
+        client.post("/v1/observability/imports")
+
+    link = client.put("/v1/observability/traces/t1/link", json={"run_id": "run-9"})
+    assert link.status_code == 200
+    assert link.json()["data"]["run_id"] == "run-9"
+
+    run = client.get("/v1/observability/costs/runs/run-9").json()["data"]
+    assert (run["countObservations"], run["totalCost"]) == (1, 0.5)
+    # Without a dispatch record the run has no agent or work item to attribute to.
+    assert client.get("/v1/observability/costs/agents").json()["data"]["items"] == []
+    missing = client.get("/v1/observability/costs/work-items/MC-404")
+    assert missing.status_code == 404
+
+
+def test_link_trace_requires_run_or_correlation_id(client) -> None:
+    response = client.put("/v1/observability/traces/t1/link", json={})
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+
+
+def test_trigger_import_conflicts_while_another_import_holds_the_lock(
+    client, database_url: str
+) -> None:
+    with pg_connect(database_url) as conn:
+        conn.execute("SELECT pg_advisory_lock(%s)", [LANGFUSE_IMPORT_LOCK_KEY])
+        response = client.post("/v1/observability/imports")
+
+    assert response.status_code == 409
+    assert response.json()["error"]["code"] == "CONFLICT"
+    assert client.get("/v1/observability/imports/status").json()["lastImport"] is None
+
+
+@pytest.mark.asyncio
+async def test_advisory_import_lock_is_single_flight() -> None:
+    first = PgAdvisoryImportLock(get_async_engine())
+    second = PgAdvisoryImportLock(get_async_engine())
+
+    assert await first.try_acquire() is True
+    assert await second.try_acquire() is False
+
+    await first.release()
+    assert await second.try_acquire() is True
+    await second.release()
@@ -0,0 +1,39 @@
+import pytest
+
+from app.observability.infrastructure.sources.rate_limiter import TokenBucketRateLimiter
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_paces_at_rate() -> None:
+    clock = _FakeClock()
+    limiter = TokenBucketRateLimiter(rate=2.0, burst=3, clock=clock, sleep=clock.sleep)
+
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_pause_holds_back_every_caller() -> None:
+    clock = _FakeClock()
+    limiter = TokenBucketRateLimiter(rate=10.0, burst=10, clock=clock, sleep=clock.sleep)
+
+    limiter.pause(4.0)
+    await limiter.acquire()
+
+    assert clock.now >= 4.0
+    assert clock.sleeps[0] == 4.0
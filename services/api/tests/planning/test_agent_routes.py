@@ -421,6 +421,9 @@ def test_sync_agents_is_idempotent(client, tmp_path, monkeypatch):
     first = client.post(f"{PREFIX}/sync")
     assert first.status_code == 200
     assert first.json()["data"]["created"] == 2
+    before = {
+        a["openclaw_key"]: a for a in client.get(PREFIX, params={"limit": 100}).json()["data"]
+    }
 
     second = client.post(f"{PREFIX}/sync")
     assert second.status_code == 200
@@ -430,3 +433,9 @@ def test_sync_agents_is_idempotent(client, tmp_path, monkeypatch):
     assert summary["deactivated"] == 0
     assert summary["errors"] == 0
     assert summary["unchanged"] == 2
+
+    # Unchanged rows are not rewritten.
+    after = {a["openclaw_key"]: a for a in client.get(PREFIX, params={"limit": 100}).json()["data"]}
+    for key in ("james", "naomi"):
+        assert after[key]["updated_at"] == before[key]["updated_at"]
+        assert after[key]["last_synced_at"] == before[key]["last_synced_at"]
@@ -0,0 +1,152 @@
+"""
+Conditional GET (ETag / If-None-Match) on planning read endpoints.
+
+ETags come from the per-project change counters kept by DB triggers, so a
+matching If-None-Match is answered with 304 before any list query runs.
+"""
+
+from typing import cast
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import CursorResult
+
+from app.shared.db.session import get_async_engine, get_session_factory
+
+PLANNING = "/v1/planning"
+
+READ_URLS = [
+    f"{PLANNING}/work-items?project_id=p1",
+    f"{PLANNING}/work-items/overview?project_id=p1",
+    f"{PLANNING}/backlogs?project_id=p1&include=items",
+    f"{PLANNING}/backlogs/active-sprint?project_id=p1",
+    f"{PLANNING}/backlogs/b1/items",
+    f"{PLANNING}/projects/p1/board",
+]
+
+
+@pytest.fixture()
+def _board(client):
+    client.post(f"{PLANNING}/backlogs/b1/items", json={"work_item_id": "s2"})
+    client.post(f"{PLANNING}/backlogs/b2/items", json={"work_item_id": "s1"})
+
+
+def _etag(client, url: str) -> str:
+    resp = client.get(url)
+    assert resp.status_code == 200
+    return resp.headers["ETag"]
+
+
+@pytest.mark.usefixtures("_board")
+@pytest.mark.parametrize("url", READ_URLS)
+def test_matching_etag_returns_304_without_list_queries(client, url):
+    etag = _etag(client, url)
+    assert etag.startswith('W/"')
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = get_async_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        resp = client.get(url, headers={"If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["ETag"] == etag
+    assert resp.headers["Cache-Control"] == "private, no-cache"
+    assert not any("work_items" in s for s in statements)
+
+
+@pytest.mark.usefixtures("_board")
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda c: c.patch(f"{PLANNING}/work-items/s1", json={"title": "Renamed"}),
+        lambda c: c.patch(f"{PLANNING}/backlogs/b2/items/s1/rank", json={"rank": "zzz"}),
+        lambda c: c.delete(f"{PLANNING}/backlogs/b2/items/s1"),
+        lambda c: c.post(
+            f"{PLANNING}/work-items/s1/labels",
+            json={
+                "label_id": c.post(
+                    f"{PLANNING}/labels", json={"name": "x", "project_id": "p1"}
+                ).json()["data"]["id"]
+            },
+        ),
+        lambda c: c.post(f"{PLANNING}/work-items/s1/assignments", json={"agent_id": "a1"}),
+        lambda c: c.patch(f"{PLANNING}/agents/a2", json={"name": "Renamed"}),
+        lambda c: c.patch(f"{PLANNING}/backlogs/b2", json={"name": "Renamed sprint"}),
+    ],
+    ids=["item", "rank", "remove-item", "label", "assignment", "agent", "backlog"],
+)
+def test_writes_change_the_etag(client, write):
+    url = f"{PLANNING}/projects/p1/board"
+    etag = _etag(client, url)
+
+    assert write(client).status_code < 300
+
+    resp = client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+
+
+def test_other_project_writes_keep_the_etag(client):
+    url = f"{PLANNING}/work-items?project_id=p1"
+    etag = _etag(client, url)
+
+    client.patch(f"{PLANNING}/work-items/sp2", json={"title": "Only p2"})
+
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    unscoped = f"{PLANNING}/work-items"
+    unscoped_etag = _etag(client, unscoped)
+    client.patch(f"{PLANNING}/work-items/sp2", json={"title": "Again"})
+    assert client.get(unscoped, headers={"If-None-Match": unscoped_etag}).status_code == 200
+
+
+def test_etag_depends_on_query(client):
+    assert _etag(client, f"{PLANNING}/work-items?project_id=p1&limit=5") != _etag(
+        client, f"{PLANNING}/work-items?project_id=p1&limit=6"
+    )
+
+
+async def _version(session, scope: str) -> int:
+    row = await session.execute(
+        text("SELECT version FROM planning_change_counters WHERE scope = :scope"),
+        {"scope": scope},
+    )
+    return row.scalar_one_or_none() or 0
+
+
+@pytest.mark.asyncio
+async def test_multi_row_statement_bumps_the_counter_once() -> None:
+    async with get_session_factory()() as session:
+        before = await _version(session, "p1")
+        result = cast(
+            CursorResult,
+            await session.execute(
+                text("UPDATE work_items SET title = title WHERE project_id = 'p1'")
+            ),
+        )
+        after = await _version(session, "p1")
+        await session.rollback()
+
+    assert result.rowcount > 1
+    assert after == before + 1
+
+
+@pytest.mark.asyncio
+async def test_agent_sync_writes_keep_the_counter() -> None:
+    async with get_session_factory()() as session:
+        before = await _version(session, "")
+        await session.execute(text("UPDATE agents SET last_synced_at = 'now', role = 'synced'"))
+        unchanged = await _version(session, "")
+        await session.execute(text("UPDATE agents SET name = name || '!' WHERE id = 'a2'"))
+        renamed = await _version(session, "")
+        await session.rollback()
+
+    assert unchanged == before
+    assert renamed == before + 1
@@ -0,0 +1,118 @@
+"""Tests for the cached OpenClaw config source and the config watcher."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.planning.application.openclaw_sync_watcher import OpenClawSyncWatcher
+from app.planning.infrastructure.sources.openclaw import (
+    FileOpenClawAgentSource,
+    parse_agents_list,
+)
+
+
+def _write(path, keys):
+    path.write_text(json.dumps({"agents": {"list": [{"id": key} for key in keys]}}))
+
+
+@pytest.mark.asyncio
+async def test_source_reparses_only_when_content_changes(tmp_path):
+    path = tmp_path / "openclaw.json"
+    _write(path, ["james"])
+    parsed: list[bytes] = []
+
+    def _parse(data: bytes, config_path: Path) -> list[dict[str, Any]]:
+        parsed.append(data)
+        return parse_agents_list(data, config_path)
+
+    source = FileOpenClawAgentSource(str(path), parse=_parse)
+
+    first = await source.list_agents()
+    fingerprint = await source.fingerprint()
+    assert await FileOpenClawAgentSource(str(path), parse=_parse).list_agents() == first
+
+    # Same content with a new mtime re-hashes but does not re-parse.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert await source.fingerprint() == fingerprint
+    assert len(parsed) == 1
+
+    _write(path, ["james", "naomi"])
+    assert [a["id"] for a in await source.list_agents()] == ["james", "naomi"]
+    assert await source.fingerprint() != fingerprint
+    assert len(parsed) == 2
+
+
+@pytest.mark.asyncio
+async def test_source_reports_missing_and_invalid_config(tmp_path):
+    path = tmp_path / "openclaw.json"
+    source = FileOpenClawAgentSource(str(path))
+    assert await source.fingerprint() is None
+    with pytest.raises(ValueError, match="not found"):
+        await source.list_agents()
+
+    path.write_text("{not json")
+    assert await source.fingerprint() is not None
+    with pytest.raises(ValueError, match="not valid JSON"):
+        await source.list_agents()
+
+
+@pytest.mark.asyncio
+async def test_watcher_syncs_only_on_fingerprint_change():
+    fingerprints = iter([None, "a", "a", "b"])
+    syncs: list[int] = []
+
+    async def _fingerprint() -> str | None:
+        return next(fingerprints)
+
+    async def _sync() -> dict[str, int]:
+        syncs.append(1)
+        return {"created": 0, "updated": 0, "deactivated": 0, "unchanged": 0, "errors": 0}
+
+    watcher = OpenClawSyncWatcher(fingerprint=_fingerprint, sync=_sync, interval_seconds=60)
+
+    assert await watcher.run_once() is None
+    assert await watcher.run_once() is not None
+    assert await watcher.run_once() is None
+    assert await watcher.run_once() is not None
+    assert len(syncs) == 2
+
+
+@pytest.mark.asyncio
+async def test_watcher_retries_after_failed_sync():
+    attempts: list[int] = []
+
+    async def _fingerprint() -> str | None:
+        return "a"
+
+    async def _sync() -> dict[str, int]:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("db down")
+        return {"created": 1}
+
+    watcher = OpenClawSyncWatcher(fingerprint=_fingerprint, sync=_sync, interval_seconds=60)
+
+    assert await watcher.run_once() is None
+    assert await watcher.run_once() == {"created": 1}
+    assert await watcher.run_once() is None
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_watcher_start_and_stop():
+    async def _fingerprint() -> str | None:
+        return None
+
+    async def _sync() -> dict[str, int]:
+        return {}
+
+    watcher = OpenClawSyncWatcher(fingerprint=_fingerprint, sync=_sync, interval_seconds=60)
+    watcher.start()
+    assert watcher.running
+    await watcher.stop()
+
+    assert not watcher.running
@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import event, insert, update
+
+from app.planning.infrastructure.shared.loaders import (
+    BatchLoader,
+    attach_work_item_labels,
+    planning_loaders,
+)
+from app.planning.infrastructure.tables import labels, work_item_labels
+from app.shared.db.session import get_async_engine, get_session_factory
+from app.shared.utils import utc_now
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_fetches_only_unseen_keys() -> None:
+    batches: list[list[str]] = []
+
+    async def fetch(keys: list[str]) -> dict[str, str]:
+        batches.append(keys)
+        return {k: k.upper() for k in keys if k != "missing"}
+
+    loader: BatchLoader[str] = BatchLoader(fetch)
+
+    assert await loader.load_many(["a", "b", None, "a", "missing"]) == {"a": "A", "b": "B"}
+    assert await loader.load_many(["b", "c", "missing"]) == {"b": "B", "c": "C"}
+    assert await loader.load("a") == "A"
+    assert await loader.load(None) is None
+    assert batches == [["a", "b", "missing"], ["c"]]
+
+    loader.clear()
+    await loader.load("a")
+    assert batches[-1] == ["a"]
+
+
+async def _label(session, label_id: str, work_item_id: str, name: str = "bug") -> None:
+    now = utc_now()
+    await session.execute(
+        insert(labels).values(id=label_id, project_id="p1", name=name, created_at=now)
+    )
+    await session.execute(
+        insert(work_item_labels).values(work_item_id=work_item_id, label_id=label_id, added_at=now)
+    )
+
+
+@pytest.mark.asyncio
+async def test_labels_are_loaded_once_per_request() -> None:
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = get_async_engine().sync_engine
+    async with get_session_factory()() as session:
+        await _label(session, "lbl-loader", "s1")
+        items = [{"id": "s1"}, {"id": "t1"}]
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            await attach_work_item_labels(session, items)
+            await attach_work_item_labels(session, [dict(i) for i in items])
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        await session.rollback()
+
+    assert len(statements) == 1
+    assert items[0]["label_ids"] == ["lbl-loader"]
+    assert items[1]["labels"] == [] and items[1]["label_ids"] == []
+
+
+@pytest.mark.asyncio
+async def test_loaders_are_per_session_and_cleared_by_writes() -> None:
+    factory = get_session_factory()
+    async with factory() as session, factory() as other:
+        loaders = planning_loaders(session)
+        assert planning_loaders(session) is loaders
+        assert planning_loaders(other) is not loaders
+
+        await _label(session, "lbl-cleared", "s1")
+        before = await loaders.labels.load("s1")
+        await session.execute(update(labels).where(labels.c.id == "lbl-cleared").values(name="X"))
+        after = await loaders.labels.load("s1")
+        await session.rollback()
+
+    assert before is not None and after is not None
+    assert [la["name"] for la in before] == ["bug"]
+    assert [la["name"] for la in after] == ["X"]
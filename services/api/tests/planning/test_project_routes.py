@@ -2,10 +2,14 @@
 Integration tests for the Projects CRUD API.
 
 Covers: POST /v1/planning/projects, GET list, GET single,
-PATCH update, DELETE, plus business rules (duplicate key, default backlog
-creation, key uppercasing).
+PATCH update, DELETE, GET board, plus business rules (duplicate key,
+default backlog creation, key uppercasing).
 """
 
+from sqlalchemy import event
+
+from app.shared.db.session import get_async_engine
+
 PREFIX = "/v1/planning/projects"
 
 
@@ -293,3 +297,95 @@ def test_list_projects_filter_by_key_no_match(client):
     body = resp.json()
     assert body["meta"]["total"] == 0
     assert body["data"] == []
+
+
+# ── Board snapshot ────────────────────────────────────────────────────────
+
+
+def _seed_board(client) -> str:
+    label_id = client.post(
+        "/v1/planning/labels", json={"name": "board", "project_id": "p1"}
+    ).json()["data"]["id"]
+    for backlog_id, item_id in (("b1", "s2"), ("b1", "t2"), ("b2", "s1"), ("b2", "t1")):
+        client.post(f"/v1/planning/backlogs/{backlog_id}/items", json={"work_item_id": item_id})
+    for item_id in ("s1", "t2"):
+        client.post(f"/v1/planning/work-items/{item_id}/labels", json={"label_id": label_id})
+    client.post("/v1/planning/work-items/t1/assignments", json={"agent_id": "a1"})
+    return label_id
+
+
+def test_project_board_returns_backlogs_items_and_dictionaries(client):
+    label_id = _seed_board(client)
+
+    resp = client.get(f"{PREFIX}/p1/board")
+
+    assert resp.status_code == 200
+    board = resp.json()["data"]
+    assert board["project_id"] == "p1"
+    assert board["active_sprint_id"] == "b2"
+    assert [b["id"] for b in board["backlogs"]] == ["b2", "b1"]
+    sprint, backlog = board["backlogs"]
+    assert [i["id"] for i in sprint["items"]] == ["s1", "t1"]
+    assert [i["id"] for i in backlog["items"]] == ["s2", "t2"]
+    assert sprint["items"][0]["parent_key"] == "P1-1"
+    assert sprint["items"][0]["label_ids"] == [label_id]
+    assert sprint["items"][1]["assignee_agent_id"] == "a1"
+    assert "labels" not in sprint["items"][0]
+    assert board["labels"] == {label_id: {"id": label_id, "name": "board", "color": None}}
+    assert board["agents"] == {
+        "a1": {
+            "id": "a1",
+            "name": "Agent",
+            "last_name": "Alpha",
+            "initials": "AA",
+            "avatar": "https://cdn.example.com/agent-1.png",
+        }
+    }
+
+
+def test_project_board_revalidates_with_etag(client):
+    _seed_board(client)
+    first = client.get(f"{PREFIX}/p1/board")
+    etag = first.headers["ETag"]
+
+    unchanged = client.get(f"{PREFIX}/p1/board", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+
+    client.patch("/v1/planning/work-items/s2", json={"title": "Renamed"})
+    changed = client.get(f"{PREFIX}/p1/board", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_project_board_uses_fixed_number_of_queries(client):
+    _seed_board(client)
+    client.get(f"{PREFIX}/p1/board")
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = get_async_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        client.get(f"{PREFIX}/p1/board")
+        small = len(statements)
+        for n in range(5):
+            item = client.post(
+                "/v1/planning/work-items",
+                json={"type": "TASK", "title": f"More {n}", "project_id": "p1", "parent_id": "s2"},
+            ).json()
+            client.post("/v1/planning/backlogs/b1/items", json={"work_item_id": item["id"]})
+            client.post(
+                f"/v1/planning/work-items/{item['id']}/assignments", json={"agent_id": "a2"}
+            )
+        statements.clear()
+        client.get(f"{PREFIX}/p1/board")
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert len(statements) == small
+
+
+def test_project_board_not_found(client):
+    assert client.get(f"{PREFIX}/nope/board").status_code == 404
@@ -1,10 +1,17 @@
 """Tests for the /v1/planning/work-items endpoints."""
 
 import asyncio
+from unittest.mock import patch
 
 import httpx
 import pytest
 from httpx import ASGITransport
+from sqlalchemy import event
+
+from app.planning.infrastructure.repositories.work_items import DbWorkItemRepository
+from app.shared.api.errors import ConflictError
+from app.shared.db.session import get_async_engine
+from tests.support.postgres_compat import pg_connect
 
 PREFIX = "/v1/planning/work-items"
 
@@ -123,6 +130,91 @@ class TestCreateWorkItem:
         assert len(set(keys)) == n, f"Duplicate keys: {keys}"
 
 
+class TestBulkCreateWorkItems:
+    def test_creates_items_with_sequential_keys_backlog_and_labels(self, client):
+        label_id = client.post(
+            "/v1/planning/labels", json={"name": "imported", "project_id": "p1"}
+        ).json()["data"]["id"]
+        existing = client.post(
+            "/v1/planning/backlogs/b1/items", json={"work_item_id": "t2"}
+        ).json()["data"]
+
+        resp = client.post(
+            f"{PREFIX}/bulk",
+            json={
+                "items": [
+                    {"type": "TASK", "title": "First", "parent_id": "s1", "backlog_id": "b1"},
+                    {"type": "TASK", "title": "Second", "project_id": "p1", "backlog_id": "b1"},
+                    {
+                        "type": "BUG",
+                        "title": "Third",
+                        "project_id": "p1",
+                        "label_ids": [label_id, label_id],
+                        "current_assignee_agent_id": "a1",
+                    },
+                    {"type": "STORY", "title": "Other", "project_id": "p2"},
+                    {"type": "STORY", "title": "Global"},
+                ]
+            },
+            headers={"X-Actor-Id": "importer"},
+        )
+
+        assert resp.status_code == 201
+        body = resp.json()
+        assert body["total"] == 5
+        items = body["items"]
+        assert [i["key"] for i in items] == ["P1-6", "P1-7", "P1-8", "P2-1", None]
+        assert items[0]["project_id"] == "p1"
+        assert items[2]["label_ids"] == [label_id]
+        assert all(i["created_by"] == "importer" for i in items)
+
+        backlog = client.get("/v1/planning/backlogs/b1/items").json()["data"]
+        assert [i["work_item_id"] for i in backlog] == [
+            "t2",
+            items[0]["id"],
+            items[1]["id"],
+        ]
+        assert backlog[1]["rank"] > existing["rank"]
+        labels = client.get(f"{PREFIX}/{items[2]['id']}").json()["label_ids"]
+        assert labels == [label_id]
+        assert (
+            client.post(PREFIX, json={"type": "TASK", "title": "Next", "project_id": "p1"}).json()[
+                "key"
+            ]
+            == "P1-9"
+        )
+
+    def test_invalid_reference_rejects_whole_batch(self, client):
+        resp = client.post(
+            f"{PREFIX}/bulk",
+            json={
+                "items": [
+                    {"type": "TASK", "title": "Fine", "project_id": "p1"},
+                    {"type": "TASK", "title": "Bad", "project_id": "p1", "label_ids": ["nope"]},
+                ]
+            },
+        )
+
+        assert resp.status_code == 400
+        assert resp.json()["error"]["message"] == "items[1]: Label nope does not exist"
+        total = client.get(PREFIX, params={"project_id": "p1", "limit": 100}).json()["meta"]
+        assert total["total"] == 5
+        next_key = client.post(PREFIX, json={"type": "TASK", "title": "T", "project_id": "p1"})
+        assert next_key.json()["key"] == "P1-6"
+
+    def test_parent_project_conflict(self, client):
+        resp = client.post(
+            f"{PREFIX}/bulk",
+            json={"items": [{"type": "TASK", "title": "X", "parent_id": "s1", "project_id": "p2"}]},
+        )
+
+        assert resp.status_code == 409
+        assert resp.json()["error"]["message"].startswith("items[0]: Project p2 conflicts")
+
+    def test_empty_batch_rejected(self, client):
+        assert client.post(f"{PREFIX}/bulk", json={"items": []}).status_code == 422
+
+
 class TestListWorkItems:
     def test_list_all(self, client):
         resp = client.get(PREFIX, params={"limit": 50})
@@ -167,6 +259,100 @@ class TestGetWorkItem:
         resp = client.get(f"{PREFIX}/nonexistent")
         assert resp.status_code == 404
 
+    def test_detail_is_one_query(self, client):
+        label_id = client.post(
+            "/v1/planning/labels", json={"name": "detail", "project_id": "p1"}
+        ).json()["data"]["id"]
+        client.post(f"{PREFIX}/s1/labels", json={"label_id": label_id})
+        client.post(f"{PREFIX}/s1/assignments", json={"agent_id": "a1"})
+        client.post(f"{PREFIX}/s1/assignments", json={"agent_id": "a2"})
+        client.patch(f"{PREFIX}/t1", json={"status": "DONE"})
+
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        engine = get_async_engine().sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            by_id = client.get(f"{PREFIX}/s1").json()
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert len(statements) == 1
+        assert by_id["parent_key"] == "P1-1"
+        assert by_id["parent_title"] == "Epic 1"
+        assert by_id["children_count"] == 1
+        assert by_id["done_children_count"] == 1
+        assert by_id["labels"] == [{"id": label_id, "name": "detail", "color": None}]
+        assert by_id["label_ids"] == [label_id]
+        assert [a["agent_id"] for a in by_id["assignments"]] == ["a2", "a1"]
+        assert by_id["assignments"][1]["unassigned_at"] is not None
+        assert client.get(f"{PREFIX}/by-key/p1-2").json() == by_id
+
+    def test_by_key_not_found(self, client):
+        resp = client.get(f"{PREFIX}/by-key/P1-999")
+        assert resp.status_code == 404
+
+
+class TestBatchGetWorkItems:
+    def test_get_by_keys_keeps_request_order_and_marks_missing(self, client):
+        client.post(f"{PREFIX}/s1/assignments", json={"agent_id": "a1"})
+
+        resp = client.get(f"{PREFIX}/batch", params={"keys": "P1-4,p1-2,P1-999,P1-4"})
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["total"] == 4
+        assert body["found"] == 3
+        assert [(e["ref"], e["found"]) for e in body["items"]] == [
+            ("P1-4", True),
+            ("p1-2", True),
+            ("P1-999", False),
+            ("P1-4", True),
+        ]
+        assert body["items"][0]["item"]["id"] == "t1"
+        assert body["items"][0]["item"]["parent_key"] == "P1-2"
+        assert body["items"][1]["item"]["assignments"][0]["agent_id"] == "a1"
+        assert body["items"][2]["item"] is None
+
+    def test_get_by_ids_is_one_query(self, client):
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        engine = get_async_engine().sync_engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            resp = client.get(f"{PREFIX}/batch", params={"ids": "s2,nope,e1"})
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert len(statements) == 1
+        items = resp.json()["items"]
+        assert [e["item"]["key"] if e["found"] else None for e in items] == ["P1-3", None, "P1-1"]
+        assert items[2]["item"]["children_count"] == 1
+
+    def test_post_variant(self, client):
+        resp = client.post(f"{PREFIX}/batch", json={"keys": ["P1-5", "P1-1"]})
+
+        assert resp.status_code == 200
+        assert [e["item"]["id"] for e in resp.json()["items"]] == ["t2", "e1"]
+
+    def test_requires_exactly_one_of_ids_or_keys(self, client):
+        assert client.get(f"{PREFIX}/batch").status_code == 400
+        both = client.post(f"{PREFIX}/batch", json={"ids": ["s1"], "keys": ["P1-1"]})
+        assert both.status_code == 400
+        assert client.get(f"{PREFIX}/batch", params={"ids": " , "}).status_code == 400
+
+    def test_rejects_oversized_batch(self, client):
+        resp = client.post(f"{PREFIX}/batch", json={"ids": [f"id-{i}" for i in range(1001)]})
+
+        assert resp.status_code == 400
+        assert resp.json()["error"]["message"].startswith("At most 1000 ids or keys")
+
 
 class TestUpdateWorkItem:
     def test_update_title(self, client):
@@ -192,6 +378,37 @@ class TestUpdateWorkItem:
         resp = client.patch(f"{PREFIX}/t1", json={"status": "DONE"})
         assert resp.status_code == 400
 
+    def test_failed_update_rolls_back_earlier_writes(self, client):
+        assert client.post(f"{PREFIX}/t2/assignments", json={"agent_id": "a1"}).status_code == 201
+
+        # DONE closes the active assignment before the parent check fails.
+        resp = client.patch(f"{PREFIX}/t2", json={"status": "DONE", "parent_id": "missing"})
+
+        assert resp.status_code == 400
+        assert client.get(f"{PREFIX}/t2").json()["status"] == "TODO"
+        assignments = client.get(f"{PREFIX}/t2/assignments").json()
+        assert [a["unassigned_at"] for a in assignments] == [None]
+
+    def test_failure_after_assignment_hook_rolls_back_the_assignee(self, client, database_url):
+        # The hook enqueues and records a failed dispatch (a1 has no session key)
+        # before the parent's derived status is recomputed.
+        with patch.object(
+            DbWorkItemRepository,
+            "recompute_derived_status",
+            side_effect=ConflictError("recompute failed"),
+        ):
+            resp = client.patch(
+                f"{PREFIX}/s1", json={"current_assignee_agent_id": "a1", "status": "TODO"}
+            )
+
+        assert resp.status_code == 409
+        assert client.get(f"{PREFIX}/s1").json()["current_assignee_agent_id"] is None
+        assert client.get(f"{PREFIX}/s1/assignments").json() == []
+        with pg_connect(database_url) as conn:
+            for table in ("control_plane_agent_queue", "control_plane_dispatch_records"):
+                row = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+                assert row == (0,)
+
 
 class TestDeleteWorkItem:
     def test_delete(self, client):
@@ -0,0 +1,47 @@
+from fastapi import Request
+
+from app.shared.api.conditional import etag_matches, not_modified_response, request_etag
+
+
+def test_etag_matches_uses_weak_comparison_over_a_list() -> None:
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches('W/"a"', 'W/"a"')
+    assert etag_matches("*", '"a"')
+
+
+def test_etag_does_not_match_missing_or_different_header() -> None:
+    assert not etag_matches(None, '"a"')
+    assert not etag_matches('"b"', '"a"')
+
+
+def _request(query: str = "", if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/x",
+            "query_string": query.encode(),
+            "headers": headers,
+        }
+    )
+
+
+def test_request_etag_is_weak_and_varies_with_stamp_and_query() -> None:
+    etag = request_etag(_request("a=1"), "p1:3:0")
+
+    assert etag.startswith('W/"')
+    assert etag == request_etag(_request("a=1"), "p1:3:0")
+    assert etag != request_etag(_request("a=2"), "p1:3:0")
+    assert etag != request_etag(_request("a=1"), "p1:4:0")
+
+
+def test_not_modified_response_only_for_matching_header() -> None:
+    etag = request_etag(_request(), "all:1")
+
+    assert not_modified_response(_request(), etag) is None
+    assert not_modified_response(_request(if_none_match='W/"other"'), etag) is None
+    resp = not_modified_response(_request(if_none_match=etag), etag)
+    assert resp is not None
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
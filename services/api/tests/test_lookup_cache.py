@@ -0,0 +1,110 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.planning.domain.models import Agent, AgentSource
+from app.planning.infrastructure.repositories.agents import DbAgentRepository
+from app.shared.agent_lookup_adapter import DbAgentLookupAdapter
+from app.shared.db.session import get_session_factory
+from app.shared.lookup_cache import TtlCache, agent_info_cache
+from app.shared.utils import utc_now
+
+
+def test_cache_counts_hits_and_misses() -> None:
+    cache: TtlCache[str] = TtlCache(name="t", ttl_seconds=60, max_entries=10)
+
+    assert cache.get("a") is None
+    cache.set("a", "root")
+    assert cache.get("a") == "root"
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_cache_expires_entries_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache: TtlCache[str] = TtlCache(name="t", ttl_seconds=5, max_entries=10)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache.set("a", "root")
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+
+    assert cache.get("a") is None
+    assert cache.stats().size == 0
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache: TtlCache[str] = TtlCache(name="t", ttl_seconds=60, max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats().evictions == 1
+
+
+def test_cache_invalidate_removes_key() -> None:
+    cache: TtlCache[str] = TtlCache(name="t", ttl_seconds=60, max_entries=10)
+    cache.set("a", "1")
+
+    cache.invalidate("a")
+
+    assert cache.get("a") is None
+    assert cache.stats().invalidations == 1
+
+
+def _agent(agent_id: str, *, main_session_key: str | None) -> Agent:
+    now = utc_now()
+    return Agent(
+        id=agent_id,
+        openclaw_key=f"key-{agent_id}",
+        name="Cached",
+        last_name=None,
+        initials=None,
+        role=None,
+        worker_type=None,
+        avatar=None,
+        is_active=True,
+        source=AgentSource.MANUAL,
+        main_session_key=main_session_key,
+        metadata_json=None,
+        last_synced_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_agent_lookup_is_cached_and_invalidated_on_update() -> None:
+    async with get_session_factory()() as session:
+        repo = DbAgentRepository(session)
+        lookup = DbAgentLookupAdapter(session)
+        await repo.create(_agent("agent-cache-1", main_session_key="agent:old:main"))
+
+        first = await lookup.get_agent_by_id("agent-cache-1")
+        second = await lookup.get_agent_by_id("agent-cache-1")
+        assert first is not None and second is first
+        assert agent_info_cache.stats().hits == 1
+
+        await repo.update("agent-cache-1", {"main_session_key": "agent:new:main"})
+        # Invalidation waits for the commit so other workers cannot re-cache the old row.
+        assert agent_info_cache.get("agent-cache-1") is not None
+        await session.commit()
+        refreshed = await lookup.get_agent_by_id("agent-cache-1")
+
+    assert refreshed is not None
+    assert refreshed.main_session_key == "agent:new:main"
+
+
+def test_cache_stats_endpoint() -> None:
+    from app.main import app
+
+    response = TestClient(app).get("/healthz/caches")
+
+    assert response.status_code == 200
+    names = {c["name"] for c in response.json()["caches"]}
+    assert names == {"agent_info", "project_repo_root", "observability_response"}
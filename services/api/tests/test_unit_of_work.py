@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import text
+
+from app.shared.db.session import get_session_factory
+from app.shared.db.unit_of_work import after_commit, unit_of_work
+
+_INSERT = text(
+    "INSERT INTO labels (id, project_id, name, color, created_at) "
+    "VALUES (:id, NULL, :id, NULL, '2026-01-01T00:00:00Z')"
+)
+
+
+async def _label_exists(label_id: str) -> bool:
+    async with get_session_factory()() as session:
+        row = await session.execute(text("SELECT 1 FROM labels WHERE id = :id"), {"id": label_id})
+        return row.first() is not None
+
+
+@pytest.mark.asyncio
+async def test_commits_once_and_runs_after_commit_callbacks() -> None:
+    calls: list[str] = []
+
+    async with unit_of_work() as session:
+        await session.execute(_INSERT, {"id": "uow-commit"})
+        after_commit(session, lambda: calls.append("invalidated"))
+        assert not calls
+
+    assert calls == ["invalidated"]
+    assert await _label_exists("uow-commit")
+
+
+@pytest.mark.asyncio
+async def test_rolls_back_and_drops_callbacks_on_error() -> None:
+    calls: list[str] = []
+
+    with pytest.raises(RuntimeError):
+        async with unit_of_work() as session:
+            await session.execute(_INSERT, {"id": "uow-rollback"})
+            after_commit(session, lambda: calls.append("invalidated"))
+            raise RuntimeError("boom")
+
+    assert not calls
+    assert not await _label_exists("uow-rollback")